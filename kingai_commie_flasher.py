@@ -186,14 +186,19 @@ import struct
 import hashlib
 import logging
 import json
+import csv
+import html
+import operator
 import argparse
 import threading
-import traceback
+import importlib.util
+import gc
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, fields
 from enum import IntEnum, Enum, auto
-from typing import Optional, Callable, List, Tuple, Dict, Any
+from typing import Optional, Callable, Iterable, List, Tuple, Dict, Any
 from collections import deque
 from io import BytesIO
 
@@ -205,17 +210,41 @@ try:
 except ImportError:
     SERIAL_AVAILABLE = False
 
-# FTDI D2XX — optional
+# orjson — optional, faster settings / recovery-state persistence
 try:
-    import ftd2xx
-    D2XX_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    D2XX_AVAILABLE = False
-
-# GUI — PySide6 (optional, CLI works without it)
+    ORJSON_AVAILABLE = False
+
+# FTDI D2XX — optional. Importing ftd2xx loads the FTDI driver DLL, so
+# only check it is installed here; D2XXTransport.open() imports it.
+ftd2xx = None
+D2XX_AVAILABLE = importlib.util.find_spec("ftd2xx") is not None
+
+
+def _import_ftd2xx():
+    """Import ftd2xx on first use and bind the module-level name."""
+    global ftd2xx
+    if ftd2xx is None:
+        import ftd2xx as _ftd2xx
+        ftd2xx = _ftd2xx
+    return ftd2xx
+
+# GUI — PySide6 (optional, CLI works without it). A script run with a CLI
+# subcommand never touches Qt, so skip the import (hundreds of ms and tens
+# of MB RSS) — the GUI classes below are only defined when it loads.
+_CLI_ONLY = (
+    __name__ == "__main__"
+    and len(sys.argv) > 1
+    and sys.argv[1] != "gui"
+    and not sys.argv[1].startswith("-")
+)
 GUI_AVAILABLE = False
 _GUI_IMPORT_ERROR: str = ""
 try:
+    if _CLI_ONLY:
+        raise ImportError("skipped for CLI command")
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QGridLayout, QFormLayout, QLabel, QPushButton, QComboBox, QProgressBar,
@@ -243,12 +272,31 @@ __target_ecm__ = "VY V6 $060A (92118883)"
 LOG_DIR = Path(__file__).resolve().parent / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-# Rich logging handler (optional — install `rich` for colored console output)
-try:
-    from rich.logging import RichHandler
-    RICH_LOGGING_AVAILABLE = True
-except ImportError:
-    RICH_LOGGING_AVAILABLE = False
+# Rich logging handler (optional — install `rich` for colored console output).
+# Only probed here; setup_logging imports it when a Rich console is wanted.
+RICH_LOGGING_AVAILABLE = importlib.util.find_spec("rich") is not None
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter whose %(asctime)s strftime runs once per second, not per record.
+
+    Output is identical to a plain Formatter with the same datefmt (no
+    msecs), so lines still line up with the sibling tools' logs — but a
+    flash that DEBUG-logs every write frame stops paying localtime() +
+    strftime() for each one.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        self._cached_sec = -1
+        self._cached_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(datefmt or self.datefmt, self.converter(sec))
+            self._cached_sec = sec
+        return self._cached_str
 
 
 def setup_logging(
@@ -285,7 +333,7 @@ def setup_logging(
     # ── File handler: captures everything (DEBUG+) ──
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"{name}_{ts}.log"
-    file_fmt = logging.Formatter(
+    file_fmt = _CachedTimeFormatter(
         "%(asctime)s | %(levelname)-7s | %(name)s | %(funcName)s:%(lineno)d | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -296,6 +344,7 @@ def setup_logging(
 
     # ── Console handler: only important stuff (WARNING+ default) ──
     if rich_console and RICH_LOGGING_AVAILABLE:
+        from rich.logging import RichHandler
         ch = RichHandler(
             level=console_level,
             show_time=True,
@@ -348,6 +397,21 @@ class ALDLMode(IntEnum):
     MODE13_SECURITY = 0x0D
     MODE16_FLASH_WRITE = 0x10
 
+# Plain-int mirrors of the mode bytes dispatched on every frame. IntEnum
+# member lookup costs ~4x a module-global load; the enum stays the public
+# spelling everywhere off the per-frame path.
+_MODE1 = int(ALDLMode.MODE1_DATASTREAM)
+_MODE2 = int(ALDLMode.MODE2_READ_RAM)
+_MODE3 = int(ALDLMode.MODE3_READ_BYTES)
+_MODE4 = int(ALDLMode.MODE4_ACTUATOR)
+_MODE5 = int(ALDLMode.MODE5_ENTER_PROG)
+_MODE6 = int(ALDLMode.MODE6_UPLOAD)
+_MODE8 = int(ALDLMode.MODE8_SILENCE)
+_MODE9 = int(ALDLMode.MODE9_UNSILENCE)
+_MODE10 = int(ALDLMode.MODE10_WRITE_CAL)
+_MODE13 = int(ALDLMode.MODE13_SECURITY)
+_MODE16 = int(ALDLMode.MODE16_FLASH_WRITE)
+
 class FlashBank(IntEnum):
     """AMD 29F010 bank mapping for HC11 bank-switched window ($8000-$FFFF)."""
     BANK_72 = 0x48   # Sectors 0-3 (lower 64KB)
@@ -409,9 +473,10 @@ WRITE_RANGES = {
 BANK_WRITE_MAP = [
     # (bank_byte, file_start, file_end, pcm_base_offset)
     # pcm_base_offset: subtract from file offset to get PCM address
-    (FlashBank.BANK_72, 0x0000,  0xFFFF,  0),        # Sectors 0-3 (64KB, 1:1 mapping)
-    (FlashBank.BANK_88, 0x10000, 0x17FFF, 0x8000),   # Sectors 4-5 (32KB, remap to $8000)
-    (FlashBank.BANK_80, 0x18000, 0x1FFFF, 0x10000),  # Sectors 6-7 (32KB, remap to $8000)
+    # bank_byte stored as plain int — it is read on every write chunk
+    (int(FlashBank.BANK_72), 0x0000,  0xFFFF,  0),        # Sectors 0-3 (64KB, 1:1 mapping)
+    (int(FlashBank.BANK_88), 0x10000, 0x17FFF, 0x8000),   # Sectors 4-5 (32KB, remap to $8000)
+    (int(FlashBank.BANK_80), 0x18000, 0x1FFFF, 0x10000),  # Sectors 6-7 (32KB, remap to $8000)
 ]
 
 # Per-sector info for custom flash: (sector_num, bank, erase_byte, file_start, file_end, label)
@@ -433,6 +498,37 @@ CHECKSUM_OFFSET_LO = 0x4007
 CHECKSUM_SKIP_START = 0x4000
 CHECKSUM_SKIP_END = 0x4007
 
+
+
+def compute_bin_checksum(data) -> int:
+    """
+    16-bit VXY bin checksum: sum of $2000-$1FFFF, skipping $4000-$4007.
+    One contiguous sum() over the whole range minus the 8-byte skip window,
+    so the 120K-byte reduction runs in C instead of a per-byte Python loop.
+    Slicing the bytes/bytearray beats iterating a memoryview (no per-item
+    format unpack). Short images (cal-only or truncated) just contribute
+    the bytes that exist.
+    """
+    total = sum(data[0x2000:0x20000]) - sum(data[CHECKSUM_SKIP_START:CHECKSUM_SKIP_END + 1])
+    return total & 0xFFFF
+
+
+def first_mismatch(a, b, start: int, end: int) -> Optional[int]:
+    """
+    Offset of the first differing byte in a[start:end] vs b[start:end], or
+    None if the range matches. The equal case is one slice compare (memcmp,
+    faster than comparing memoryviews); only a failed compare walks bytes
+    to locate the difference.
+    """
+    sa, sb = a[start:end], b[start:end]
+    if sa == sb:
+        return None
+    for i, (x, y) in enumerate(zip(sa, sb)):
+        if x != y:
+            return start + i
+    return start + min(len(sa), len(sb))  # short image — first missing byte
+
+
 # Seed/Key magic constant
 SEED_KEY_MAGIC = 37709   # 0x934D
 
@@ -441,6 +537,11 @@ ALDL_LENGTH_OFFSET = 85  # Frame[1] encodes: actual_wire_bytes = Frame[1] - 82
                           # and: checksum_position = Frame[1] - 83
                           # and: payload_length = Frame[1] - 85
 
+# Precompiled frame header layouts — pack_into() skips the per-call format
+# string parse that struct.pack() / byte-by-byte assignment would cost.
+ALDL_HDR_ADDR16 = struct.Struct(">BBBH")    # device, length, mode, addr16
+ALDL_HDR_ADDR24 = struct.Struct(">BBBBH")   # device, length, mode, addr_hi, addr16
+
 # Default comm settings
 DEFAULT_BAUD = 8192
 DEFAULT_TIMEOUT_MS = 2000
@@ -460,6 +561,9 @@ CHECKSUM_TIMEOUT_MS = 30000
 CLEANUP_DELAY_MS = 2000          # Wait after reset before re-enabling chatter (was 750, too fast)
 POST_CHATTER_DELAY_MS = 1500     # Wait after re-enabling chatter before any further comms
 INTER_RETRY_DELAY_MS = 50        # Pause between retries — lets the bus settle and RX buffer drain
+ADAPTIVE_DELAY_MIN_MS = 1.0      # Adaptive inter-frame delay floor on a healthy link
+ADAPTIVE_DELAY_MAX_MS = 128.0    # ...and ceiling after repeated retries
+ADAPTIVE_DELAY_DECAY = 0.95      # Per-successful-exchange shrink factor
 READ_BLOCK_MAX_RETRIES = 3       # Per-block read retries before skipping
 SECTOR_SIZE = 0x4000             # 16KB flash sector boundary for write rollback
 
@@ -541,6 +645,41 @@ MODE1_MSG0_PARAMS: List[DataStreamParam] = [
 # Quick lookup by name
 PARAM_BY_NAME: Dict[str, DataStreamParam] = {p.name: p for p in MODE1_MSG0_PARAMS}
 
+# Column-wise (SoA) view of MODE1_MSG0_PARAMS, built once at import so the
+# per-frame decoder walks flat tuples instead of dataclass attributes.
+MSG0_NAMES: Tuple[str, ...] = tuple(p.name for p in MODE1_MSG0_PARAMS)
+MSG0_PKT_OFFSETS: Tuple[int, ...] = tuple(p.pkt_offset for p in MODE1_MSG0_PARAMS)
+MSG0_SIZES: Tuple[int, ...] = tuple(p.size for p in MODE1_MSG0_PARAMS)
+MSG0_SCALES: Tuple[float, ...] = tuple(p.scale for p in MODE1_MSG0_PARAMS)
+MSG0_OFFSETS: Tuple[float, ...] = tuple(p.offset_val for p in MODE1_MSG0_PARAMS)
+# Two's-complement bias per param: (raw ^ bias) - bias sign-extends a
+# signed 8/16-bit value and is a no-op (bias 0) for unsigned ones.
+MSG0_SIGN_BIAS: Tuple[int, ...] = tuple(
+    (0x80 if p.size == 1 else 0x8000) if p.signed else 0 for p in MODE1_MSG0_PARAMS
+)
+
+
+def _msg0_struct() -> Optional[struct.Struct]:
+    """Big-endian struct laying out every Mode 1 param in table order.
+
+    Gaps between params become pad bytes. Returns None if the table is not
+    in ascending, non-overlapping offset order or has non 8/16-bit fields,
+    in which case parse_mode1_response decodes param by param.
+    """
+    fmt = [">"]
+    pos = 0
+    for p in MODE1_MSG0_PARAMS:
+        if p.pkt_offset < pos or p.size not in (1, 2):
+            return None
+        fmt.append("x" * (p.pkt_offset - pos))
+        fmt.append("B" if p.size == 1 else "H")
+        pos = p.pkt_offset + p.size
+    return struct.Struct("".join(fmt))
+
+
+# One unpack_from() decodes a full Message 0 frame
+MSG0_STRUCT: Optional[struct.Struct] = _msg0_struct()
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 3 — CALIBRATION TABLE DEFINITIONS (from XDF analysis)
@@ -567,6 +706,38 @@ class CalibrationTable:
     def byte_size(self) -> int:
         return self.rows * self.cols * self.element_size
 
+    @property
+    def row_size(self) -> int:
+        return self.cols * self.element_size
+
+    @property
+    def row_struct(self) -> struct.Struct:
+        """Big-endian layout of one table row (B per 8-bit cell, H per 16-bit cell)."""
+        return _row_struct(self.cols, self.element_size)
+
+    def cells_view(self, buf) -> memoryview:
+        """
+        Zero-copy view of this table's cells inside *buf*. 8-bit tables are
+        shaped (rows, cols) so ``view[r, c]`` indexes a cell directly;
+        16-bit tables stay flat bytes (memoryview has no big-endian format).
+        """
+        view = memoryview(buf)[self.rom_offset:self.rom_offset + self.byte_size]
+        if self.element_size == 1:
+            return view.cast("B", (self.rows, self.cols))
+        return view
+
+
+_ROW_STRUCTS: Dict[Tuple[int, int], struct.Struct] = {}
+
+
+def _row_struct(cols: int, element_size: int) -> struct.Struct:
+    key = (cols, element_size)
+    st = _ROW_STRUCTS.get(key)
+    if st is None:
+        st = _ROW_STRUCTS[key] = struct.Struct(f">{cols}{'H' if element_size == 2 else 'B'}")
+    return st
+
+
 # Key calibration tables for VY V6 $060A — from Enhanced XDF analysis
 CAL_TABLES: Dict[str, CalibrationTable] = {
     "spark_hi_oct": CalibrationTable(
@@ -637,162 +808,122 @@ class FlashKernel:
 
     # Block 0: Main loop + SCI handler (171 bytes)
     # byte[21] is patched: 0x81 = high-speed read, 0x41 = normal read
-    EXEC_BLOCK_0 = bytearray([
-        0xF7, 0xFE, 0x06, 0x01, 0x32, 0x86, 0xAA, 0x36, 0x18, 0x30,
-        0x86, 0x06, 0xC6, 0x01, 0xBD, 0xFF, 0xBD, 0x32, 0x39, 0xCC,
-        0x02, 0x41, 0x97, 0x34, 0x9D, 0x24, 0x20, 0x99, 0x36, 0x18,
-        0x3C, 0x3C, 0x18, 0x38, 0xCE, 0x10, 0x00, 0x86, 0x08, 0xA7,
-        0x2D, 0x4F, 0x97, 0x30, 0x86, 0xF7, 0x8D, 0x26, 0x17, 0x8B,
-        0x55, 0x8D, 0x21, 0x96, 0x34, 0x8D, 0x1D, 0x5A, 0x27, 0x0A,
-        0x18, 0xA6, 0x00, 0x8D, 0x15, 0x18, 0x08, 0x5A, 0x26, 0xF6,
-        0x96, 0x30, 0x40, 0x8D, 0x0B, 0x1F, 0x2E, 0x40, 0xFC, 0x1D,
-        0x2D, 0x08, 0x18, 0x38, 0x32, 0x39, 0x9D, 0x1E, 0x1F, 0x2E,
-        0x80, 0xFA, 0xA7, 0x2F, 0x9B, 0x30, 0x97, 0x30, 0x39, 0x37,
-        0xC6, 0x55, 0xF7, 0x10, 0x3A, 0x53, 0xF7, 0x10, 0x3A, 0xC6,
-        0x50, 0xF7, 0x18, 0x06, 0xC6, 0xA0, 0xF7, 0x18, 0x06, 0x33,
-        0x39, 0xDC, 0x35, 0x4D, 0x26, 0x04, 0xC6, 0x48, 0x20, 0x0D,
-        0xC1, 0x80, 0x24, 0x07, 0x14, 0x36, 0x80, 0xC6, 0x58, 0x20,
-        0x02, 0xC6, 0x50, 0xF7, 0x10, 0x00, 0x39, 0x3C, 0xCE, 0x10,
-        0x00, 0x1C, 0x03, 0x08, 0x1D, 0x02, 0x08, 0x38, 0x39, 0x3C,
-        0xCE, 0x10, 0x00, 0x1C, 0x03, 0x08, 0x1C, 0x02, 0x08, 0x38,
-        0x39,
-    ])
+    EXEC_BLOCK_0 = bytes.fromhex(
+        "F7 FE 06 01 32 86 AA 36 18 30 86 06 C6 01 BD FF BD 32 39 CC "
+        "02 41 97 34 9D 24 20 99 36 18 3C 3C 18 38 CE 10 00 86 08 A7 "
+        "2D 4F 97 30 86 F7 8D 26 17 8B 55 8D 21 96 34 8D 1D 5A 27 0A "
+        "18 A6 00 8D 15 18 08 5A 26 F6 96 30 40 8D 0B 1F 2E 40 FC 1D "
+        "2D 08 18 38 32 39 9D 1E 1F 2E 80 FA A7 2F 9B 30 97 30 39 37 "
+        "C6 55 F7 10 3A 53 F7 10 3A C6 50 F7 18 06 C6 A0 F7 18 06 33 "
+        "39 DC 35 4D 26 04 C6 48 20 0D C1 80 24 07 14 36 80 C6 58 20 "
+        "02 C6 50 F7 10 00 39 3C CE 10 00 1C 03 08 1D 02 08 38 39 3C "
+        "CE 10 00 1C 03 08 1C 02 08 38 39"
+    )
 
     # Block 1: Flash read + data streaming (172 bytes)
     # byte[166] is patched: 0x80 = high-speed read, 0x40 = normal read
-    EXEC_BLOCK_1 = bytearray([
-        0xF7, 0xFF, 0x06, 0x00, 0x99, 0x86, 0xAA, 0x36, 0x18, 0x30,
-        0x86, 0x06, 0xC6, 0x01, 0xBD, 0xFF, 0xBD, 0x32, 0x39, 0x32,
-        0x8D, 0x3F, 0x97, 0x37, 0x7A, 0x00, 0x32, 0xCE, 0x03, 0x00,
-        0x20, 0x10, 0x8D, 0x33, 0x97, 0x2E, 0x7A, 0x00, 0x32, 0x8D,
-        0x2C, 0x97, 0x2F, 0x7A, 0x00, 0x32, 0xDE, 0x2E, 0x8C, 0x03,
-        0xFF, 0x22, 0xA5, 0x8D, 0x1E, 0xA7, 0x00, 0x08, 0x7A, 0x00,
-        0x32, 0x26, 0xF1, 0x8D, 0x14, 0x5D, 0x26, 0x96, 0x96, 0x33,
-        0x81, 0x10, 0x27, 0x06, 0xDE, 0x2E, 0xAD, 0x00, 0x20, 0x8A,
-        0xBD, 0x02, 0x18, 0x20, 0xF9, 0x3C, 0xCE, 0x10, 0x00, 0x18,
-        0xCE, 0x05, 0x75, 0x7F, 0x00, 0x31, 0x7A, 0x00, 0x31, 0x26,
-        0x04, 0x18, 0x09, 0x27, 0x06, 0x9D, 0x1E, 0x1F, 0x2E, 0x0E,
-        0x02, 0x20, 0xDD, 0x1F, 0x2E, 0x20, 0xEB, 0xA6, 0x2F, 0x16,
-        0xDB, 0x30, 0xD7, 0x30, 0x38, 0x39, 0x81, 0x02, 0x26, 0xCC,
-        0x8D, 0xD1, 0x97, 0x35, 0x8D, 0xCD, 0x97, 0x36, 0x8D, 0xC9,
-        0x97, 0x37, 0x8D, 0xC5, 0x5D, 0x26, 0xBB, 0xCE, 0x03, 0x20,
-        0x8D, 0x7A, 0x18, 0xDE, 0x36, 0x5F, 0x18, 0xA6, 0x00, 0xA7,
-        0x00, 0x08, 0x18, 0x08, 0x5C, 0xC1, 0x40, 0x25, 0xF3, 0xCE,
-        0x03, 0x20,
-    ])
+    EXEC_BLOCK_1 = bytes.fromhex(
+        "F7 FF 06 00 99 86 AA 36 18 30 86 06 C6 01 BD FF BD 32 39 32 "
+        "8D 3F 97 37 7A 00 32 CE 03 00 20 10 8D 33 97 2E 7A 00 32 8D "
+        "2C 97 2F 7A 00 32 DE 2E 8C 03 FF 22 A5 8D 1E A7 00 08 7A 00 "
+        "32 26 F1 8D 14 5D 26 96 96 33 81 10 27 06 DE 2E AD 00 20 8A "
+        "BD 02 18 20 F9 3C CE 10 00 18 CE 05 75 7F 00 31 7A 00 31 26 "
+        "04 18 09 27 06 9D 1E 1F 2E 0E 02 20 DD 1F 2E 20 EB A6 2F 16 "
+        "DB 30 D7 30 38 39 81 02 26 CC 8D D1 97 35 8D CD 97 36 8D C9 "
+        "97 37 8D C5 5D 26 BB CE 03 20 8D 7A 18 DE 36 5F 18 A6 00 A7 "
+        "00 08 18 08 5C C1 40 25 F3 CE 03 20"
+    )
 
     # Block 2: Interrupt vectors + init (156 bytes) — no runtime patching
-    EXEC_BLOCK_2 = bytearray([
-        0xF7, 0xEF, 0x06, 0x00, 0x10, 0x20, 0x3E, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 0x01, 0xCC, 0x7E,
-        0x01, 0x90, 0x00, 0x00, 0x00, 0x7E, 0x01, 0x49, 0x7E, 0x01,
-        0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x8E,
-        0x00, 0x4F, 0x0F, 0xB6, 0x18, 0x05, 0x8A, 0x08, 0xB7, 0x18,
-        0x05, 0x9D, 0x27, 0x3C, 0x30, 0x86, 0x06, 0x97, 0x34, 0xCC,
-        0xAA, 0x00, 0xED, 0x00, 0xC6, 0x02, 0x9D, 0x24, 0x38, 0x8E,
-        0x00, 0x4F, 0xCE, 0x10, 0x00, 0x86, 0x04, 0xA7, 0x2D, 0xEC,
-        0x2E, 0x4F, 0x97, 0x30, 0x1C, 0x2D, 0x02, 0x8D, 0x67, 0x81,
-        0xF7, 0x26, 0xE8, 0x8D, 0x61, 0x80, 0x56, 0x25, 0xE2, 0x97,
-        0x32, 0x8D, 0x59, 0x97, 0x33, 0x81, 0x06, 0x27, 0x1E, 0x81,
-        0x10, 0x26, 0x78, 0x8D, 0x4D, 0x97, 0x35, 0x7A, 0x00, 0x32,
-        0x8D, 0x46, 0x97, 0x36, 0x7A, 0x00,
-    ])
+    EXEC_BLOCK_2 = bytes.fromhex(
+        "F7 EF 06 00 10 20 3E 00 00 00 00 00 00 00 00 00 7E 01 CC 7E "
+        "01 90 00 00 00 7E 01 49 7E 01 C0 00 00 00 00 00 00 00 00 00 "
+        "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+        "00 00 00 00 00 00 00 00 00 8E 00 4F 0F B6 18 05 8A 08 B7 18 "
+        "05 9D 27 3C 30 86 06 97 34 CC AA 00 ED 00 C6 02 9D 24 38 8E "
+        "00 4F CE 10 00 86 04 A7 2D EC 2E 4F 97 30 1C 2D 02 8D 67 81 "
+        "F7 26 E8 8D 61 80 56 25 E2 97 32 8D 59 97 33 81 06 27 1E 81 "
+        "10 26 78 8D 4D 97 35 7A 00 32 8D 46 97 36 7A 00"
+    )
 
     # Flash Info reader — reads manufacturer + device ID
-    FLASH_INFO = bytearray([
-        0xF7, 0xDE, 0x06, 0x02, 0x00, 0xC6, 0x48, 0xF7, 0x10, 0x00,
-        0x9D, 0x1B, 0x86, 0xAA, 0xB7, 0x55, 0x55, 0x86, 0x55, 0xB7,
-        0x2A, 0xAA, 0x86, 0x90, 0xB7, 0x55, 0x55, 0x9D, 0x27, 0xCE,
-        0x03, 0x20, 0xB6, 0x20, 0x00, 0xA7, 0x00, 0x08, 0xB6, 0x20,
-        0x01, 0xA7, 0x00, 0x08, 0x18, 0xCE, 0x20, 0x02, 0x8D, 0x52,
-        0x18, 0xCE, 0x40, 0x02, 0x8D, 0x4C, 0x18, 0xCE, 0x80, 0x02,
-        0x8D, 0x46, 0x18, 0xCE, 0xC0, 0x02, 0x8D, 0x40, 0xC6, 0x58,
-        0xF7, 0x10, 0x00, 0x18, 0xCE, 0x80, 0x02, 0x8D, 0x35, 0x18,
-        0xCE, 0xC0, 0x02, 0x8D, 0x2F, 0xC6, 0x50, 0xF7, 0x10, 0x00,
-        0x18, 0xCE, 0x80, 0x02, 0x8D, 0x24, 0x18, 0xCE, 0xC0, 0x02,
-        0x8D, 0x1E, 0x9D, 0x1B, 0xC6, 0xAA, 0xF7, 0x55, 0x55, 0xC6,
-        0x55, 0xF7, 0x2A, 0xAA, 0xC6, 0xF0, 0xF7, 0x55, 0x55, 0x9D,
-        0x27, 0xCE, 0x03, 0x20, 0xCC, 0x06, 0x0B, 0x97, 0x34, 0x9D,
-        0x24, 0x39, 0x18, 0xA6, 0x00, 0xA7, 0x00, 0x08, 0x39,
-    ])
+    FLASH_INFO = bytes.fromhex(
+        "F7 DE 06 02 00 C6 48 F7 10 00 9D 1B 86 AA B7 55 55 86 55 B7 "
+        "2A AA 86 90 B7 55 55 9D 27 CE 03 20 B6 20 00 A7 00 08 B6 20 "
+        "01 A7 00 08 18 CE 20 02 8D 52 18 CE 40 02 8D 4C 18 CE 80 02 "
+        "8D 46 18 CE C0 02 8D 40 C6 58 F7 10 00 18 CE 80 02 8D 35 18 "
+        "CE C0 02 8D 2F C6 50 F7 10 00 18 CE 80 02 8D 24 18 CE C0 02 "
+        "8D 1E 9D 1B C6 AA F7 55 55 C6 55 F7 2A AA C6 F0 F7 55 55 9D "
+        "27 CE 03 20 CC 06 0B 97 34 9D 24 39 18 A6 00 A7 00 08 39"
+    )
 
     # Erase sector — byte[105]=bank, byte[106]=sector (patched at runtime)
-    ERASE_SECTOR = bytearray([
-        0xF7, 0xBF, 0x06, 0x02, 0x00, 0xF6, 0x02, 0x64, 0xF7, 0x10,
-        0x00, 0x9D, 0x1B, 0x86, 0xAA, 0xB7, 0x55, 0x55, 0x86, 0x55,
-        0xB7, 0x2A, 0xAA, 0x86, 0x80, 0xB7, 0x55, 0x55, 0x86, 0xAA,
-        0xB7, 0x55, 0x55, 0x86, 0x55, 0xB7, 0x2A, 0xAA, 0x86, 0x30,
-        0xFE, 0x02, 0x65, 0xA7, 0x00, 0x9D, 0x27, 0x9D, 0x1E, 0xFE,
-        0x02, 0x65, 0xA6, 0x00, 0x2B, 0x20, 0x85, 0x20, 0x27, 0xF3,
-        0x9D, 0x1B, 0xC6, 0xAA, 0xF7, 0x55, 0x55, 0xC6, 0x55, 0xF7,
-        0x2A, 0xAA, 0xC6, 0xF0, 0xF7, 0x55, 0x55, 0x9D, 0x27, 0x86,
-        0x06, 0x97, 0x34, 0xCC, 0x55, 0x00, 0x20, 0x07, 0x86, 0x06,
-        0x97, 0x34, 0xCC, 0xAA, 0x00, 0x3C, 0x30, 0xED, 0x00, 0xC6,
-        0x02, 0x9D, 0x24, 0x38, 0x39, 0x48, 0x40, 0x00,
-    ])
+    ERASE_SECTOR = bytes.fromhex(
+        "F7 BF 06 02 00 F6 02 64 F7 10 00 9D 1B 86 AA B7 55 55 86 55 "
+        "B7 2A AA 86 80 B7 55 55 86 AA B7 55 55 86 55 B7 2A AA 86 30 "
+        "FE 02 65 A7 00 9D 27 9D 1E FE 02 65 A6 00 2B 20 85 20 27 F3 "
+        "9D 1B C6 AA F7 55 55 C6 55 F7 2A AA C6 F0 F7 55 55 9D 27 86 "
+        "06 97 34 CC 55 00 20 07 86 06 97 34 CC AA 00 3C 30 ED 00 C6 "
+        "02 9D 24 38 39 48 40 00"
+    )
 
     # Write bank setup — byte[157]=bank (patched at runtime)
-    WRITE_BANK = bytearray([
-        0xF7, 0xF1, 0x06, 0x02, 0x00, 0x3C, 0x30, 0x86, 0x06, 0x97,
-        0x34, 0xCC, 0xAA, 0x00, 0xED, 0x00, 0xC6, 0x02, 0x9D, 0x24,
-        0x38, 0x39, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xCE,
-        0x03, 0x00, 0x86, 0x20, 0xB7, 0x03, 0x61, 0x18, 0xFE, 0x00,
-        0x36, 0x4F, 0xF6, 0x02, 0x98, 0xF7, 0x10, 0x00, 0x9D, 0x1B,
-        0xC6, 0xAA, 0xF7, 0x55, 0x55, 0xC6, 0x55, 0xF7, 0x2A, 0xAA,
-        0xC6, 0xA0, 0xF7, 0x55, 0x55, 0xE6, 0x00, 0x18, 0xE7, 0x00,
-        0x9D, 0x1E, 0x9D, 0x27, 0xE6, 0x00, 0x37, 0x18, 0xE8, 0x00,
-        0x33, 0x2B, 0x0E, 0x18, 0xE6, 0x00, 0xE1, 0x00, 0x27, 0x2D,
-        0x4C, 0x81, 0x0A, 0x23, 0xCB, 0x20, 0x19, 0xC5, 0x20, 0x27,
-        0xE5, 0x3C, 0x9D, 0x1B, 0xC6, 0xAA, 0xF7, 0x55, 0x55, 0xC6,
-        0x55, 0xF7, 0x2A, 0xAA, 0xC6, 0xF0, 0xF7, 0x55, 0x55, 0x9D,
-        0x27, 0x38, 0x86, 0x10, 0x97, 0x34, 0xCC, 0x55, 0x00, 0xED,
-        0x00, 0xC6, 0x02, 0x20, 0x13, 0x08, 0x18, 0x08, 0x7A, 0x03,
-        0x61, 0x26, 0x9A, 0x86, 0x10, 0x97, 0x34, 0xCC, 0xAA, 0x00,
-        0xED, 0x00, 0xC6, 0x02, 0x9D, 0x24, 0x39, 0x48,
-    ])
+    WRITE_BANK = bytes.fromhex(
+        "F7 F1 06 02 00 3C 30 86 06 97 34 CC AA 00 ED 00 C6 02 9D 24 "
+        "38 39 00 00 00 00 00 00 00 CE 03 00 86 20 B7 03 61 18 FE 00 "
+        "36 4F F6 02 98 F7 10 00 9D 1B C6 AA F7 55 55 C6 55 F7 2A AA "
+        "C6 A0 F7 55 55 E6 00 18 E7 00 9D 1E 9D 27 E6 00 37 18 E8 00 "
+        "33 2B 0E 18 E6 00 E1 00 27 2D 4C 81 0A 23 CB 20 19 C5 20 27 "
+        "E5 3C 9D 1B C6 AA F7 55 55 C6 55 F7 2A AA C6 F0 F7 55 55 9D "
+        "27 38 86 10 97 34 CC 55 00 ED 00 C6 02 20 13 08 18 08 7A 03 "
+        "61 26 9A 86 10 97 34 CC AA 00 ED 00 C6 02 9D 24 39 48"
+    )
 
     # Checksum verifier — computes checksum across all 3 banks
-    CHECKSUM_BIN = bytearray([
-        0xF7, 0xE1, 0x06, 0x02, 0x00, 0x86, 0x01, 0xB7, 0x03, 0x63,
-        0x18, 0xCE, 0x03, 0xE8, 0xCE, 0x20, 0x00, 0xCC, 0x00, 0x00,
-        0x37, 0xF6, 0x03, 0x63, 0xC1, 0x04, 0x33, 0x2C, 0x3B, 0x36,
-        0x37, 0xB6, 0x03, 0x63, 0x81, 0x01, 0x26, 0x07, 0xC6, 0x48,
-        0xF7, 0x10, 0x00, 0x20, 0x10, 0x81, 0x02, 0x26, 0x07, 0xC6,
-        0x58, 0xF7, 0x10, 0x00, 0x20, 0x05, 0xC6, 0x50, 0xF7, 0x10,
-        0x00, 0x33, 0x32, 0xEB, 0x00, 0x89, 0x00, 0x08, 0x26, 0x06,
-        0x7C, 0x03, 0x63, 0xCE, 0x80, 0x00, 0x18, 0x09, 0x26, 0x06,
-        0x9D, 0x1E, 0x18, 0xCE, 0x03, 0xE8, 0x20, 0xBC, 0x3C, 0xCE,
-        0x40, 0x00, 0xE0, 0x00, 0x82, 0x00, 0x08, 0x8C, 0x40, 0x08,
-        0x25, 0xF6, 0x37, 0x36, 0xFD, 0x03, 0x64, 0xB1, 0x40, 0x06,
-        0x26, 0x09, 0xF1, 0x40, 0x07, 0x26, 0x04, 0x86, 0xAA, 0x20,
-        0x02, 0x86, 0x55, 0x36, 0x86, 0x06, 0x97, 0x34, 0x30, 0xC6,
-        0x04, 0x9D, 0x24, 0x32, 0x32, 0x33, 0x38, 0x39,
-    ])
+    CHECKSUM_BIN = bytes.fromhex(
+        "F7 E1 06 02 00 86 01 B7 03 63 18 CE 03 E8 CE 20 00 CC 00 00 "
+        "37 F6 03 63 C1 04 33 2C 3B 36 37 B6 03 63 81 01 26 07 C6 48 "
+        "F7 10 00 20 10 81 02 26 07 C6 58 F7 10 00 20 05 C6 50 F7 10 "
+        "00 33 32 EB 00 89 00 08 26 06 7C 03 63 CE 80 00 18 09 26 06 "
+        "9D 1E 18 CE 03 E8 20 BC 3C CE 40 00 E0 00 82 00 08 8C 40 08 "
+        "25 F6 37 36 FD 03 64 B1 40 06 26 09 F1 40 07 26 04 86 AA 20 "
+        "02 86 55 36 86 06 97 34 30 C6 04 9D 24 32 32 33 38 39"
+    )
 
     # Cleanup / reset — sends 0xBB then clears RAM
-    CLEANUP = bytearray([
-        0xF7, 0x74, 0x06, 0x02, 0x00, 0x3C, 0x30, 0x86, 0x06, 0x97,
-        0x34, 0xCC, 0xBB, 0x00, 0xED, 0x00, 0xC6, 0x02, 0x9D, 0x24,
-        0x38, 0xCE, 0x01, 0xFF, 0x6F, 0x00, 0x09, 0x26, 0xFB, 0x6F,
-        0x00, 0x20, 0xFE,
-    ])
+    CLEANUP = bytes.fromhex(
+        "F7 74 06 02 00 3C 30 86 06 97 34 CC BB 00 ED 00 C6 02 9D 24 "
+        "38 CE 01 FF 6F 00 09 26 FB 6F 00 20 FE"
+    )
+
+    # high_speed → patched (block0, block1, block2), built on first use
+    _exec_blocks: Dict[bool, Tuple[bytes, bytes, bytes]] = {}
+
+    @classmethod
+    def exec_blocks(cls, high_speed: bool = False) -> Tuple[bytes, bytes, bytes]:
+        """Return the 3 patched kernel blocks as shared immutable bytes (cached)."""
+        high_speed = bool(high_speed)
+        blocks = cls._exec_blocks.get(high_speed)
+        if blocks is None:
+            b0 = bytearray(cls.EXEC_BLOCK_0)
+            b1 = bytearray(cls.EXEC_BLOCK_1)
+            if high_speed:
+                b0[21] = 0x81
+                b1[166] = 0x80
+            else:
+                b0[21] = 0x41
+                b1[166] = 0x40
+            blocks = (bytes(b0), bytes(b1), cls.EXEC_BLOCK_2)
+            cls._exec_blocks[high_speed] = blocks
+        return blocks
 
     @classmethod
     def get_exec_blocks(cls, high_speed: bool = False) -> list:
-        """Return the 3 kernel blocks with high-speed patching applied."""
-        b0 = bytearray(cls.EXEC_BLOCK_0)
-        b1 = bytearray(cls.EXEC_BLOCK_1)
-        b2 = bytearray(cls.EXEC_BLOCK_2)
-        if high_speed:
-            b0[21] = 0x81
-            b1[166] = 0x80
-        else:
-            b0[21] = 0x41
-            b1[166] = 0x40
-        return [b0, b1, b2]
+        """Return the 3 kernel blocks with high-speed patching applied.
+
+        Mutable copies; read-only callers should use exec_blocks().
+        """
+        return [bytearray(b) for b in cls.exec_blocks(high_speed)]
 
     @classmethod
     def get_erase_frame(cls, bank: int, sector: int) -> bytearray:
@@ -829,32 +960,23 @@ class ALDLProtocol:
     @staticmethod
     def compute_checksum(frame: bytearray) -> int:
         """Compute ALDL checksum: 256 - (sum of all bytes before checksum) mod 256."""
-        cs_pos = frame[1] - 83
-        total = 0
-        for i in range(cs_pos):
-            total = (total + frame[i]) & 0xFF
-        if total == 0:
-            total = 256
-        return (256 - total) & 0xFF
+        # sum() over the slice runs in C; two's-complement mask == 256 - total
+        return -sum(frame[:frame[1] - 83]) & 0xFF
 
     @staticmethod
     def apply_checksum(frame: bytearray) -> bytearray:
         """Compute and write checksum into the frame. Returns the frame."""
         cs_pos = frame[1] - 83
-        # Ensure frame is large enough
-        while len(frame) <= cs_pos:
-            frame.append(0)
+        # Builders size frames exactly; pad anything shorter (e.g. a bare header)
+        if len(frame) <= cs_pos:
+            frame.extend(bytes(cs_pos + 1 - len(frame)))
         frame[cs_pos] = ALDLProtocol.compute_checksum(frame)
         return frame
 
     @staticmethod
     def verify_checksum(frame: bytearray) -> bool:
         """Verify received frame checksum. Sum of all bytes including checksum should be 0."""
-        cs_pos = frame[1] - 83
-        total = 0
-        for i in range(cs_pos + 1):
-            total = (total + frame[i]) & 0xFF
-        return total == 0
+        return sum(frame[:frame[1] - 82]) & 0xFF == 0
 
     @staticmethod
     def wire_length(frame: bytearray) -> int:
@@ -866,118 +988,133 @@ class ALDLProtocol:
         """Build a simple ALDL frame with mode and optional data payload."""
         payload_len = 1 + len(data)  # mode byte + data
         length_byte = ALDL_LENGTH_OFFSET + payload_len
-        frame = bytearray(201)  # OSE-compatible buffer size
+        frame = bytearray(length_byte - 82)  # exact wire length
         frame[0] = device_id
         frame[1] = length_byte
         frame[2] = mode
-        for i, b in enumerate(data):
-            frame[3 + i] = b
+        frame[3:3 + len(data)] = data
         ALDLProtocol.apply_checksum(frame)
         return frame
 
+    # (device_id, mode, data) → finished frame for requests that never vary
+    _static_frames: Dict[Tuple[int, int, bytes], bytes] = {}
+
     @staticmethod
-    def build_mode1_request(device_id: int, message: int = 0) -> bytearray:
+    def _static_frame(device_id: int, mode: int, data: bytes = b"") -> bytes:
+        """Build (once) and return an immutable fixed request frame."""
+        key = (device_id, mode, data)
+        frame = ALDLProtocol._static_frames.get(key)
+        if frame is None:
+            frame = bytes(ALDLProtocol.build_simple_frame(device_id, mode, data))
+            ALDLProtocol._static_frames[key] = frame
+        return frame
+
+    @staticmethod
+    def build_mode1_request(device_id: int, message: int = 0) -> bytes:
         """Build Mode 1 data stream request."""
-        return ALDLProtocol.build_simple_frame(device_id, ALDLMode.MODE1_DATASTREAM, bytes([message]))
+        return ALDLProtocol._static_frame(device_id, _MODE1, bytes((message,)))
 
     @staticmethod
     def build_mode2_read(device_id: int, address: int, extended: bool = False) -> bytearray:
         """Build Mode 2 RAM read request (64 bytes at address)."""
-        frame = bytearray(201)
-        frame[0] = device_id
+        frame = bytearray(7 if extended else 6)
         if extended:
-            frame[1] = 0x59  # 89
-            frame[2] = ALDLMode.MODE2_READ_RAM
-            frame[3] = (address >> 16) & 0xFF
-            frame[4] = (address >> 8) & 0xFF
-            frame[5] = address & 0xFF
+            ALDL_HDR_ADDR24.pack_into(frame, 0, device_id, 0x59, ALDLMode.MODE2_READ_RAM,
+                                      (address >> 16) & 0xFF, address & 0xFFFF)
         else:
-            frame[1] = 0x58  # 88
-            frame[2] = ALDLMode.MODE2_READ_RAM
-            frame[3] = (address >> 8) & 0xFF
-            frame[4] = address & 0xFF
+            ALDL_HDR_ADDR16.pack_into(frame, 0, device_id, 0x58, ALDLMode.MODE2_READ_RAM,
+                                      address & 0xFFFF)
         ALDLProtocol.apply_checksum(frame)
         return frame
 
     @staticmethod
-    def build_seed_request(device_id: int) -> bytearray:
+    def build_seed_request(device_id: int) -> bytes:
         """Build Mode 13 seed request."""
-        return ALDLProtocol.build_simple_frame(
-            device_id, ALDLMode.MODE13_SECURITY, bytes([0x01])
-        )
+        return ALDLProtocol._static_frame(device_id, _MODE13, b"\x01")
 
     @staticmethod
     def build_key_response(device_id: int, key: int) -> bytearray:
         """Build Mode 13 key response."""
-        key_hi = (key >> 8) & 0xFF
-        key_lo = key & 0xFF
-        frame = bytearray(201)
-        frame[0] = device_id
-        frame[1] = 0x59
-        frame[2] = ALDLMode.MODE13_SECURITY
-        frame[3] = 0x02
-        frame[4] = key_hi
-        frame[5] = key_lo
+        frame = bytearray(7)
+        ALDL_HDR_ADDR24.pack_into(frame, 0, device_id, 0x59, ALDLMode.MODE13_SECURITY,
+                                  0x02, key & 0xFFFF)
         ALDLProtocol.apply_checksum(frame)
         return frame
 
     @staticmethod
-    def build_mode5_request(device_id: int) -> bytearray:
+    def build_mode5_request(device_id: int) -> bytes:
         """Build Mode 5 enter-programming request."""
-        frame = bytearray(201)
-        frame[0] = device_id
-        frame[1] = 0x56
-        frame[2] = ALDLMode.MODE5_ENTER_PROG
-        ALDLProtocol.apply_checksum(frame)
-        return frame
+        return ALDLProtocol._static_frame(device_id, _MODE5)
 
     @staticmethod
-    def build_silence_frame(device_id: int) -> bytearray:
+    def build_silence_frame(device_id: int) -> bytes:
         """Build Mode 8 disable-chatter frame."""
-        frame = bytearray(201)
-        frame[0] = device_id
-        frame[1] = 0x56
-        frame[2] = ALDLMode.MODE8_SILENCE
-        ALDLProtocol.apply_checksum(frame)
-        return frame
+        return ALDLProtocol._static_frame(device_id, _MODE8)
 
     @staticmethod
-    def build_unsilence_frame(device_id: int) -> bytearray:
+    def build_unsilence_frame(device_id: int) -> bytes:
         """Build Mode 9 enable-chatter frame."""
-        frame = bytearray(201)
-        frame[0] = device_id
-        frame[1] = 0x56
-        frame[2] = ALDLMode.MODE9_UNSILENCE
-        ALDLProtocol.apply_checksum(frame)
-        return frame
+        return ALDLProtocol._static_frame(device_id, _MODE9)
 
     @staticmethod
     def build_write_frame(device_id: int, address: int, data: bytes,
                           mode: int = ALDLMode.MODE16_FLASH_WRITE,
                           extended: bool = True) -> bytearray:
         """Build a flash write data frame (Mode 16 for flash, Mode 10/11/12 for NVRAM)."""
-        frame = bytearray(201)
-        frame[0] = device_id
+        frame = bytearray((7 if extended else 6) + len(data))
         if extended:
             # 3-byte address for flash
-            frame[1] = ALDL_LENGTH_OFFSET + len(data) + 4
-            frame[2] = mode
-            frame[3] = (address >> 16) & 0xFF
-            frame[4] = (address >> 8) & 0xFF
-            frame[5] = address & 0xFF
-            for i, b in enumerate(data):
-                frame[6 + i] = b
+            ALDL_HDR_ADDR24.pack_into(frame, 0, device_id, ALDL_LENGTH_OFFSET + len(data) + 4,
+                                      mode, (address >> 16) & 0xFF, address & 0xFFFF)
+            frame[6:6 + len(data)] = data
         else:
             # 2-byte address for EEPROM/RAM
-            frame[1] = ALDL_LENGTH_OFFSET + len(data) + 3
-            frame[2] = mode
-            frame[3] = (address >> 8) & 0xFF
-            frame[4] = address & 0xFF
-            for i, b in enumerate(data):
-                frame[5 + i] = b
+            ALDL_HDR_ADDR16.pack_into(frame, 0, device_id, ALDL_LENGTH_OFFSET + len(data) + 3,
+                                      mode, address & 0xFFFF)
+            frame[5:5 + len(data)] = data
         ALDLProtocol.apply_checksum(frame)
         return frame
 
+    # (device_id, chunk_size, mode, extended) → specialised builder
+    _write_builders: Dict[Tuple[int, int, int, bool], Callable[[int, bytes], bytearray]] = {}
+
+    @staticmethod
+    def write_frame_builder(device_id: int, chunk_size: int,
+                            mode: int = _MODE16,
+                            extended: bool = True) -> Callable[[int, bytes], bytearray]:
+        """
+        Return build_write_frame specialised for one device / chunk size /
+        mode / addressing combination (cached). The header bytes, length
+        byte and their checksum contribution are folded in once, so each
+        call only stores the address, copies the payload and sums those.
+        The builder must only be given exactly *chunk_size* bytes of data.
+        """
+        key = (device_id, chunk_size, mode, extended)
+        builder = ALDLProtocol._write_builders.get(key)
+        if builder is not None:
+            return builder
+
+        addr_len = 3 if extended else 2
+        data_start = 3 + addr_len
+        cs_pos = data_start + chunk_size
+        length_byte = cs_pos + 83
+        addr_mask = (1 << (8 * addr_len)) - 1
+        template = bytearray(cs_pos + 1)
+        template[0] = device_id
+        template[1] = length_byte
+        template[2] = mode
+        header_sum = device_id + length_byte + mode
+
+        def build(address: int, data: bytes) -> bytearray:
+            frame = bytearray(template)
+            frame[3:data_start] = (address & addr_mask).to_bytes(addr_len, "big")
+            frame[data_start:cs_pos] = data
+            frame[cs_pos] = -(header_sum + sum(frame[3:cs_pos])) & 0xFF
+            return frame
+
+        ALDLProtocol._write_builders[key] = build
+        return build
+
     @staticmethod
     def compute_seed_key(seed_hi: int, seed_lo: int) -> int:
         """
@@ -985,29 +1122,68 @@ class ALDLProtocol:
         OSE algorithm: key = 37709 - (seed_lo*256 + seed_hi)
         Note the SWAPPED byte order.
         """
-        seed = seed_lo * 256 + seed_hi
-        key = SEED_KEY_MAGIC - seed
-        if key < 0:
-            key += 65536
-        return key & 0xFFFF
+        # Masking wraps negative results, so no key < 0 fix-up is needed
+        return (SEED_KEY_MAGIC - (seed_lo << 8 | seed_hi)) & 0xFFFF
 
     @staticmethod
     def parse_mode1_response(data: bytes) -> Dict[str, float]:
         """Parse Mode 1 Message 0 response data into parameter dict."""
+        data_len = len(data)
+        if MSG0_STRUCT is not None and data_len >= MSG0_STRUCT.size:
+            return {
+                name: round(((raw ^ bias) - bias) * scale + offset_val, 3)
+                for name, raw, scale, offset_val, bias in zip(
+                    MSG0_NAMES, MSG0_STRUCT.unpack_from(data), MSG0_SCALES,
+                    MSG0_OFFSETS, MSG0_SIGN_BIAS)
+            }
+        # Short frame: decode whichever params fit
         result = {}
-        for p in MODE1_MSG0_PARAMS:
-            if p.pkt_offset + p.size <= len(data):
-                if p.size == 1:
-                    raw = data[p.pkt_offset]
-                elif p.size == 2:
-                    raw = (data[p.pkt_offset] << 8) | data[p.pkt_offset + 1]
-                else:
-                    continue
-                value = raw * p.scale + p.offset_val
-                result[p.name] = round(value, 3)
+        for name, off, size, scale, offset_val, bias in zip(
+                MSG0_NAMES, MSG0_PKT_OFFSETS, MSG0_SIZES, MSG0_SCALES, MSG0_OFFSETS,
+                MSG0_SIGN_BIAS):
+            if off + size > data_len:
+                continue
+            if size == 1:
+                raw = data[off]
+            elif size == 2:
+                raw = (data[off] << 8) | data[off + 1]
+            else:
+                continue
+            raw = (raw ^ bias) - bias
+            result[name] = round(raw * scale + offset_val, 3)
         return result
 
 
+def _kernel_frame(template: bytearray) -> bytes:
+    """Copy a kernel block into a 201-byte OSE buffer and checksum it."""
+    frame = bytearray(201)
+    frame[:len(template)] = template
+    return bytes(ALDLProtocol.apply_checksum(frame))
+
+
+# ── Pre-patched kernel frames ──
+# Every (bank, sector) the erase maps can request and every bank in
+# BANK_WRITE_MAP, patched and checksummed once at import instead of copied
+# and re-summed for each sector / bank during a flash.
+ERASE_SECTOR_FRAMES: Dict[Tuple[int, int], bytes] = {
+    (bank, sector): _kernel_frame(FlashKernel.get_erase_frame(bank, sector))
+    for bank, sector in ERASE_MAP_PROM
+}
+WRITE_BANK_FRAMES: Dict[int, bytes] = {
+    bank: _kernel_frame(FlashKernel.get_write_bank_frame(bank))
+    for bank, _, _, _ in BANK_WRITE_MAP
+}
+# Mode 6 kernel upload (normal / high-speed patch) and the fixed kernel
+# commands, framed once — a session sends these without rebuilding them.
+KERNEL_UPLOAD_FRAMES: Dict[bool, Tuple[bytes, ...]] = {
+    high_speed: tuple(_kernel_frame(b) for b in FlashKernel.exec_blocks(high_speed))
+    for high_speed in (False, True)
+}
+FLASH_INFO_FRAME = _kernel_frame(FlashKernel.FLASH_INFO)
+CHECKSUM_BIN_FRAME = _kernel_frame(FlashKernel.CHECKSUM_BIN)
+CLEANUP_FRAME = _kernel_frame(FlashKernel.CLEANUP)
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 6 — TRANSPORT LAYER (Serial / D2XX / Loopback)
 # ═══════════════════════════════════════════════════════════════════════
@@ -1044,14 +1220,145 @@ class BaseTransport:
     def bytes_available(self) -> int:
         raise NotImplementedError
 
+    def wait_rx(self, timeout_s: float) -> bool:
+        """Wait up to *timeout_s* for RX data; True if any is pending.
+
+        Polling fallback: sleep the whole window, then check. Transports
+        with a reader thread wake as soon as a byte lands instead.
+        """
+        time.sleep(timeout_s)
+        return self.bytes_available > 0
+
+
+class RxBuffer:
+    """
+    Receive-side byte buffer with a read cursor.
+
+    feed() appends what the driver handed back; take() pops from the front.
+    The consumed prefix is only compacted once it passes COMPACT_AT, so a
+    read never re-copies the whole tail the way ``buf = buf[n:]`` does.
+    """
+
+    COMPACT_AT = 4096
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._buf) - self._head
+
+    def feed(self, chunk: bytes) -> None:
+        self._buf += chunk
+
+    def take(self, count: int) -> bytes:
+        """Remove and return up to *count* bytes from the front."""
+        head = self._head
+        out = bytes(self._buf[head:head + count])
+        head += len(out)
+        if head >= len(self._buf):
+            self._buf.clear()
+            head = 0
+        elif head >= self.COMPACT_AT:
+            del self._buf[:head]
+            head = 0
+        self._head = head
+        return out
+
+    def clear(self) -> None:
+        self._buf.clear()
+        self._head = 0
+
+
+class RxReaderThread(threading.Thread):
+    """
+    Daemon that keeps draining a driver into an RxBuffer.
+
+    *read_fn* blocks in the driver (GIL released) for at most its own short
+    timeout and returns whatever arrived. The flash state machine then waits
+    on ``cond`` instead of sitting in a blocking driver read, so echo and
+    response bytes are already in userland by the time it asks for them.
+    """
+
+    def __init__(self, read_fn: Callable[[], bytes], rx: RxBuffer, name: str = "aldl-rx"):
+        super().__init__(name=name, daemon=True)
+        self._read_fn = read_fn
+        self.rx = rx
+        self.cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self.error: Optional[Exception] = None
+        # Bumped on entry to and exit from clear() — odd while a flush is
+        # in progress. A chunk is kept only if no flush started since it
+        # was read, so stale bytes can't land behind a flush.
+        self._flush_gen = 0
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                chunk = self._read_fn()
+            except Exception as e:  # port yanked / closed under us
+                self.error = e
+                log.warning("RX reader stopped: %s", e)
+                break
+            gen = self._flush_gen
+            if chunk and not gen & 1:
+                with self.cond:
+                    if gen == self._flush_gen:
+                        self.rx.feed(chunk)
+                        self.cond.notify_all()
+        with self.cond:
+            self.cond.notify_all()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def take(self, count: int, timeout_s: float) -> bytes:
+        """Wait up to *timeout_s* for *count* bytes, then return what's there."""
+        with self.cond:
+            self.cond.wait_for(lambda: len(self.rx) >= count or not self.is_alive(), timeout_s)
+            return self.rx.take(count)
+
+    def wait_data(self, timeout_s: float) -> bool:
+        """Block until the buffer is non-empty or *timeout_s* passes."""
+        with self.cond:
+            return self.cond.wait_for(lambda: len(self.rx) > 0 or not self.is_alive(),
+                                      timeout_s) and len(self.rx) > 0
+
+    def clear(self, reset_driver: Optional[Callable[[], None]] = None) -> None:
+        """
+        Drop everything buffered. *reset_driver* (the driver's input purge)
+        runs inside the flush window, so a chunk the reader pulled from the
+        driver before the purge is discarded rather than fed afterwards.
+        """
+        with self.cond:
+            self._flush_gen += 1
+        try:
+            if reset_driver:
+                reset_driver()
+        finally:
+            with self.cond:
+                self.rx.clear()
+                self._flush_gen += 1
+
 
 class PySerialTransport(BaseTransport):
-    """PySerial (COM port / VCP) transport."""
+    """PySerial (COM port / VCP) transport.
 
-    def __init__(self, port: str, baud: int = DEFAULT_BAUD):
+    With ``rx_thread=True`` a RxReaderThread drains the port in the
+    background so RX overlaps with frame preparation on the flash thread.
+    """
+
+    RX_THREAD_POLL_S = 0.05  # driver read timeout inside the reader thread
+
+    def __init__(self, port: str, baud: int = DEFAULT_BAUD, rx_thread: bool = False):
         self.port = port
         self.baud = baud
+        self.rx_thread = rx_thread
         self._serial: Optional[serial.Serial] = None
+        self._rx = RxBuffer()
+        self._reader: Optional[RxReaderThread] = None
 
     def open(self) -> None:
         if not SERIAL_AVAILABLE:
@@ -1069,8 +1376,33 @@ class PySerialTransport(BaseTransport):
             log.info("Opened %s at %d baud", self.port, self.baud)
         except serial.SerialException as e:
             raise TransportError(f"Failed to open {self.port}: {e}")
+        self._set_low_latency()
+        if self.rx_thread:
+            ser = self._serial
+            ser.timeout = self.RX_THREAD_POLL_S
+            self._reader = RxReaderThread(lambda: ser.read(ser.in_waiting or 1), self._rx)
+            self._reader.start()
+
+    def _set_low_latency(self) -> None:
+        """Best-effort: ask the tty driver for ASYNC_LOW_LATENCY (POSIX only).
+
+        ftdi_sio maps this to a 1 ms latency timer instead of the 16 ms
+        default, which otherwise delays every short ALDL reply. Windows VCP
+        latency lives in the driver's registry settings, so there is
+        nothing to do there.
+        """
+        set_mode = getattr(self._serial, "set_low_latency_mode", None)
+        if set_mode is None:
+            return
+        try:
+            set_mode(True)
+        except (OSError, ValueError) as e:
+            log.debug("Low-latency mode not available on %s: %s", self.port, e)
 
     def close(self) -> None:
+        if self._reader:
+            self._reader.stop()
+            self._reader = None
         if self._serial and self._serial.is_open:
             self._serial.close()
             log.info("Closed %s", self.port)
@@ -1083,13 +1415,30 @@ class PySerialTransport(BaseTransport):
     def read(self, count: int, timeout_ms: int = 2000) -> bytes:
         if not self._serial or not self._serial.is_open:
             raise TransportError("Port not open")
-        self._serial.timeout = timeout_ms / 1000.0
-        data = self._serial.read(count)
-        return bytes(data)
+        if self._reader:
+            data = self._reader.take(count, timeout_ms / 1000.0)
+            if len(data) < count and self._reader.error:
+                raise TransportError(f"RX reader on {self.port} stopped: {self._reader.error}")
+            return data
+        rx = self._rx
+        if len(rx) < count:
+            # Drain everything the driver already holds in one call — the
+            # surplus stays in _rx for the next read instead of costing a
+            # syscall per header/length/body read.
+            self._serial.timeout = timeout_ms / 1000.0
+            rx.feed(self._serial.read(max(count - len(rx), self._serial.in_waiting)))
+        return rx.take(count)
 
     def flush_input(self) -> None:
-        if self._serial and self._serial.is_open:
-            self._serial.reset_input_buffer()
+        # Driver purge first: clearing userland first would let the reader
+        # feed a chunk it had already pulled from the driver
+        ser = self._serial if self._serial and self._serial.is_open else None
+        if self._reader:
+            self._reader.clear(ser.reset_input_buffer if ser else None)
+            return
+        if ser:
+            ser.reset_input_buffer()
+        self._rx.clear()
 
     def flush_output(self) -> None:
         if self._serial and self._serial.is_open:
@@ -1099,11 +1448,16 @@ class PySerialTransport(BaseTransport):
     def is_open(self) -> bool:
         return self._serial is not None and self._serial.is_open
 
+    def wait_rx(self, timeout_s: float) -> bool:
+        if self._reader:
+            return self._reader.wait_data(timeout_s)
+        return super().wait_rx(timeout_s)
+
     @property
     def bytes_available(self) -> int:
         if self._serial and self._serial.is_open:
-            return self._serial.in_waiting
-        return 0
+            return len(self._rx) + self._serial.in_waiting
+        return len(self._rx)
 
     @staticmethod
     def list_ports() -> List[str]:
@@ -1114,17 +1468,28 @@ class PySerialTransport(BaseTransport):
 
 
 class D2XXTransport(BaseTransport):
-    """FTDI D2XX direct USB transport (lower latency)."""
+    """FTDI D2XX direct USB transport (lower latency).
 
-    def __init__(self, device_index: int = 0, baud: int = DEFAULT_BAUD):
+    ``rx_thread=True`` runs the same RxReaderThread read-ahead as
+    PySerialTransport, so read() is a copy out of userland memory rather
+    than a USB bulk transfer.
+    """
+
+    RX_THREAD_POLL_MS = 50  # driver read timeout inside the reader thread
+
+    def __init__(self, device_index: int = 0, baud: int = DEFAULT_BAUD, rx_thread: bool = False):
         self.device_index = device_index
         self.baud = baud
+        self.rx_thread = rx_thread
         self._device = None
+        self._rx = RxBuffer()
+        self._reader: Optional[RxReaderThread] = None
 
     def open(self) -> None:
         if not D2XX_AVAILABLE:
             raise TransportError("ftd2xx not installed — pip install ftd2xx")
         try:
+            _import_ftd2xx()
             self._device = ftd2xx.open(self.device_index)
             self._device.setBaudRate(self.baud)
             self._device.setDataCharacteristics(
@@ -1132,14 +1497,24 @@ class D2XXTransport(BaseTransport):
                 ftd2xx.defines.STOP_BITS_1,
                 ftd2xx.defines.PARITY_NONE,
             )
-            self._device.setTimeouts(200, 200)
+            # Reader thread polls with a short driver timeout; set it here so
+            # a driver failure still surfaces as TransportError
+            self._device.setTimeouts(self.RX_THREAD_POLL_MS if self.rx_thread else 200, 200)
             self._device.setLatencyTimer(2)
             self._device.purge(ftd2xx.defines.PURGE_RX | ftd2xx.defines.PURGE_TX)
             log.info("Opened FTDI D2XX device %d at %d baud", self.device_index, self.baud)
         except Exception as e:
             raise TransportError(f"Failed to open D2XX device {self.device_index}: {e}")
+        if self.rx_thread:
+            dev = self._device
+            self._reader = RxReaderThread(lambda: dev.read(dev.getQueueStatus() or 1), self._rx,
+                                          name="d2xx-rx")
+            self._reader.start()
 
     def close(self) -> None:
+        if self._reader:
+            self._reader.stop()
+            self._reader = None
         if self._device:
             try:
                 self._device.close()
@@ -1155,13 +1530,30 @@ class D2XXTransport(BaseTransport):
     def read(self, count: int, timeout_ms: int = 2000) -> bytes:
         if not self._device:
             raise TransportError("D2XX device not open")
-        self._device.setTimeouts(timeout_ms, timeout_ms)
-        data = self._device.read(count)
-        return bytes(data)
+        if self._reader:
+            data = self._reader.take(count, timeout_ms / 1000.0)
+            if len(data) < count and self._reader.error:
+                raise TransportError(f"RX reader on D2XX device {self.device_index} "
+                                     f"stopped: {self._reader.error}")
+            return data
+        rx = self._rx
+        if len(rx) < count:
+            # Same bulk drain as PySerialTransport — one USB transfer for
+            # whatever is queued rather than one per requested slice
+            self._device.setTimeouts(timeout_ms, timeout_ms)
+            rx.feed(self._device.read(max(count - len(rx), self._device.getQueueStatus())))
+        return rx.take(count)
 
     def flush_input(self) -> None:
-        if self._device:
-            self._device.purge(ftd2xx.defines.PURGE_RX)
+        # Driver purge first — same ordering as PySerialTransport.flush_input
+        dev = self._device
+        purge = (lambda: dev.purge(ftd2xx.defines.PURGE_RX)) if dev else None
+        if self._reader:
+            self._reader.clear(purge)
+            return
+        if purge:
+            purge()
+        self._rx.clear()
 
     def flush_output(self) -> None:
         if self._device:
@@ -1171,11 +1563,16 @@ class D2XXTransport(BaseTransport):
     def is_open(self) -> bool:
         return self._device is not None
 
+    def wait_rx(self, timeout_s: float) -> bool:
+        if self._reader:
+            return self._reader.wait_data(timeout_s)
+        return super().wait_rx(timeout_s)
+
     @property
     def bytes_available(self) -> int:
         if self._device:
-            return self._device.getQueueStatus()
-        return 0
+            return len(self._rx) + self._device.getQueueStatus()
+        return len(self._rx)
 
 
 class LoopbackTransport(BaseTransport):
@@ -1188,8 +1585,11 @@ class LoopbackTransport(BaseTransport):
     the disassembler all return realistic data.
     """
 
+    RX_COMPACT_AT = 65536  # drop the consumed prefix once the cursor passes this
+
     def __init__(self, bin_path: Optional[str] = None):
         self._rx_buffer = bytearray()
+        self._rx_head = 0  # read cursor into _rx_buffer
         self._tx_log: List[bytes] = []
         self._opened = False
         self._unlocked = False
@@ -1200,15 +1600,19 @@ class LoopbackTransport(BaseTransport):
 
         # Load the simulated flash image
         if bin_path and Path(bin_path).exists():
-            raw = Path(bin_path).read_bytes()
-            if len(raw) == 16384:  # 16KB cal → pad to 128KB
-                padded = bytearray(b'\xFF' * 131072)
-                padded[0x4000:0x4000 + 16384] = raw
-                self._simulated_bin = padded
-            elif len(raw) == 131072:
-                self._simulated_bin = bytearray(raw)
+            # Read straight into the final buffer — no intermediate bytes copy
+            size = Path(bin_path).stat().st_size
+            if size == 16384:  # 16KB cal → pad to 128KB
+                self._simulated_bin = bytearray(b'\xFF') * 131072
+                with open(bin_path, "rb") as f:
+                    with memoryview(self._simulated_bin) as view:
+                        f.readinto(view[0x4000:0x4000 + 16384])
+            elif size == 131072:
+                self._simulated_bin = bytearray(131072)
+                with open(bin_path, "rb") as f:
+                    f.readinto(self._simulated_bin)
             else:
-                log.warning("Virtual ECU: unexpected bin size %d, using zeros", len(raw))
+                log.warning("Virtual ECU: unexpected bin size %d, using zeros", size)
                 self._simulated_bin = bytearray(131072)
             log.info("Virtual ECU loaded %d KB from %s", len(self._simulated_bin) // 1024, bin_path)
         else:
@@ -1223,7 +1627,7 @@ class LoopbackTransport(BaseTransport):
 
     def erase_flash(self) -> None:
         """Erase the virtual flash to all 0xFF (simulates full chip erase)."""
-        self._simulated_bin = bytearray(b'\xFF' * 131072)
+        self._simulated_bin = bytearray(b'\xFF') * 131072
         log.info("vEEPROM: erased to all 0xFF")
 
     def load_flash(self, bin_data: bytearray) -> bool:
@@ -1233,7 +1637,7 @@ class LoopbackTransport(BaseTransport):
             log.info("vEEPROM: loaded 128KB image")
             return True
         elif len(bin_data) == 16384:
-            self._simulated_bin = bytearray(b'\xFF' * 131072)
+            self._simulated_bin = bytearray(b'\xFF') * 131072
             self._simulated_bin[0x4000:0x4000 + 16384] = bin_data
             log.info("vEEPROM: loaded 16KB cal, padded to 128KB (0xFF fill)")
             return True
@@ -1262,11 +1666,7 @@ class LoopbackTransport(BaseTransport):
                 sectors[i] = "used"
 
         # Compute bin checksum (same as BinFile.compute_checksum)
-        cs_sum = 0
-        for addr in range(0x2000, 0x20000):
-            if 0x4006 <= addr <= 0x4007:
-                continue
-            cs_sum = (cs_sum + self._simulated_bin[addr]) & 0xFFFF
+        cs_sum = compute_bin_checksum(self._simulated_bin)
 
         sha = hashlib.sha256(self._simulated_bin).hexdigest()
 
@@ -1299,12 +1699,21 @@ class LoopbackTransport(BaseTransport):
         return len(data)
 
     def read(self, count: int, timeout_ms: int = 2000) -> bytes:
-        result = bytes(self._rx_buffer[:count])
-        self._rx_buffer = self._rx_buffer[count:]
+        head = self._rx_head
+        result = bytes(self._rx_buffer[head:head + count])
+        head += len(result)
+        if head >= len(self._rx_buffer):
+            self._rx_buffer.clear()
+            head = 0
+        elif head >= self.RX_COMPACT_AT:
+            del self._rx_buffer[:head]
+            head = 0
+        self._rx_head = head
         return result
 
     def flush_input(self) -> None:
         self._rx_buffer.clear()
+        self._rx_head = 0
 
     def flush_output(self) -> None:
         pass
@@ -1315,7 +1724,7 @@ class LoopbackTransport(BaseTransport):
 
     @property
     def bytes_available(self) -> int:
-        return len(self._rx_buffer)
+        return len(self._rx_buffer) - self._rx_head
 
     # Pre-built sector lookup — avoids rebuilding dict on every call (#14 fix)
     _SECTOR_OFFSET_MAP = {
@@ -1329,6 +1738,20 @@ class LoopbackTransport(BaseTransport):
         (FlashBank.BANK_80, FlashSector.SECTOR_7): 0x1C000,
     }
 
+    _ERASED_SECTOR = b"\xFF" * 16384
+
+    # Mode 1 Message 0 payload served by the simulator
+    _sensor = bytearray(60)
+    _sensor[0] = 0x00  # RPM hi (800 RPM = 32 * 25)
+    _sensor[1] = 0x20  # RPM lo
+    _sensor[5] = 120   # ECT = 120*0.75-40 = 50°C
+    _sensor[29] = 140  # Battery = 14.0V
+    _sensor[42] = 30   # IAC = 30 steps
+    _MODE1_SENSOR_DATA = bytes(_sensor)
+    del _sensor
+    # device_id → complete, checksummed Mode 1 reply
+    _mode1_replies: Dict[int, bytes] = {}
+
     def _sector_to_file_offset(self, bank: int, sector_byte: int) -> Optional[int]:
         """Map (bank, sector_byte) to flat file offset for sector erase.
 
@@ -1339,6 +1762,11 @@ class LoopbackTransport(BaseTransport):
         """
         return self._SECTOR_OFFSET_MAP.get((bank, sector_byte))
 
+    def _reply(self, resp: bytearray) -> None:
+        """Append the ALDL checksum to a simulated response and queue it."""
+        resp.append(-sum(resp) & 0xFF)
+        self._rx_buffer += resp
+
     def _simulate_response(self, data: bytes) -> None:
         """Generate simulated ECU responses based on sent frames."""
         if len(data) < 3:
@@ -1346,36 +1774,28 @@ class LoopbackTransport(BaseTransport):
         device_id = data[0]
         mode = data[2]
 
-        if mode == ALDLMode.MODE8_SILENCE:
+        if mode == _MODE8:
             # Echo silence frame back
-            resp = bytearray([device_id, 0x56, ALDLMode.MODE8_SILENCE])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            resp = bytearray([device_id, 0x56, _MODE8])
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE13_SECURITY:
+        elif mode == _MODE13:
             subcommand = data[3] if len(data) > 3 else 0
             if subcommand == 0x01:
                 # Return seed
                 resp = bytearray([device_id, 0x59, 0x0D, 0x01, 0x12, 0x34])
-                cs = (256 - sum(resp) % 256) & 0xFF
-                resp.append(cs)
-                self._rx_buffer.extend(resp)
+                self._reply(resp)
             elif subcommand == 0x02:
                 # Accept key
                 self._unlocked = True
                 resp = bytearray([device_id, 0x58, 0x0D, 0x02, 0xAA])
-                cs = (256 - sum(resp) % 256) & 0xFF
-                resp.append(cs)
-                self._rx_buffer.extend(resp)
+                self._reply(resp)
 
-        elif mode == ALDLMode.MODE5_ENTER_PROG:
+        elif mode == _MODE5:
             resp = bytearray([device_id, 0x57, 0x05, 0xAA])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE6_UPLOAD:
+        elif mode == _MODE6:
             # Detect if this is an erase frame or write-bank-setup frame
             # Erase frame: length byte = 0xBF (191), bank at byte[105], sector at byte[106]
             # Write bank frame: length byte = 0xF1 (241), bank at byte[157]
@@ -1388,42 +1808,34 @@ class LoopbackTransport(BaseTransport):
                 # Sector addresses: 0x00=sector0, 0x40=sector1, 0x80=sector2/6, 0xC0=sector3/5/7
                 sector_base = self._sector_to_file_offset(bank, sector_byte)
                 if sector_base is not None:
-                    for addr in range(sector_base, sector_base + 16384):
-                        self._simulated_bin[addr] = 0xFF
+                    self._simulated_bin[sector_base:sector_base + 16384] = self._ERASED_SECTOR
                     log.debug("vEEPROM: erased sector at $%05X-$%05X (bank=0x%02X, sector=0x%02X)",
                               sector_base, sector_base + 16383, bank, sector_byte)
             elif length_byte == 0xF1 and len(data) >= 158:
                 # Write bank setup — track the active write bank for Mode 16 remapping
                 self._active_write_bank = data[157]
                 # Determine PCM base offset for address remapping
-                if self._active_write_bank == FlashBank.BANK_72:
-                    self._write_bank_pcm_base = 0
-                elif self._active_write_bank == FlashBank.BANK_88:
-                    self._write_bank_pcm_base = 0x8000
-                elif self._active_write_bank == FlashBank.BANK_80:
-                    self._write_bank_pcm_base = 0x10000
+                for bank_byte, _, _, pcm_base in BANK_WRITE_MAP:
+                    if self._active_write_bank == bank_byte:
+                        self._write_bank_pcm_base = pcm_base
+                        break
                 log.debug("vEEPROM: write bank set to 0x%02X (pcm_base=$%05X)",
                           self._active_write_bank, self._write_bank_pcm_base)
             resp = bytearray([device_id, 0x57, 0x06, 0xAA])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
-
-        elif mode == ALDLMode.MODE1_DATASTREAM:
-            # Return 60 bytes of simulated sensor data
-            sensor_data = bytearray(60)
-            sensor_data[0] = 0x00  # RPM hi (800 RPM = 32 * 25)
-            sensor_data[1] = 0x20  # RPM lo
-            sensor_data[5] = 120   # ECT = 120*0.75-40 = 50°C
-            sensor_data[29] = 140  # Battery = 14.0V
-            sensor_data[42] = 30   # IAC = 30 steps
-            resp = bytearray([device_id, 0x56 + 60, ALDLMode.MODE1_DATASTREAM])
-            resp.extend(sensor_data)
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
-
-        elif mode == ALDLMode.MODE2_READ_RAM:
+            self._reply(resp)
+
+        elif mode == _MODE1:
+            # Return 60 bytes of simulated sensor data — the reply never
+            # changes, so it's built and checksummed once per device ID
+            reply = self._mode1_replies.get(device_id)
+            if reply is None:
+                resp = bytearray((device_id, 0x56 + 60, _MODE1))
+                resp += self._MODE1_SENSOR_DATA
+                resp.append(-sum(resp) & 0xFF)
+                reply = self._mode1_replies[device_id] = bytes(resp)
+            self._rx_buffer += reply
+
+        elif mode == _MODE2:
             # Serve data from the simulated bin image
             extended = (data[1] == 0x59)  # 3-byte address vs 2-byte
             if extended and len(data) >= 6:
@@ -1437,20 +1849,16 @@ class LoopbackTransport(BaseTransport):
                 block_size = max(0, len(self._simulated_bin) - address)
             block = self._simulated_bin[address:address + block_size]
             # Response: [device_id, 0x55 + block_size + 1, mode, ...data..., checksum]
-            resp = bytearray([device_id, 0x55 + len(block) + 1, ALDLMode.MODE2_READ_RAM])
+            resp = bytearray([device_id, 0x55 + len(block) + 1, _MODE2])
             resp.extend(block)
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE9_UNSILENCE:
+        elif mode == _MODE9:
             # ACK unsilence — same frame format as silence ACK
-            resp = bytearray([device_id, 0x56, ALDLMode.MODE9_UNSILENCE])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            resp = bytearray([device_id, 0x56, _MODE9])
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE3_READ_BYTES:
+        elif mode == _MODE3:
             # Read N bytes from an address — similar to Mode 2 but variable length
             if len(data) >= 6:
                 address = (data[3] << 8) | data[4]
@@ -1461,27 +1869,21 @@ class LoopbackTransport(BaseTransport):
             if address + count > len(self._simulated_bin):
                 count = max(0, len(self._simulated_bin) - address)
             block = self._simulated_bin[address:address + count]
-            resp = bytearray([device_id, 0x55 + len(block) + 1, ALDLMode.MODE3_READ_BYTES])
+            resp = bytearray([device_id, 0x55 + len(block) + 1, _MODE3])
             resp.extend(block)
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE4_ACTUATOR:
+        elif mode == _MODE4:
             # ACK actuator test command
-            resp = bytearray([device_id, 0x57, ALDLMode.MODE4_ACTUATOR, 0xAA])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            resp = bytearray([device_id, 0x57, _MODE4, 0xAA])
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE10_WRITE_CAL:
+        elif mode == _MODE10:
             # ACK cal write (live tune RAM shadow write)
-            resp = bytearray([device_id, 0x57, ALDLMode.MODE10_WRITE_CAL, 0xAA])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            resp = bytearray([device_id, 0x57, _MODE10, 0xAA])
+            self._reply(resp)
 
-        elif mode == ALDLMode.MODE16_FLASH_WRITE:
+        elif mode == _MODE16:
             # Simulate write: parse address + data from frame, write to vEEPROM
             # Frame format: [device_id, length, 0x10, addr_hi, addr_mid, addr_lo, data..., checksum]
             if len(data) >= 7:
@@ -1492,19 +1894,23 @@ class LoopbackTransport(BaseTransport):
                     # write_flash_data does: pcm_addr = file_addr - pcm_base_offset
                     # So: file_addr = pcm_addr + pcm_base_offset
                     flat_base = pcm_addr + self._write_bank_pcm_base
-                    for i, b in enumerate(payload):
-                        flat_addr = flat_base + i
-                        if 0 <= flat_addr < len(self._simulated_bin):
-                            # NOR flash AND rule: can only clear bits (1→0)
-                            # Erased bytes are 0xFF, programming ANDs with new data
-                            self._simulated_bin[flat_addr] &= b
+                    start = max(flat_base, 0)
+                    end = min(flat_base + len(payload), len(self._simulated_bin))
+                    if start < end:
+                        # NOR flash AND rule: can only clear bits (1→0)
+                        # Erased bytes are 0xFF, programming ANDs with new data.
+                        # AND the whole run at once as big-endian ints.
+                        n = end - start
+                        view = memoryview(self._simulated_bin)
+                        old = int.from_bytes(view[start:end], "big")
+                        new = int.from_bytes(payload[start - flat_base:end - flat_base], "big")
+                        view[start:end] = (old & new).to_bytes(n, "big")
+                        view.release()
                     log.debug("vEEPROM: wrote %d bytes at PCM $%05X → file $%05X (bank 0x%02X)",
                               len(payload), pcm_addr, flat_base, self._active_write_bank)
             # ACK
-            resp = bytearray([device_id, 0x57, ALDLMode.MODE16_FLASH_WRITE, 0xAA])
-            cs = (256 - sum(resp) % 256) & 0xFF
-            resp.append(cs)
-            self._rx_buffer.extend(resp)
+            resp = bytearray([device_id, 0x57, _MODE16, 0xAA])
+            self._reply(resp)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1524,6 +1930,10 @@ class CommState(Enum):
     LIVE_TUNE = auto()
     ERROR = auto()
 
+
+# State -> name, built once (a dict hit is cheaper than Enum.name's descriptor)
+_STATE_NAMES: Dict[CommState, str] = {s: s.name for s in CommState}
+
 @dataclass
 class LogConfig:
     """Verbose event bus logging settings — toggle what gets logged.
@@ -1574,6 +1984,23 @@ class CommConfig:
     bcm_device_id: int = 0x08
     disable_bcm_chatter: bool = False   # Skip BCM silence — OFF by default (bench/virtual setups have no BCM)
     auto_checksum_fix: bool = True
+    adaptive_timing: bool = False       # Shrink inter-frame delay on clean exchanges, back off on retry
+
+
+# ── JSON helpers (orjson when installed, stdlib json otherwise) ──
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialise to 2-space indented UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # ── Settings Persistence ──
@@ -1597,7 +2024,7 @@ class SettingsManager:
         }
         try:
             tmp = path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.write_bytes(json_dumps(data))
             tmp.replace(path)
             log.debug("Settings saved → %s", path)
         except Exception as e:
@@ -1611,7 +2038,7 @@ class SettingsManager:
         log_cfg = LogConfig()
         try:
             if path.exists():
-                data = json.loads(path.read_text(encoding="utf-8"))
+                data = json_loads(path.read_bytes())
                 for k, v in data.get("comm", {}).items():
                     if hasattr(comm, k):
                         setattr(comm, k, v)
@@ -1655,7 +2082,7 @@ class RecoveryState:
         self.timestamp = datetime.now().isoformat()
         try:
             tmp = path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(self.__dict__, indent=2), encoding="utf-8")
+            tmp.write_bytes(json_dumps(self.__dict__))
             tmp.replace(path)
         except Exception as e:
             log.error("Failed to save recovery state: %s", e)
@@ -1666,7 +2093,7 @@ class RecoveryState:
         path = path or RECOVERY_STATE_FILE
         try:
             if path.exists():
-                data = json.loads(path.read_text(encoding="utf-8"))
+                data = json_loads(path.read_bytes())
                 state = cls()
                 for k, v in data.items():
                     if hasattr(state, k):
@@ -1706,6 +2133,7 @@ class ECUComm:
         self._cancel = threading.Event()
         self._lock = threading.Lock()
         self._callbacks: Dict[str, List[Callable]] = {}
+        self._frame_delay_ms: float = float(self.config.inter_frame_delay_ms)
         self._rx_frame_log: List[Tuple[float, bytes]] = []
         self._tx_frame_log: List[Tuple[float, bytes]] = []
 
@@ -1724,16 +2152,20 @@ class ECUComm:
 
     def emit(self, event: str, **kwargs) -> None:
         """Emit an event to all registered callbacks."""
+        callbacks = self._callbacks.get(event)
+        wildcard = self._callbacks.get("*")
+        if not callbacks and not wildcard:
+            return  # nobody listening — skip the timestamp and dispatch
         # Add timestamp if logging timestamps enabled
         if self.log_cfg.log_timestamps and "ts" not in kwargs:
             kwargs["ts"] = time.monotonic()
-        for cb in self._callbacks.get(event, []):
+        for cb in callbacks or ():
             try:
                 cb(**kwargs)
             except Exception as e:
                 log.error("Event callback error: %s", e)
         # Also fire wildcard subscribers
-        for cb in self._callbacks.get("*", []):
+        for cb in wildcard or ():
             try:
                 cb(event=event, **kwargs)
             except Exception:
@@ -1757,13 +2189,18 @@ class ECUComm:
     def _tx_frame(self, frame: bytearray) -> bool:
         """Transmit an ALDL frame with echo handling and silence detection."""
         wire_len = ALDLProtocol.wire_length(frame)
-        wire_bytes = bytes(frame[:wire_len])
+        if type(frame) is bytes and len(frame) == wire_len:
+            wire_bytes = frame  # cached static frame — already exact and immutable
+        else:
+            wire_bytes = bytes(memoryview(frame)[:wire_len])  # one copy, no slice temp
 
         # Log TX
         self._tx_frame_log.append((time.monotonic(), wire_bytes))
-        log.debug("TX [%d]: %s", wire_len, wire_bytes.hex(" "))
-        if self.log_cfg.log_tx_frames:
-            self.emit("frame_tx", frame_hex=wire_bytes.hex(" "), length=wire_len)
+        if log.isEnabledFor(logging.DEBUG) or self.log_cfg.log_tx_frames:
+            frame_hex = wire_bytes.hex(" ")
+            log.debug("TX [%d]: %s", wire_len, frame_hex)
+            if self.log_cfg.log_tx_frames:
+                self.emit("frame_tx", frame_hex=frame_hex, length=wire_len)
 
         # Wait for silence
         if not self._wait_silence():
@@ -1773,7 +2210,8 @@ class ECUComm:
             return False
 
         # Inter-frame delay
-        time.sleep(self.config.inter_frame_delay_ms / 1000.0)
+        delay_ms = self._frame_delay_ms if self.config.adaptive_timing else self.config.inter_frame_delay_ms
+        time.sleep(delay_ms / 1000.0)
 
         # Flush and transmit
         self.transport.flush_input()
@@ -1793,18 +2231,12 @@ class ECUComm:
         timeout_ms = timeout_ms or self.config.timeout_ms
         deadline = time.monotonic() + timeout_ms / 1000.0
 
-        # Read device ID byte
-        header = self.transport.read(1, timeout_ms=timeout_ms)
-        if not header:
-            return None
-
-        # Read length byte
-        remaining_time = max(1, int((deadline - time.monotonic()) * 1000))
-        length_byte_raw = self.transport.read(1, timeout_ms=remaining_time)
-        if not length_byte_raw:
+        # Device ID + length byte in one read
+        header = self.transport.read(2, timeout_ms=timeout_ms)
+        if len(header) < 2:
             return None
 
-        length_byte = length_byte_raw[0]
+        length_byte = header[1]
         if length_byte < 0x55:
             log.warning("Invalid length byte 0x%02X — discarding", length_byte)
             return None
@@ -1823,25 +2255,27 @@ class ECUComm:
             log.warning("Incomplete frame: expected %d more bytes, got %d", remaining, len(body))
             return None
 
-        # Reconstruct full frame
-        frame = bytearray(201)
-        frame[0] = header[0]
-        frame[1] = length_byte
-        for i, b in enumerate(body):
-            frame[2 + i] = b
-
-        # Verify checksum
-        if not ALDLProtocol.verify_checksum(frame):
-            log.warning("Checksum error on RX frame: %s", bytes(frame[:wire_len]).hex(" "))
+        # Verify checksum — header bytes plus one sum() over the body as it
+        # arrived, so the frame isn't re-summed after being reassembled
+        if (header[0] + length_byte + sum(body)) & 0xFF:
+            bad = (bytes(header) + bytes(body)).hex(" ")
+            log.warning("Checksum error on RX frame: %s", bad)
             if self.log_cfg.log_checksum_errors:
-                self.emit("log", msg=f"Checksum error on RX: {bytes(frame[:wire_len]).hex(' ')}", level="warning")
+                self.emit("log", msg=f"Checksum error on RX: {bad}", level="warning")
             return None
 
+        # Reconstruct full frame (201-byte OSE buffer, zero past the wire bytes)
+        wire_bytes = bytes(header) + bytes(body)
+        frame = bytearray(201)
+        frame[:wire_len] = wire_bytes
+
         # Log RX
-        self._rx_frame_log.append((time.monotonic(), bytes(frame[:wire_len])))
-        log.debug("RX [%d]: %s", wire_len, bytes(frame[:wire_len]).hex(" "))
-        if self.log_cfg.log_rx_frames:
-            self.emit("frame_rx", frame_hex=bytes(frame[:wire_len]).hex(" "), length=wire_len, checksum_ok=True)
+        self._rx_frame_log.append((time.monotonic(), wire_bytes))
+        if log.isEnabledFor(logging.DEBUG) or self.log_cfg.log_rx_frames:
+            frame_hex = wire_bytes.hex(" ")
+            log.debug("RX [%d]: %s", wire_len, frame_hex)
+            if self.log_cfg.log_rx_frames:
+                self.emit("frame_rx", frame_hex=frame_hex, length=wire_len, checksum_ok=True)
 
         return frame
 
@@ -1868,9 +2302,11 @@ class ECUComm:
 
                 resp = self._rx_frame(timeout_ms=timeout_ms)
                 if resp is not None:
+                    self._adapt_delay(True)
                     return resp
 
                 # ── Failed: resync bus before next attempt ──
+                self._adapt_delay(False)
                 self.transport.flush_input()
                 time.sleep(INTER_RETRY_DELAY_MS / 1000.0)
 
@@ -1884,6 +2320,19 @@ class ECUComm:
             self.emit("log", msg=f"Transaction failed after {retries} retries", level="error")
         return None
 
+    def _adapt_delay(self, ok: bool) -> None:
+        """
+        Adaptive inter-frame delay (config.adaptive_timing): decay a little
+        after each clean exchange, double — never below the configured
+        delay — after a failed one. A healthy cable converges on
+        ADAPTIVE_DELAY_MIN_MS; a marginal one settles where it stops retrying.
+        """
+        if ok:
+            self._frame_delay_ms = max(ADAPTIVE_DELAY_MIN_MS, self._frame_delay_ms * ADAPTIVE_DELAY_DECAY)
+        else:
+            self._frame_delay_ms = min(ADAPTIVE_DELAY_MAX_MS,
+                                       max(self._frame_delay_ms * 2, self.config.inter_frame_delay_ms))
+
     def _wait_silence(self, wait_ms: int = None) -> bool:
         """Wait for bus silence before transmitting."""
         wait_ms = wait_ms or SILENCE_WAIT_MS
@@ -1893,8 +2342,8 @@ class ECUComm:
             if self.cancelled:
                 return False
             self.transport.flush_input()
-            time.sleep(wait_ms / 1000.0)
-            if self.transport.bytes_available == 0:
+            # Silent = nothing arrived for the whole window
+            if not self.transport.wait_rx(wait_ms / 1000.0):
                 return True
         return False
 
@@ -1949,6 +2398,7 @@ class ECUComm:
             return False
 
         self.state = CommState.CONNECTED
+        self._frame_delay_ms = float(self.config.inter_frame_delay_ms)
         self.emit("state", state=self.state)
         self.emit("log", msg=f"Connected via {type(self.transport).__name__}", level="info")
 
@@ -2087,17 +2537,13 @@ class ECUComm:
     def upload_kernel(self) -> bool:
         """Mode 6 — upload the HC11 flash kernel to PCM RAM (3 blocks)."""
         self.emit("log", msg="Uploading flash kernel...", level="info")
-        blocks = FlashKernel.get_exec_blocks(self.config.high_speed_read)
+        blocks = FlashKernel.exec_blocks(self.config.high_speed_read)
+        frames = KERNEL_UPLOAD_FRAMES[bool(self.config.high_speed_read)]
 
-        for i, block in enumerate(blocks):
+        for i, (block, frame) in enumerate(zip(blocks, frames)):
             self.emit("log", msg=f"  Kernel block {i}/2 ({len(block)} bytes)...", level="info")
             self.emit("progress", current=i, total=3, label="Uploading kernel")
 
-            frame = bytearray(201)
-            for j in range(len(block)):
-                frame[j] = block[j]
-            ALDLProtocol.apply_checksum(frame)
-
             if self.config.ignore_echo:
                 self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
 
@@ -2117,10 +2563,7 @@ class ECUComm:
     def read_flash_info(self) -> Optional[Tuple[int, int]]:
         """Read flash chip manufacturer and device ID."""
         self.emit("log", msg="Reading flash chip info...", level="info")
-        frame = bytearray(201)
-        for i, b in enumerate(FlashKernel.FLASH_INFO):
-            frame[i] = b
-        ALDLProtocol.apply_checksum(frame)
+        frame = FLASH_INFO_FRAME
 
         if self.config.ignore_echo:
             self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
@@ -2156,11 +2599,9 @@ class ECUComm:
                        level="info")
             self.emit("progress", current=i, total=total, label="Erasing")
 
-            frame = bytearray(201)
-            erase_frame = FlashKernel.get_erase_frame(bank, sector)
-            for j in range(len(erase_frame)):
-                frame[j] = erase_frame[j]
-            ALDLProtocol.apply_checksum(frame)
+            frame = ERASE_SECTOR_FRAMES.get((bank, sector))
+            if frame is None:
+                frame = _kernel_frame(FlashKernel.get_erase_frame(bank, sector))
 
             if self.config.ignore_echo:
                 self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
@@ -2194,10 +2635,15 @@ class ECUComm:
         self.emit("state", state=self.state)
 
         chunk_size = self.config.write_chunk_size
+        build_full_chunk = ALDLProtocol.write_frame_builder(
+            self.config.device_id, chunk_size, mode=_MODE16, extended=True)
         total_bytes = end_offset - start_offset + 1
         bytes_written = 0
         retries = 0
         start_time = time.monotonic()
+        # Chunks are sliced from a view of the image — no per-chunk copy;
+        # the frame builders memcpy straight out of it
+        bin_view = memoryview(bin_data)
 
         for bank_byte, bank_start, bank_end, pcm_base_offset in BANK_WRITE_MAP:
             # Determine intersection with requested write range
@@ -2209,11 +2655,9 @@ class ECUComm:
             # Upload write-bank setup
             self.emit("log", msg=f"Setting up write for bank 0x{bank_byte:02X} "
                       f"(file ${w_start:05X}-${w_end:05X})...", level="info")
-            frame = bytearray(201)
-            wb_frame = FlashKernel.get_write_bank_frame(bank_byte)
-            for j in range(len(wb_frame)):
-                frame[j] = wb_frame[j]
-            ALDLProtocol.apply_checksum(frame)
+            frame = WRITE_BANK_FRAMES.get(bank_byte)
+            if frame is None:
+                frame = _kernel_frame(FlashKernel.get_write_bank_frame(bank_byte))
 
             if self.config.ignore_echo:
                 self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
@@ -2230,7 +2674,7 @@ class ECUComm:
                     return False
 
                 end = min(file_addr + chunk_size - 1, w_end)
-                data_chunk = bin_data[file_addr:end + 1]
+                data_chunk = bin_view[file_addr:end + 1]
                 actual_chunk_size = len(data_chunk)
 
                 # Remap file offset to PCM windowed address
@@ -2240,10 +2684,13 @@ class ECUComm:
                 pcm_addr = file_addr - pcm_base_offset
 
                 # Build write frame with the remapped PCM address
-                write_frame = ALDLProtocol.build_write_frame(
-                    self.config.device_id, pcm_addr, data_chunk,
-                    mode=ALDLMode.MODE16_FLASH_WRITE, extended=True
-                )
+                if actual_chunk_size == chunk_size:
+                    write_frame = build_full_chunk(pcm_addr, data_chunk)
+                else:  # short tail of a bank
+                    write_frame = ALDLProtocol.build_write_frame(
+                        self.config.device_id, pcm_addr, data_chunk,
+                        mode=_MODE16, extended=True
+                    )
 
                 if self.config.ignore_echo:
                     self.config.echo_byte_count = ALDLProtocol.wire_length(write_frame)
@@ -2294,10 +2741,7 @@ class ECUComm:
         """Run on-PCM checksum verification."""
         self.emit("log", msg="Running on-PCM checksum verification...", level="info")
 
-        frame = bytearray(201)
-        for i, b in enumerate(FlashKernel.CHECKSUM_BIN):
-            frame[i] = b
-        ALDLProtocol.apply_checksum(frame)
+        frame = CHECKSUM_BIN_FRAME
 
         if self.config.ignore_echo:
             self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
@@ -2326,10 +2770,7 @@ class ECUComm:
         """Upload cleanup routine to reset the PCM."""
         self.emit("log", msg="Resetting PCM...", level="info")
 
-        frame = bytearray(201)
-        for i, b in enumerate(FlashKernel.CLEANUP):
-            frame[i] = b
-        ALDLProtocol.apply_checksum(frame)
+        frame = CLEANUP_FRAME
 
         if self.config.ignore_echo:
             self.config.echo_byte_count = ALDLProtocol.wire_length(frame)
@@ -2389,25 +2830,65 @@ class BinFile:
     CAL_SIZE = 16384  # 16KB calibration area
     CAL_OFFSET = 0x4000  # Cal starts at $4000 in the 128KB image
 
+    # (resolved path, size, mtime_ns) → sha256 hex, so re-flashing the same
+    # unchanged file doesn't re-hash it
+    _digest_cache: Dict[Tuple[str, int, int], str] = {}
+
     @staticmethod
     def load(path: str, allow_cal_padding: bool = True) -> bytearray:
         """Load a .bin file, validate size. Pads 16KB cal files to 128KB (like OSE)."""
         p = Path(path)
         if not p.exists():
             raise FileNotFoundError(f"Bin file not found: {path}")
-        data = bytearray(p.read_bytes())
-        if len(data) == BinFile.CAL_SIZE and allow_cal_padding:
+        # Size from stat, then readinto the final buffer — no intermediate
+        # bytes object, and a wrong-size file is rejected without reading it
+        size = p.stat().st_size
+        if size == BinFile.CAL_SIZE and allow_cal_padding:
             # Pad 16KB cal to full 128KB image: cal lives at $4000-$7FFF,
             # rest is filled with 0xFF (erased flash state). Same as OSE.
-            padded = bytearray(b'\xFF' * BinFile.BIN_SIZE)
-            padded[BinFile.CAL_OFFSET:BinFile.CAL_OFFSET + BinFile.CAL_SIZE] = data
+            data = bytearray(b'\xFF') * BinFile.BIN_SIZE
+            with open(p, "rb") as f, memoryview(data) as view:
+                f.readinto(view[BinFile.CAL_OFFSET:BinFile.CAL_OFFSET + BinFile.CAL_SIZE])
             log.info(f"Padded 16KB cal file to 128KB (cal at ${BinFile.CAL_OFFSET:04X})")
-            return padded
-        if len(data) != BinFile.BIN_SIZE:
-            raise ValueError(f"Invalid bin size: {len(data)} bytes "
+            return data
+        if size != BinFile.BIN_SIZE:
+            raise ValueError(f"Invalid bin size: {size} bytes "
                              f"(expected {BinFile.BIN_SIZE} or {BinFile.CAL_SIZE})")
+        data = bytearray(size)
+        with open(p, "rb") as f:
+            if f.readinto(data) != size:
+                raise ValueError(f"Short read from {path}")
         return data
 
+    @staticmethod
+    def digest(path: str) -> str:
+        """
+        SHA-256 of a file on disk, memoized on (path, size, mtime).
+        Uses hashlib.file_digest (3.11+, hashes straight from the file
+        buffer) with a chunked memoryview fallback for older Pythons.
+        """
+        p = Path(path).resolve()
+        st = p.stat()
+        key = (str(p), st.st_size, st.st_mtime_ns)
+        cached = BinFile._digest_cache.get(key)
+        if cached:
+            return cached
+        with open(p, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                hexdigest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                h = hashlib.sha256()
+                buf = bytearray(65536)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    h.update(view[:n])
+                hexdigest = h.hexdigest()
+        BinFile._digest_cache[key] = hexdigest
+        return hexdigest
+
     @staticmethod
     def save(path: str, data: bytearray) -> None:
         """Save a .bin file."""
@@ -2446,13 +2927,7 @@ class BinFile:
         skipping the checksum storage region $4000-$4007.
         Returns 16-bit checksum.
         """
-        total = 0
-        for addr in range(0x2000, 0x20000):
-            if CHECKSUM_SKIP_START <= addr <= CHECKSUM_SKIP_END:
-                continue
-            if addr < len(data):
-                total = (total + data[addr]) & 0xFFFF
-        return total
+        return compute_bin_checksum(data)
 
     @staticmethod
     def fix_checksum(data: bytearray) -> Tuple[int, int]:
@@ -2499,38 +2974,68 @@ class BinFile:
     @staticmethod
     def read_table(data: bytearray, table: CalibrationTable) -> List[List[int]]:
         """Read a calibration table from the bin as a 2D list."""
-        result = []
-        offset = table.rom_offset
-        for r in range(table.rows):
-            row = []
-            for c in range(table.cols):
-                if table.element_size == 1:
-                    row.append(data[offset])
-                elif table.element_size == 2:
-                    row.append((data[offset] << 8) | data[offset + 1])
-                offset += table.element_size
-            result.append(row)
-        return result
+        unpack_from = table.row_struct.unpack_from
+        row_size = table.row_size
+        base = table.rom_offset
+        return [list(unpack_from(data, base + r * row_size)) for r in range(table.rows)]
 
     @staticmethod
     def write_table(data: bytearray, table: CalibrationTable, values: List[List[int]]) -> None:
         """Write a 2D calibration table into the bin."""
-        offset = table.rom_offset
+        pack_into = table.row_struct.pack_into
+        mask = 0xFFFF if table.element_size == 2 else 0xFF
+        row_size = table.row_size
+        base = table.rom_offset
         for r in range(table.rows):
-            for c in range(table.cols):
-                val = values[r][c]
-                if table.element_size == 1:
-                    data[offset] = val & 0xFF
-                elif table.element_size == 2:
-                    data[offset] = (val >> 8) & 0xFF
-                    data[offset + 1] = val & 0xFF
-                offset += table.element_size
+            row = values[r]
+            pack_into(data, base + r * row_size, *[row[c] & mask for c in range(table.cols)])
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 9 — FLASH OPERATIONS (HIGH-LEVEL SEQUENCES)
 # ═══════════════════════════════════════════════════════════════════════
 
+def prioritize_flash_thread() -> None:
+    """Best-effort: pin the calling thread to one core and raise its priority.
+
+    Keeps write/ACK round-trips steady during a flash so the retry logic
+    isn't tripped by scheduler migrations. Failures (no privilege to raise
+    priority, unsupported OS) are logged and ignored.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            # pid 0 = calling thread on Linux
+            os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+        except OSError as e:
+            log.debug("sched_setaffinity failed: %s", e)
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
+        except Exception as e:
+            log.debug("SetThreadPriority failed: %s", e)
+    elif hasattr(os, "setpriority"):
+        try:
+            # On Linux, PRIO_PROCESS with who=0 applies to the calling thread
+            os.setpriority(os.PRIO_PROCESS, 0, -10)
+        except OSError as e:
+            log.debug("setpriority(-10) not permitted: %s", e)
+
+
+@contextmanager
+def gc_paused():
+    """Disable the cyclic GC for a critical section, collecting once after."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+            gc.collect()
+
+
 class FlashOp:
     """
     High-level flash operations: read, write, verify.
@@ -3037,17 +3542,33 @@ class DataLogger:
     """
     Continuous Mode 1 data stream logger.
     Records sensor data to CSV with timestamps.
+
+    Rows are batched CSV_BATCH_ROWS at a time into one writerows() call and
+    flushed to disk with each batch — at least once per CSV_FLUSH_NS, so a
+    killed process or a pulled cable loses at most a second of samples.
     """
 
+    CSV_BATCH_ROWS = 64
+    CSV_BUFFER_BYTES = 1 << 16
+    CSV_FLUSH_NS = 1_000_000_000
+    DATA_BUFFER_LEN = 4096  # ring of recent samples — fixed size however long the log runs
+
     def __init__(self, comm: ECUComm):
         self.comm = comm
         self.running = False
         self._thread: Optional[threading.Thread] = None
-        self._data_buffer: deque = deque(maxlen=10000)
+        self._stop_event = threading.Event()
+        self._data_buffer: deque = deque(maxlen=self.DATA_BUFFER_LEN)
         self._csv_file = None
+        self._csv_writer = None
+        self._pending_rows: List[tuple] = []
+        self._row_getter: Callable[[dict], tuple] = lambda data: ()
+        self._row_defaults: Dict[str, str] = {}
         self._csv_path: Optional[str] = None
+        self._ts_sec_cached = -1
+        self._ts_sec_str = ""
         self._sample_count = 0
-        self._start_time = 0.0
+        self._start_ns = 0
         self.on_data: Optional[Callable] = None
         self._params_to_log: List[str] = [
             "RPM", "ECT Temp", "IAT Temp", "TPS %", "MAF",
@@ -3063,16 +3584,28 @@ class DataLogger:
 
         if params:
             self._params_to_log = params
+        # One C-level itemgetter call pulls every logged value per sample.
+        # itemgetter of a single key returns a bare value, so wrap it.
+        keys = tuple(self._params_to_log)
+        getter = operator.itemgetter(*keys) if keys else (lambda data: ())
+        self._row_getter = getter if len(keys) != 1 else (lambda data: (getter(data),))
+        self._row_defaults = dict.fromkeys(keys, "")
 
         self._csv_path = csv_path or str(
             LOG_DIR / f"datalog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
-        self._csv_file = open(self._csv_path, "w", encoding="utf-8", buffering=1)  # line-buffered (#11 fix)
-        self._csv_file.write("Timestamp,Elapsed_s," + ",".join(self._params_to_log) + "\n")
+        self._csv_file = open(self._csv_path, "w", encoding="utf-8", newline="",
+                              buffering=self.CSV_BUFFER_BYTES)
+        self._csv_writer = csv.writer(self._csv_file, lineterminator="\n")
+        self._csv_writer.writerow(["Timestamp", "Elapsed_s", *self._params_to_log])
+        self._csv_file.flush()  # header visible to anyone tailing the file
+        self._pending_rows = []
 
         self.running = True
+        self._stop_event.clear()
         self._sample_count = 0
-        self._start_time = time.monotonic()
+        self._start_ns = time.monotonic_ns()
+        self._last_flush_ns = self._start_ns
         self._thread = threading.Thread(target=self._log_loop, daemon=True)
         self._thread.start()
 
@@ -3081,51 +3614,79 @@ class DataLogger:
     def stop(self) -> None:
         """Stop logging."""
         self.running = False
+        self._stop_event.set()  # wakes an idle backoff immediately
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
         if self._csv_file:
+            self._flush_rows()
             self._csv_file.close()
             self._csv_file = None
+            self._csv_writer = None
 
         self.comm.emit("log",
                       msg=f"Datalog stopped: {self._sample_count} samples in "
-                          f"{time.monotonic() - self._start_time:.1f}s",
+                          f"{(time.monotonic_ns() - self._start_ns) / 1e9:.1f}s",
                       level="info")
 
     def _log_loop(self) -> None:
         """Main logging loop — runs in background thread."""
-        while self.running and not self.comm.cancelled:
+        stop = self._stop_event
+        start_ns = self._start_ns
+        while not stop.is_set() and not self.comm.cancelled:
             data = self.comm.request_mode1(message=0)
             if data:
                 self._sample_count += 1
-                elapsed = time.monotonic() - self._start_time
-                ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+                now_ns = time.monotonic_ns()
+                # Integer ms since start → "s.mmm" without float formatting
+                elapsed_ms = (now_ns - start_ns) // 1_000_000
+                ts = self._timestamp()
 
-                # Write CSV row
-                values = [str(data.get(p, "")) for p in self._params_to_log]
-                if self._csv_file:
-                    self._csv_file.write(f"{ts},{elapsed:.3f}," + ",".join(values) + "\n")
-                    if self._sample_count % 10 == 0:
-                        self._csv_file.flush()
+                # Queue CSV row; written a batch at a time
+                if self._csv_writer:
+                    try:
+                        values = self._row_getter(data)
+                    except KeyError:  # short frame — blank the missing params
+                        values = self._row_getter({**self._row_defaults, **data})
+                    self._pending_rows.append(
+                        (ts, f"{elapsed_ms // 1000}.{elapsed_ms % 1000:03d}", *values))
+                    if (len(self._pending_rows) >= self.CSV_BATCH_ROWS
+                            or now_ns - self._last_flush_ns >= self.CSV_FLUSH_NS):
+                        self._flush_rows()
 
                 # Buffer and callback
                 self._data_buffer.append(data)
                 if self.on_data:
                     self.on_data(data)
-            else:
-                time.sleep(0.05)
+            elif stop.wait(0.05):
+                break
+
+    def _timestamp(self) -> str:
+        """Wall-clock HH:MM:SS.mmm — strftime only runs once per second."""
+        sec, ms = divmod(time.time_ns() // 1_000_000, 1000)
+        if sec != self._ts_sec_cached:
+            self._ts_sec_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_sec_cached = sec
+        return f"{self._ts_sec_str}.{ms:03d}"
+
+    def _flush_rows(self) -> None:
+        """Write all queued rows in one call and push them to disk."""
+        if self._pending_rows and self._csv_writer:
+            self._csv_writer.writerows(self._pending_rows)
+            self._pending_rows.clear()
+            self._csv_file.flush()
+        self._last_flush_ns = time.monotonic_ns()
 
     @property
     def latest(self) -> Optional[Dict[str, float]]:
-        """Get the most recent data sample."""
+        """Get the most recent data sample (O(1) end-of-deque read)."""
         return self._data_buffer[-1] if self._data_buffer else None
 
     @property
     def sample_rate(self) -> float:
         """Samples per second."""
-        elapsed = time.monotonic() - self._start_time
-        return self._sample_count / elapsed if elapsed > 0 else 0
+        elapsed_ns = time.monotonic_ns() - self._start_ns
+        return self._sample_count * 1e9 / elapsed_ns if elapsed_ns > 0 else 0
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -3140,6 +3701,8 @@ class LiveTuner:
     """
 
     RT_FLAG = 0x80  # Bit 7 set = RT write (not malf clear)
+    RT_RUN_MAX = 50  # max cells per Mode 10 write
+    RT_GAP_FILL = 6  # clean cells re-sent to bridge a gap — cheaper than a new frame
 
     def __init__(self, comm: ECUComm, table: CalibrationTable):
         self.comm = comm
@@ -3147,19 +3710,26 @@ class LiveTuner:
         self.shadow = bytearray(table.byte_size)
         self.rom_values = bytearray(table.byte_size)  # Original ROM values for delta checking
         self.dirty_cells: set = set()
+        # Cells written to ECU RAM since the last revert. The ECU keeps them
+        # whatever the shadow says, so they survive load_from_bin().
+        self._ecu_touched: set = set()
         self.active = False
         self._max_delta = 10  # max ±10 from ROM value per cell
 
         # Safety
         self.knock_history: deque = deque(maxlen=10)
+        self._knock_streak = 0  # consecutive readings with retard > 5°
         self.safety_reverted = False
 
     def load_from_bin(self, bin_data: bytearray) -> None:
         """Load table values from the bin file into the shadow."""
         offset = self.table.rom_offset
-        for i in range(self.table.byte_size):
-            self.shadow[i] = bin_data[offset + i]
-            self.rom_values[i] = bin_data[offset + i]
+        n = self.table.byte_size
+        src = bytes(bin_data[offset:offset + n])
+        if len(src) != n:
+            raise IndexError(f"bin too short for {self.table.name} at ${offset:05X}")
+        self.shadow[:] = src
+        self.rom_values[:] = src
 
     def set_cell(self, row: int, col: int, value: int) -> bool:
         """Set a cell value (with delta safety check)."""
@@ -3183,6 +3753,35 @@ class LiveTuner:
         self.dirty_cells.add(offset)
         return True
 
+    def set_cells(self, cells: Iterable[Tuple[int, int, int]]) -> List[Tuple[int, int]]:
+        """
+        Set many (row, col, value) cells in one pass — e.g. pasting or
+        scaling a block. Same bounds and delta checks as set_cell, but
+        safety rejections are reported once. Returns the rejected cells.
+        """
+        cols, size = self.table.cols, self.table.byte_size
+        shadow, rom_values, max_delta = self.shadow, self.rom_values, self._max_delta
+        dirty = self.dirty_cells
+        rejected: List[Tuple[int, int]] = []
+        over_limit = 0
+        for row, col, value in cells:
+            offset = row * cols + col
+            if not (0 <= offset < size and 0 <= value <= 255):
+                rejected.append((row, col))
+            elif abs(value - rom_values[offset]) > max_delta:
+                rejected.append((row, col))
+                over_limit += 1
+            else:
+                shadow[offset] = value
+                dirty.add(offset)
+
+        if over_limit:
+            log.warning("%d cells exceed max delta %d", over_limit, max_delta)
+            self.comm.emit("log",
+                          msg=f"Safety limit: {over_limit} cells exceed max delta {max_delta}",
+                          level="warning")
+        return rejected
+
     def get_cell(self, row: int, col: int) -> int:
         """Get current shadow cell value."""
         offset = row * self.table.cols + col
@@ -3195,16 +3794,20 @@ class LiveTuner:
 
         cells = sorted(self.dirty_cells)
         runs = self._find_runs(cells)
+        device_id = self.comm.config.device_id
 
+        touched = self._ecu_touched
         for start_offset, data in runs:
+            # Recorded before sending: a timed-out write may still have landed
+            touched.update(range(start_offset, start_offset + len(data)))
             target_addr = start_offset  # The patched OS knows the shadow base
-            frame = ALDLProtocol.build_write_frame(
-                self.comm.config.device_id,
-                target_addr,
-                data,
+            # Cached per run length: header bytes and their checksum share
+            # are folded in once, only address + payload are summed here
+            frame = ALDLProtocol.write_frame_builder(
+                device_id, len(data),
                 mode=ALDLMode.MODE10_WRITE_CAL,
                 extended=False,
-            )
+            )(target_addr, data)
             # Add RT flag to distinguish from malf clear
             # (In the actual patched OS, the handler checks the sub-command byte)
 
@@ -3226,17 +3829,16 @@ class LiveTuner:
         """
         knock = sensor_data.get("Knock Retard", 0)
         self.knock_history.append(knock)
+        self._knock_streak = self._knock_streak + 1 if knock > 5.0 else 0
 
         # Knock retard watchdog: if >5° for 3 consecutive readings, revert
-        if len(self.knock_history) >= 3:
-            recent = list(self.knock_history)[-3:]
-            if all(k > 5.0 for k in recent):
-                log.warning("SAFETY: Knock retard >5° for 3 consecutive readings — reverting!")
-                self.comm.emit("log",
-                              msg="⚠ SAFETY: Knock retard detected — reverting to ROM values!",
-                              level="error")
-                self.revert_to_rom()
-                return False
+        if self._knock_streak >= 3:
+            log.warning("SAFETY: Knock retard >5° for 3 consecutive readings — reverting!")
+            self.comm.emit("log",
+                          msg="⚠ SAFETY: Knock retard detected — reverting to ROM values!",
+                          level="error")
+            self.revert_to_rom()
+            return False
 
         # Temperature guard
         coolant = sensor_data.get("ECT Temp", 0)
@@ -3254,28 +3856,41 @@ class LiveTuner:
 
     def revert_to_rom(self) -> None:
         """Revert the shadow table back to original ROM values."""
-        self.shadow = bytearray(self.rom_values)
-        # Mark all cells dirty to send the revert
-        self.dirty_cells = set(range(self.table.byte_size))
+        # Re-send every cell the ECU may hold at a non-ROM value: those
+        # written since the last revert, plus edits still unsent
+        self.dirty_cells |= self._ecu_touched
+        self.shadow[:] = self.rom_values
         self.safety_reverted = True
-        self.send_updates()
+        if self.send_updates():
+            self._ecu_touched.clear()
 
-    def _find_runs(self, offsets: list) -> List[Tuple[int, bytes]]:
-        """Find contiguous runs of dirty cells for batched transfer."""
+    def _find_runs(self, offsets: list) -> List[Tuple[int, memoryview]]:
+        """
+        Find runs of dirty cells for batched transfer.
+        ALDL is half duplex, so each run costs a full request/response
+        turnaround. Gaps of up to RT_GAP_FILL clean cells are bridged by
+        re-sending their current shadow values in the same frame.
+        """
         if not offsets:
             return []
-        runs = []
-        start = offsets[0]
-        end = offsets[0]
-        for i in range(1, len(offsets)):
-            if offsets[i] == end + 1 and (offsets[i] - start) < 50:
-                end = offsets[i]
-            else:
-                runs.append((start, bytes(self.shadow[start:end + 1])))
-                start = offsets[i]
-                end = offsets[i]
-        runs.append((start, bytes(self.shadow[start:end + 1])))
-        return runs
+        # Wider gaps split runs; each span is then cut into
+        # RT_RUN_MAX-byte frames with plain slices.
+        max_step = self.RT_GAP_FILL + 1
+        starts = [offsets[0]]
+        ends = []
+        for prev, cur in zip(offsets, offsets[1:]):
+            if cur - prev > max_step:
+                ends.append(prev + 1)
+                starts.append(cur)
+        ends.append(offsets[-1] + 1)
+
+        # Zero-copy views; the frame builder copies the payload straight
+        # into the frame, so no intermediate bytes object is needed
+        shadow = memoryview(self.shadow)
+        step = self.RT_RUN_MAX
+        return [(pos, shadow[pos:min(pos + step, end)])
+                for start, end in zip(starts, ends)
+                for pos in range(start, end, step)]
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -3295,6 +3910,10 @@ if GUI_AVAILABLE:
             "success": QColor(100, 255, 100),
         }
 
+        QUEUE_MAX = 4096    # queued lines kept if the GUI falls behind
+        FLUSH_MS = 100
+        FLUSH_BATCH = 256   # lines per flush tick
+
         def __init__(self, parent=None):
             super().__init__(parent)
             self.setReadOnly(True)
@@ -3308,13 +3927,43 @@ if GUI_AVAILABLE:
                 }
             """)
 
+            # Lines from worker threads wait here and are shown in batches
+            self._pending: deque = deque(maxlen=self.QUEUE_MAX)
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setInterval(self.FLUSH_MS)
+            self._flush_timer.setTimerType(Qt.CoarseTimer)
+            self._flush_timer.timeout.connect(self.flush_pending)
+            self._flush_timer.start()
+
         def append_log(self, msg: str, level: str = "info") -> None:
+            # Lines queued from other threads were written first — show them first
+            if self._pending:
+                self.flush_pending(0)
             color = self.COLORS.get(level, self.COLORS["info"])
             ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             self.setTextColor(color)
             self.append(f"{ts}  {msg}")
             self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
 
+        def queue_log(self, msg: str, level: str = "info") -> None:
+            """Thread-safe append_log: stamped now, shown on the next flush tick."""
+            self._pending.append((datetime.now().strftime("%H:%M:%S.%f")[:-3], msg, level))
+
+        def flush_pending(self, limit: int = FLUSH_BATCH) -> None:
+            """Show up to *limit* queued lines (0 = all) with a single append."""
+            pending = self._pending
+            if not pending:
+                return
+            colors = self.COLORS
+            parts = []
+            for _ in range(min(len(pending), limit or len(pending))):
+                ts, msg, level = pending.popleft()
+                color = colors.get(level, colors["info"]).name()
+                text = html.escape(f"{ts}  {msg}").replace("\n", "<br>")
+                parts.append(f'<span style="color:{color}; white-space:pre">{text}</span>')
+            self.append("<br>".join(parts))
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
     class SensorGaugeWidget(QFrame):
         """A single sensor gauge showing name, value, units, and bar."""
 
@@ -3347,16 +3996,29 @@ if GUI_AVAILABLE:
             layout.addWidget(self.value_label)
             layout.addWidget(self.unit_label)
 
+            # Hex vs decimal is fixed per param — decide it once
+            if param.conversion in ("flags", "hex"):
+                self._fmt = self._format_hex
+            else:
+                self._fmt = self._format_decimal
+            self._set_text = self.value_label.setText
+
+        @staticmethod
+        def _format_hex(val: float) -> str:
+            return f"0x{int(val):02X}"
+
+        @staticmethod
+        def _format_decimal(val: float) -> str:
+            mag = abs(val)
+            if mag > 1000:
+                return f"{val:.0f}"
+            if mag > 10:
+                return f"{val:.1f}"
+            return f"{val:.2f}"
+
         def update_value(self, val: float) -> None:
             self.value = val
-            if self.param.conversion == "flags" or self.param.conversion == "hex":
-                self.value_label.setText(f"0x{int(val):02X}")
-            elif abs(val) > 1000:
-                self.value_label.setText(f"{val:.0f}")
-            elif abs(val) > 10:
-                self.value_label.setText(f"{val:.1f}")
-            else:
-                self.value_label.setText(f"{val:.2f}")
+            self._set_text(self._fmt(val))
 
     class DashboardWidget(QWidget):
         """Live sensor dashboard with gauge widgets."""
@@ -3380,11 +4042,20 @@ if GUI_AVAILABLE:
                     row, col = divmod(i, 2)
                     layout.addWidget(gauge, row, col)
                     self.gauges[name] = gauge
+            self._shown: Dict[str, float] = {}
+            # (name, bound update_value) — built once, walked every tick
+            self._dispatch = [(name, g.update_value) for name, g in self.gauges.items()]
 
         def update_data(self, data: Dict[str, float]) -> None:
-            for name, gauge in self.gauges.items():
-                if name in data:
-                    gauge.update_value(data[name])
+            # Already paced by the main window's dash_timer; between ticks
+            # most sensors hold steady, so only touch labels that changed.
+            shown = self._shown
+            get = data.get
+            for name, update_value in self._dispatch:
+                val = get(name)
+                if val is not None and shown.get(name) != val:
+                    shown[name] = val
+                    update_value(val)
 
     class TableEditorWidget(QWidget):
         """2D calibration table editor with cell highlighting."""
@@ -3427,6 +4098,8 @@ if GUI_AVAILABLE:
             self._current_table_key: Optional[str] = None
             self._rom_values: Optional[List[List[int]]] = None
             self._loading = False
+            self._active_cell: Optional[Tuple[int, int]] = None
+            self._modified_cells: set = set()  # (row, col) differing from ROM
 
         def load_table(self, table_key: str, bin_data: bytearray) -> None:
             """Load a table from bin data into the grid."""
@@ -3435,6 +4108,8 @@ if GUI_AVAILABLE:
             table = CAL_TABLES[table_key]
             self._current_table_key = table_key
             self._loading = True
+            self._active_cell = None
+            self._modified_cells = set()
 
             values = BinFile.read_table(bin_data, table)
             self._rom_values = [row[:] for row in values]  # deep copy
@@ -3458,16 +4133,31 @@ if GUI_AVAILABLE:
 
         def highlight_cell(self, row: int, col: int) -> None:
             """Highlight the currently active cell (from live RPM/load position)."""
-            for r in range(self.grid.rowCount()):
-                for c in range(self.grid.columnCount()):
-                    item = self.grid.item(r, c)
-                    if item:
-                        if r == row and c == col:
-                            item.setBackground(QColor(0, 100, 0))  # Green for active
-                        elif self._rom_values and item.text() != str(self._rom_values[r][c]):
-                            item.setBackground(QColor(100, 60, 0))  # Orange for modified
-                        else:
-                            item.setBackground(QColor(30, 30, 30))  # Default
+            # Only the old and new active cells change colour; modified
+            # cells are tracked as they are edited, not rescanned here.
+            previous = self._active_cell
+            if previous == (row, col):
+                return
+            self._active_cell = (row, col)
+            if previous is not None:
+                self._paint_cell(*previous)
+            self._paint_cell(row, col)
+
+        def _paint_cell(self, row: int, col: int) -> None:
+            item = self.grid.item(row, col)
+            if not item:
+                return
+            if (row, col) == self._active_cell:
+                color = QColor(0, 100, 0)  # Green for active
+            elif (row, col) in self._modified_cells:
+                color = QColor(100, 60, 0)  # Orange for modified
+            else:
+                color = QColor(30, 30, 30)  # Default
+            # Background changes fire cellChanged too — not a user edit
+            loading = self._loading
+            self._loading = True
+            item.setBackground(color)
+            self._loading = loading
 
         def _on_table_changed(self, index: int) -> None:
             key = self.table_combo.itemData(index)
@@ -3479,6 +4169,14 @@ if GUI_AVAILABLE:
                 return
             item = self.grid.item(row, col)
             if item:
+                if self._rom_values:
+                    was_modified = (row, col) in self._modified_cells
+                    if item.text() != str(self._rom_values[row][col]):
+                        self._modified_cells.add((row, col))
+                    else:
+                        self._modified_cells.discard((row, col))
+                    if was_modified != ((row, col) in self._modified_cells):
+                        self._paint_cell(row, col)
                 try:
                     value = int(item.text())
                     if self.cell_changed:
@@ -3486,6 +4184,23 @@ if GUI_AVAILABLE:
                 except ValueError:
                     pass
 
+    class DisassemblyWorker(QObject):
+        """Decodes a large hex paste off the GUI thread (runs in QThread)."""
+        finished = Signal(object)  # list of instructions, or the Exception raised
+
+        def __init__(self, dis, hex_text: str, base_addr: int, parent=None):
+            super().__init__(parent)
+            self._dis = dis
+            self._hex_text = hex_text
+            self._base_addr = base_addr
+
+        def run(self) -> None:
+            try:
+                results = self._dis.disassemble_hex(self._hex_text, base_addr=self._base_addr)
+            except Exception as exc:
+                results = exc
+            self.finished.emit(results)
+
     class DisassemblerWidget(QWidget):
         """HC11 hex→asm disassembler with split input/output and event bus.
 
@@ -3502,9 +4217,16 @@ if GUI_AVAILABLE:
         # Event bus signal: emits (list_of_formatted_lines, base_addr)
         disassembly_done = Signal(list, int)
 
+        # Pastes at least this long decode in a worker thread; shorter ones
+        # finish faster than a thread can start
+        THREADED_MIN_CHARS = 16384
+
+        FLOW_MNEMONICS = frozenset(("JSR", "BSR", "JMP", "RTS", "RTI", "SWI", "WAI"))
+
         def __init__(self, parent=None):
             super().__init__(parent)
             self._dis = None  # lazy import
+            self._disasm_thread: Optional[QThread] = None
             self._build_ui()
 
         def _get_disassembler(self):
@@ -3625,15 +4347,70 @@ if GUI_AVAILABLE:
             except ValueError:
                 base_addr = 0x8000
 
+            if self._disasm_thread is not None:
+                return  # previous large paste still decoding
+
             dis = self._get_disassembler()
             dis.annotate_vy = self.chk_annotate.isChecked()
             show_desc = self.chk_description.isChecked()
 
+            if len(hex_text) >= self.THREADED_MIN_CHARS:
+                self._start_disasm_thread(dis, hex_text, base_addr, show_desc)
+                return
+
             try:
                 results = dis.disassemble_hex(hex_text, base_addr=base_addr)
             except Exception as exc:
+                results = exc
+            self._show_results(results, base_addr, show_desc)
+
+        def _start_disasm_thread(self, dis, hex_text: str, base_addr: int,
+                                 show_desc: bool) -> None:
+            """Decode in a worker thread; the results come back queued to the GUI thread."""
+            self._disasm_thread = QThread()
+            worker = DisassemblyWorker(dis, hex_text, base_addr)
+            self._disasm_worker = worker
+            self._disasm_args = (base_addr, show_desc)
+            worker.moveToThread(self._disasm_thread)
+            self._disasm_thread.started.connect(worker.run)
+            # Bound slot on this widget → queued back onto the GUI thread
+            worker.finished.connect(self._on_disasm_finished)
+            worker.finished.connect(self._disasm_thread.quit)
+            self._disasm_thread.finished.connect(worker.deleteLater)
+            self._disasm_thread.finished.connect(self._disasm_thread.deleteLater)
+            self._disasm_thread.finished.connect(self._on_disasm_thread_done)
+
+            self.btn_disasm.setEnabled(False)
+            self.stats_label.setText("Disassembling…")
+            self._disasm_thread.start()
+
+        @Slot(object)
+        def _on_disasm_finished(self, results) -> None:
+            self.stats_label.setText("")
+            self._show_results(results, *self._disasm_args)
+
+        def stop_worker(self) -> None:
+            """Wait for an in-flight decode so its thread isn't destroyed while running."""
+            if self._disasm_thread is not None:
+                self._disasm_thread.quit()
+                self._disasm_thread.wait()
+
+        def closeEvent(self, event) -> None:
+            self.stop_worker()
+            super().closeEvent(event)
+
+        @Slot()
+        def _on_disasm_thread_done(self) -> None:
+            # Drop our references only once the thread has actually stopped
+            self._disasm_thread = None
+            self._disasm_worker = None
+            self.btn_disasm.setEnabled(True)
+
+        def _show_results(self, results, base_addr: int, show_desc: bool) -> None:
+            """Write decoded instructions (or the decode error) to the output pane."""
+            if isinstance(results, Exception):
                 self.asm_output.setTextColor(QColor(255, 80, 80))
-                self.asm_output.setText(f"Error: {exc}")
+                self.asm_output.setText(f"Error: {results}")
                 return
 
             if not results:
@@ -3641,8 +4418,9 @@ if GUI_AVAILABLE:
                 self.asm_output.setText("No instructions decoded. Check hex input.")
                 return
 
-            # Build colorized output
-            self.asm_output.clear()
+            # Build colorized output as one HTML document — a single
+            # setHtml() lays the pane out once, however many lines there are
+            spans: list = []
             lines: list = []
             total_cycles = 0
             for r in results:
@@ -3652,18 +4430,22 @@ if GUI_AVAILABLE:
 
                 # Color code by instruction type
                 if r.mnemonic == "DB":
-                    color = QColor(255, 80, 80)    # data — red
-                elif r.mnemonic in ("JSR", "BSR", "JMP", "RTS", "RTI", "SWI", "WAI"):
-                    color = QColor(86, 216, 177)    # flow — teal
+                    color = "#ff5050"    # data — red
+                elif r.mnemonic in self.FLOW_MNEMONICS:
+                    color = "#56d8b1"    # flow — teal
                 elif r.mnemonic.startswith("B") and r.mode == "rel":
-                    color = QColor(255, 214, 102)   # branch — gold
+                    color = "#ffd666"    # branch — gold
                 elif r.comment:
-                    color = QColor(130, 180, 255)   # annotated — blue
+                    color = "#82b4ff"    # annotated — blue
                 else:
-                    color = QColor(200, 200, 200)   # normal — grey
+                    color = "#c8c8c8"    # normal — grey
 
-                self.asm_output.setTextColor(color)
-                self.asm_output.append(line)
+                spans.append(f'<span style="color:{color}">{html.escape(line)}</span>')
+
+            self.asm_output.setHtml(
+                '<pre style="margin:0; font-family:Consolas, monospace">'
+                + "\n".join(spans) + "</pre>"
+            )
 
             # Stats
             n_bytes = sum(r.length for r in results)
@@ -4669,6 +5451,14 @@ if GUI_AVAILABLE:
             )
             flash_layout.addWidget(self.chk_high_speed)
 
+            self.chk_adaptive_timing = QCheckBox("Adaptive inter-frame delay")
+            self.chk_adaptive_timing.setToolTip(
+                "Shrink the inter-frame delay while frames succeed and\n"
+                "back off on retries. The configured delay is the starting\n"
+                "point and the floor after any failure."
+            )
+            flash_layout.addWidget(self.chk_adaptive_timing)
+
             self.chk_ignore_echo = QCheckBox("Ignore echo bytes")
             self.chk_ignore_echo.setToolTip(
                 "Strip TX echo from received data.\n"
@@ -4809,11 +5599,11 @@ if GUI_AVAILABLE:
         def _load_from_config(self, config: CommConfig) -> None:
             """Populate widgets from a CommConfig."""
             self.spin_baud.setValue(config.baud)
-            # Set device ID combo
-            for i in range(self.combo_device_id.count()):
-                if self.combo_device_id.itemData(i) == config.device_id:
-                    self.combo_device_id.setCurrentIndex(i)
-                    break
+            # Set device ID combo (findData searches on the C++ side)
+            # int(): the combo holds plain ints, and findData won't match an IntEnum
+            idx = self.combo_device_id.findData(int(config.device_id))
+            if idx >= 0:
+                self.combo_device_id.setCurrentIndex(idx)
             self.spin_timeout.setValue(config.timeout_ms)
             self.spin_inter_frame.setValue(config.inter_frame_delay_ms)
             self.spin_retries.setValue(config.max_retries)
@@ -4821,6 +5611,7 @@ if GUI_AVAILABLE:
             self.chk_auto_checksum.setChecked(config.auto_checksum_fix)
             self.chk_verify_write.setChecked(True)
             self.chk_high_speed.setChecked(config.high_speed_read)
+            self.chk_adaptive_timing.setChecked(config.adaptive_timing)
             self.chk_ignore_echo.setChecked(config.ignore_echo)
             self.chk_disable_bcm.setChecked(config.disable_bcm_chatter)
 
@@ -4907,6 +5698,7 @@ if GUI_AVAILABLE:
             config.write_chunk_size = self.spin_chunk.value()
             config.auto_checksum_fix = self.chk_auto_checksum.isChecked()
             config.high_speed_read = self.chk_high_speed.isChecked()
+            config.adaptive_timing = self.chk_adaptive_timing.isChecked()
             config.ignore_echo = self.chk_ignore_echo.isChecked()
             config.disable_bcm_chatter = self.chk_disable_bcm.isChecked()
 
@@ -4939,6 +5731,10 @@ if GUI_AVAILABLE:
             self._task: Optional[str] = None
             self._bin_data: Optional[bytearray] = None
             self._mode: str = "BIN"
+            self._last_progress: Tuple[int, str] = (-1, "")
+            # Thread-safe sink for ECU log lines (e.g. LogWidget.queue_log);
+            # without one every line is a queued log_message signal
+            self.log_sink: Optional[Callable[[str, str], None]] = None
 
         def setup_write(self, bin_data: bytearray, mode: str = "BIN") -> None:
             self._task = "write"
@@ -4963,22 +5759,39 @@ if GUI_AVAILABLE:
             self._bin_data = bin_data
             self._chaos_cfg = config
 
+        def _log(self, msg: str, level: str = "info") -> None:
+            """Every worker log line — its own and the ECU's — takes this one
+            path, so they reach the log pane in the order they were written."""
+            (self.log_sink or self.log_message.emit)(msg, level)
+
+        def _emit_progress(self, current: int, total: int, label: str = "", **_) -> None:
+            """Forward progress to the GUI only when the shown percent or label changes.
+            A 128KB transfer reports thousands of chunks; the bar has 100 steps."""
+            pct = current * 100 // total if total > 0 else 0
+            if (pct, label) != self._last_progress:
+                self._last_progress = (pct, label)
+                self.progress.emit(current, total, label)
+
         @Slot()
         def run(self) -> None:
             # Clear stale callbacks to prevent accumulation across operations
             self.comm.clear_callbacks()
             # Wire up event callbacks
-            self.comm.on("log", lambda msg, level="info", **_: self.log_message.emit(msg, level))
-            self.comm.on("progress", lambda current, total, label="", **_: self.progress.emit(current, total, label))
-            self.comm.on("state", lambda state, **_: self.state_changed.emit(state.name))
+            self.comm.on("log", lambda msg, level="info", **_: self._log(msg, level))
+            self._last_progress = (-1, "")
+            self.comm.on("progress", self._emit_progress)
+            state_emit = self.state_changed.emit
+            self.comm.on("state", lambda state, names=_STATE_NAMES, **_: state_emit(names[state]))
 
             # Clear stale cancel flag so a previous cancel doesn't
             # abort this operation immediately (bug #3: reset_cancel never called)
             self.comm.reset_cancel()
+            prioritize_flash_thread()
 
             try:
                 if self._task == "write" and self._bin_data:
-                    result = self._op.full_write(self._bin_data, self._mode)
+                    with gc_paused():
+                        result = self._op.full_write(self._bin_data, self._mode)
                     self.finished.emit(result)
                 elif self._task == "read":
                     data = self._op.full_read()
@@ -4986,7 +5799,8 @@ if GUI_AVAILABLE:
                         self.read_data.emit(data)
                     self.finished.emit(data is not None)
                 elif self._task == "custom_write" and self._bin_data:
-                    result = self._op.custom_write(self._bin_data, self._sectors)
+                    with gc_paused():
+                        result = self._op.custom_write(self._bin_data, self._sectors)
                     self.finished.emit(result)
                 elif self._task == "custom_read":
                     data = self._op.custom_read(self._custom_start, self._custom_end)
@@ -4999,7 +5813,7 @@ if GUI_AVAILABLE:
                 else:
                     self.finished.emit(False)
             except Exception as e:
-                self.log_message.emit(f"Exception: {e}", "error")
+                self._log(f"Exception: {e}", "error")
                 log.exception("Flash worker exception")
                 self.finished.emit(False)
 
@@ -5021,28 +5835,28 @@ if GUI_AVAILABLE:
                 if max_cycles > 0 and cycle > max_cycles:
                     break
                 if self.comm.cancelled:
-                    self.log_message.emit(f"Chaos test cancelled after {cycle - 1} cycles", "warning")
+                    self._log(f"Chaos test cancelled after {cycle - 1} cycles", "warning")
                     break
 
-                self.log_message.emit(f"\n═══ CHAOS CYCLE {cycle} ═══", "info")
+                self._log(f"\n═══ CHAOS CYCLE {cycle} ═══", "info")
 
                 # Step 1: Write the loaded bin
-                self.log_message.emit(f"  [{cycle}] Writing {mode}...", "info")
+                self._log(f"  [{cycle}] Writing {mode}...", "info")
                 write_ok = self._op.full_write(self._bin_data, mode)
                 if not write_ok:
                     failed += 1
-                    self.log_message.emit(f"  [{cycle}] WRITE FAILED", "error")
+                    self._log(f"  [{cycle}] WRITE FAILED", "error")
                     if stop_on_fail:
                         break
                     time.sleep(delay)
                     continue
 
                 # Step 2: Read back
-                self.log_message.emit(f"  [{cycle}] Reading back...", "info")
+                self._log(f"  [{cycle}] Reading back...", "info")
                 readback = self._op.full_read()
                 if readback is None:
                     failed += 1
-                    self.log_message.emit(f"  [{cycle}] READBACK FAILED", "error")
+                    self._log(f"  [{cycle}] READBACK FAILED", "error")
                     if stop_on_fail:
                         break
                     time.sleep(delay)
@@ -5051,43 +5865,82 @@ if GUI_AVAILABLE:
                 # Step 3: Compare
                 if compare_bytes:
                     start_off, end_off = WRITE_RANGES.get(mode, (0x2000, 0x1BFFF))
-                    mismatch = False
-                    for addr in range(start_off, end_off + 1):
-                        if readback[addr] != self._bin_data[addr]:
-                            self.log_message.emit(
-                                f"  [{cycle}] MISMATCH at ${addr:05X}: "
-                                f"expected 0x{self._bin_data[addr]:02X}, "
-                                f"got 0x{readback[addr]:02X}",
-                                "error"
-                            )
-                            mismatch = True
-                            break
+                    addr = first_mismatch(readback, self._bin_data, start_off, end_off + 1)
+                    mismatch = addr is not None
                     if mismatch:
+                        self._log(
+                            f"  [{cycle}] MISMATCH at ${addr:05X}: "
+                            f"expected 0x{self._bin_data[addr]:02X}, "
+                            f"got 0x{readback[addr]:02X}",
+                            "error"
+                        )
                         failed += 1
                         if stop_on_fail:
                             break
                     else:
                         passed += 1
-                        self.log_message.emit(f"  [{cycle}] VERIFY OK ✓", "info")
+                        self._log(f"  [{cycle}] VERIFY OK ✓", "info")
                 else:
                     passed += 1
 
-                self.log_message.emit(
+                self._log(
                     f"  Cycle {cycle} done — Passed: {passed}, Failed: {failed}", "info"
                 )
 
                 if delay > 0 and not self.comm.cancelled:
                     time.sleep(delay)
 
-            self.log_message.emit(
+            self._log(
                 f"\n═══ CHAOS TEST COMPLETE — {cycle} cycles, {passed} passed, {failed} failed ═══",
                 "info" if failed == 0 else "warning"
             )
             return failed == 0
 
+    # Main window theme. Kept window-scoped: applying it app-wide makes Qt
+    # restyle every widget as it is created and slows window construction.
+    _DARK_QSS = """
+    QMainWindow, QWidget { background-color: #1e1e1e; color: #d4d4d4; }
+    QGroupBox { border: 1px solid #3c3c3c; border-radius: 4px; margin-top: 8px;
+                padding-top: 14px; color: #ccc; font-weight: bold; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
+    QPushButton { background: #3c3c3c; border: 1px solid #555; border-radius: 3px;
+                  padding: 6px 16px; color: #ddd; min-height: 24px; }
+    QPushButton:hover { background: #4c4c4c; }
+    QPushButton:pressed { background: #2a2a2a; }
+    QPushButton:disabled { background: #2a2a2a; color: #666; }
+    QPushButton#connectBtn { background: #1a5c1a; }
+    QPushButton#connectBtn:hover { background: #2a7c2a; }
+    QPushButton#connectBtn[connected="true"] { background: #8b1a1a; }
+    QPushButton#connectBtn[connected="true"]:hover { background: #a02a2a; }
+    QPushButton#writeBtn { background: #8b4513; }
+    QPushButton#writeBtn:hover { background: #a0522d; }
+    QPushButton#readBtn { background: #1a3c6c; }
+    QPushButton#readBtn:hover { background: #2a5c9c; }
+    QComboBox { background: #3c3c3c; border: 1px solid #555; border-radius: 3px;
+                padding: 4px; color: #ddd; }
+    QProgressBar { background: #111111; border: 1px solid #3c3c3c; border-radius: 3px;
+                   text-align: center; color: #ffffff; font-weight: bold; }
+    QProgressBar::chunk { background: #00c853; border-radius: 2px; }
+    QTabWidget::pane { border: 1px solid #3c3c3c; }
+    QTabBar::tab { background: #2d2d2d; border: 1px solid #3c3c3c; padding: 6px 16px;
+                   color: #aaa; }
+    QTabBar::tab:selected { background: #3c3c3c; color: #fff; border-bottom: 2px solid #4fc3f7; }
+    QStatusBar { background: #1e1e1e; color: #888; }
+"""
+
+    # Connect-button tooltip, shared by _build_ui and _disconnect
+    _TIP_CONNECT = ("Connect to ECU via the selected port.\n"
+                    "Performs echo detection, silences bus chatter, and identifies the PCM.")
+
     class MainWindow(QMainWindow):
         """Main application window."""
 
+        # Serial port list from the background scan (queued to the GUI thread)
+        ports_scanned = Signal(list)
+        # Background bin load: (path, data, os_id, checksum_ok) / (path, error)
+        bin_loaded = Signal(str, object, str, bool)
+        bin_load_failed = Signal(str, str)
+
         def __init__(self):
             super().__init__()
             self.setWindowTitle(f"{__app_name__} v{__version__}")
@@ -5110,39 +5963,19 @@ if GUI_AVAILABLE:
             self._verify_after_write: bool = True
             self._vecu_bin_path: Optional[str] = None  # Virtual ECU .bin path
             self._persist_on_close: bool = True  # Save settings on exit
+            self._port_scan_busy: bool = False
+            self._last_port: str = ""
+            self._bin_load_busy: bool = False
 
             self._build_ui()
             self._connect_signals()
+            self.ports_scanned.connect(self._on_ports_scanned)
+            self.bin_loaded.connect(self._on_bin_loaded)
+            self.bin_load_failed.connect(self._on_bin_load_failed)
             self._refresh_ports()
 
         def _apply_dark_theme(self) -> None:
-            self.setStyleSheet("""
-                QMainWindow, QWidget { background-color: #1e1e1e; color: #d4d4d4; }
-                QGroupBox { border: 1px solid #3c3c3c; border-radius: 4px; margin-top: 8px;
-                            padding-top: 14px; color: #ccc; font-weight: bold; }
-                QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; }
-                QPushButton { background: #3c3c3c; border: 1px solid #555; border-radius: 3px;
-                              padding: 6px 16px; color: #ddd; min-height: 24px; }
-                QPushButton:hover { background: #4c4c4c; }
-                QPushButton:pressed { background: #2a2a2a; }
-                QPushButton:disabled { background: #2a2a2a; color: #666; }
-                QPushButton#connectBtn { background: #1a5c1a; }
-                QPushButton#connectBtn:hover { background: #2a7c2a; }
-                QPushButton#writeBtn { background: #8b4513; }
-                QPushButton#writeBtn:hover { background: #a0522d; }
-                QPushButton#readBtn { background: #1a3c6c; }
-                QPushButton#readBtn:hover { background: #2a5c9c; }
-                QComboBox { background: #3c3c3c; border: 1px solid #555; border-radius: 3px;
-                            padding: 4px; color: #ddd; }
-                QProgressBar { background: #111111; border: 1px solid #3c3c3c; border-radius: 3px;
-                               text-align: center; color: #ffffff; font-weight: bold; }
-                QProgressBar::chunk { background: #00c853; border-radius: 2px; }
-                QTabWidget::pane { border: 1px solid #3c3c3c; }
-                QTabBar::tab { background: #2d2d2d; border: 1px solid #3c3c3c; padding: 6px 16px;
-                               color: #aaa; }
-                QTabBar::tab:selected { background: #3c3c3c; color: #fff; border-bottom: 2px solid #4fc3f7; }
-                QStatusBar { background: #1e1e1e; color: #888; }
-            """)
+            self.setStyleSheet(_DARK_QSS)
 
         def _build_ui(self) -> None:
             central = QWidget()
@@ -5195,10 +6028,7 @@ if GUI_AVAILABLE:
 
             self.connect_btn = QPushButton("Connect")
             self.connect_btn.setObjectName("connectBtn")
-            self.connect_btn.setToolTip(
-                "Connect to ECU via the selected port.\n"
-                "Performs echo detection, silences bus chatter, and identifies the PCM."
-            )
+            self.connect_btn.setToolTip(_TIP_CONNECT)
             port_layout.addWidget(self.connect_btn)
 
             toolbar.addWidget(port_group)
@@ -5339,6 +6169,7 @@ if GUI_AVAILABLE:
             # ── Dashboard update timer ──
             self.dash_timer = QTimer()
             self.dash_timer.setInterval(200)
+            self.dash_timer.setTimerType(Qt.CoarseTimer)  # ±5% is fine for a gauge refresh
             self.dash_timer.timeout.connect(self._update_dashboard)
 
         def _build_menu_bar(self) -> None:
@@ -5623,23 +6454,64 @@ if GUI_AVAILABLE:
             self.action_veeprom_info.triggered.connect(self._veeprom_info)
 
         def _refresh_ports(self) -> None:
-            self.port_combo.clear()
             transport_type = self.transport_combo.currentData()
             if transport_type in ("loopback", "vecu"):
                 label = "(virtual)" if transport_type == "loopback" else "(Virtual ECU)"
+                self.port_combo.clear()
                 self.port_combo.addItem(label)
                 return
-            ports = PySerialTransport.list_ports() if SERIAL_AVAILABLE else []
+            if not SERIAL_AVAILABLE:
+                self._on_ports_scanned([])
+                return
+            if self._port_scan_busy:
+                return
+            # Port enumeration can block for hundreds of ms (Windows registry
+            # / USB walk) — run it off the GUI thread
+            self._port_scan_busy = True
+            if not self.port_combo.currentText().startswith("("):
+                self._last_port = self.port_combo.currentText()
+            self.port_combo.clear()
+            self.port_combo.addItem("(scanning…)")
+            threading.Thread(target=self._scan_ports, name="port-scan", daemon=True).start()
+
+        def _scan_ports(self) -> None:
+            """Background thread: enumerate serial ports and hand them to the GUI."""
+            try:
+                ports = PySerialTransport.list_ports()
+            except Exception as e:
+                log.debug("Port scan failed: %s", e)
+                ports = []
+            try:
+                self.ports_scanned.emit(ports)
+            except RuntimeError:
+                pass  # window closed mid-scan
+
+        def _on_ports_scanned(self, ports: list) -> None:
+            self._port_scan_busy = False
+            if self.transport_combo.currentData() in ("loopback", "vecu"):
+                return  # switched to a virtual transport while scanning
+            self.port_combo.clear()
             for p in ports:
                 self.port_combo.addItem(p)
             if not ports:
                 self.port_combo.addItem("(no ports found)")
+            idx = self.port_combo.findText(self._last_port)
+            if idx >= 0:
+                self.port_combo.setCurrentIndex(idx)
 
         def _on_transport_changed(self, _index: int) -> None:
             """Update port combo and vEEPROM menu when transport type changes."""
             self._refresh_ports()
             self._update_veeprom_menu_state()
 
+        def _set_connect_btn_state(self, connected: bool) -> None:
+            """Flip the [connected] property the window stylesheet keys on —
+            a re-polish, not a per-widget stylesheet parse."""
+            self.connect_btn.setProperty("connected", connected)
+            style = self.connect_btn.style()
+            style.unpolish(self.connect_btn)
+            style.polish(self.connect_btn)
+
         def _toggle_connect(self) -> None:
             if self._comm and self._comm.transport.is_open:
                 self._disconnect()
@@ -5661,7 +6533,7 @@ if GUI_AVAILABLE:
                 bin_path = self._vecu_bin_path
                 if not bin_path:
                     bin_path, _ = QFileDialog.getOpenFileName(
-                        self, "Select ECU Binary for Virtual ECU", "",
+                        self, "Select ECU Binary for Virtual ECU", self._bin_dir(),
                         "Bin Files (*.bin);;Cal Files (*.cal);;All Files (*)"
                     )
                 if not bin_path:
@@ -5677,14 +6549,15 @@ if GUI_AVAILABLE:
 
             self._comm = ECUComm(self._transport, self._config, self._log_cfg)
             self._comm.clear_callbacks()  # fresh comm — ensure no stale listeners
-            self._comm.on("log", lambda msg, level="info", **_: self.log_widget.append_log(msg, level))
+            # Also fires from the datalog thread — queue rather than touch the widget
+            self._comm.on("log", lambda msg, level="info", **_: self.log_widget.queue_log(msg, level))
 
             if self._comm.connect():
                 self.connect_btn.setText("Disconnect")
-                self.connect_btn.setStyleSheet("background: #8b1a1a;")
+                self._set_connect_btn_state(True)
                 self.connect_btn.setToolTip("Disconnect from the ECU")
-                self.read_btn.setEnabled(True)
-                self.write_btn.setEnabled(self._bin_data is not None)
+                self.read_btn.setEnabled(not self._bin_load_busy)
+                self.write_btn.setEnabled(self._bin_data is not None and not self._bin_load_busy)
                 self._update_state("CONNECTED")
                 self._update_menu_state(True)
                 self.dash_timer.start()
@@ -5731,42 +6604,89 @@ if GUI_AVAILABLE:
             if self._comm:
                 self._comm.disconnect()
             self.connect_btn.setText("Connect")
-            self.connect_btn.setStyleSheet("")
-            self.connect_btn.setToolTip(
-                "Connect to ECU via the selected port.\n"
-                "Performs echo detection, silences bus chatter, and identifies the PCM."
-            )
+            self._set_connect_btn_state(False)
+            self.connect_btn.setToolTip(_TIP_CONNECT)
             self.read_btn.setEnabled(False)
             self.write_btn.setEnabled(False)
             self._update_state("DISCONNECTED")
             self._update_menu_state(False)
 
+        def _bin_dir(self) -> str:
+            """Start open dialogs in the last bin's folder, not the CWD."""
+            return str(Path(self._bin_path).parent) if self._bin_path else ""
+
         def _load_bin(self) -> None:
-            path, _ = QFileDialog.getOpenFileName(self, "Open Bin File", "",
+            path, _ = QFileDialog.getOpenFileName(self, "Open Bin File", self._bin_dir(),
                                                    "Bin Files (*.bin);;All Files (*)")
-            if not path:
+            if not path or self._bin_load_busy:
                 return
+            # Read + checksum + SHA-256 can stall on slow disks / network
+            # shares — do it off the GUI thread like the port scan
+            self._bin_load_busy = True
+            # No read/write until the new bin lands — either would race it for _bin_data
+            self.read_btn.setEnabled(False)
+            self.write_btn.setEnabled(False)
+            self._update_menu_state(self._link_open())
+            threading.Thread(target=self._read_bin, args=(path,),
+                             name="bin-load", daemon=True).start()
+
+        def _read_bin(self, path: str) -> None:
+            """Background thread: load and check a bin, then hand it to the GUI."""
             try:
-                self._bin_data = BinFile.load(path)
-                self._bin_path = path
-                fname = Path(path).name
-                os_id = BinFile.get_os_id(self._bin_data)
-                cs_ok = BinFile.verify_checksum(self._bin_data)
-                cs_str = "✓" if cs_ok else "✗ (will auto-fix)"
-                self.file_label.setText(f"{fname} | OS:{os_id} | CS:{cs_str}")
-                self.file_label.setStyleSheet("color: #4fc3f7;")
-                self.save_btn.setEnabled(True)
-                if self._comm and self._comm.transport.is_open:
-                    self.write_btn.setEnabled(True)
-                self._update_menu_state(self._comm is not None and self._comm.transport.is_open if self._comm else False)
-
-                # Load default table into editor
-                self.table_editor.load_table("spark_hi_oct", self._bin_data)
-
-                self.log_widget.append_log(f"Loaded: {fname} ({os_id}, checksum {'OK' if cs_ok else 'MISMATCH'})",
-                                           "info")
+                data = BinFile.load(path)
+                os_id = BinFile.get_os_id(data)
+                cs_ok = BinFile.verify_checksum(data)
+                # Hash the buffer that will be flashed, not the file as it is now
+                log.info("Loaded %s sha256=%s", path, hashlib.sha256(data).hexdigest())
             except Exception as e:
-                self.log_widget.append_log(f"Failed to load bin: {e}", "error")
+                try:
+                    self.bin_load_failed.emit(path, str(e))
+                except RuntimeError:
+                    pass  # window closed mid-load
+                return
+            try:
+                self.bin_loaded.emit(path, data, os_id, cs_ok)
+            except RuntimeError:
+                pass
+
+        def _link_open(self) -> bool:
+            return self._comm is not None and self._comm.transport.is_open
+
+        def _on_bin_loaded(self, path: str, data: bytearray, os_id: str, cs_ok: bool) -> None:
+            self._bin_load_busy = False
+            if self._flash_active:
+                # A flash started while this was loading; swapping the bin
+                # under it is unsafe, and the unlock restores the buttons
+                self.log_widget.append_log(
+                    f"Ignored {Path(path).name}: loaded during a flash operation — load it again",
+                    "warning")
+                return
+            self._bin_data = data
+            self._bin_path = path
+            fname = Path(path).name
+            cs_str = "✓" if cs_ok else "✗ (will auto-fix)"
+            self.file_label.setText(f"{fname} | OS:{os_id} | CS:{cs_str}")
+            self.file_label.setStyleSheet("color: #4fc3f7;")
+            self.save_btn.setEnabled(True)
+            connected = self._link_open()
+            self.read_btn.setEnabled(connected)
+            self.write_btn.setEnabled(connected)
+            self._update_menu_state(connected)
+
+            # Load default table into editor
+            self.table_editor.load_table("spark_hi_oct", self._bin_data)
+
+            self.log_widget.append_log(f"Loaded: {fname} ({os_id}, checksum {'OK' if cs_ok else 'MISMATCH'})",
+                                       "info")
+
+        def _on_bin_load_failed(self, path: str, error: str) -> None:
+            self._bin_load_busy = False
+            if not self._flash_active:
+                connected = self._link_open()
+                self.read_btn.setEnabled(connected)
+                self.write_btn.setEnabled(connected and self._bin_data is not None)
+                self._update_menu_state(connected)
+            self.log_widget.append_log(f"Failed to load bin: {error}", "error")
 
         def _save_bin(self) -> None:
             if not self._bin_data:
@@ -5910,8 +6830,8 @@ if GUI_AVAILABLE:
 
             self.cancel_btn.setEnabled(False)
             self.action_cancel.setEnabled(False)
-            self.read_btn.setEnabled(True)
-            self.write_btn.setEnabled(self._bin_data is not None)
+            self.read_btn.setEnabled(not self._bin_load_busy)
+            self.write_btn.setEnabled(self._bin_data is not None and not self._bin_load_busy)
             self._update_menu_state(True)
             self.options_tab.apply_btn.setEnabled(True)
             self.options_tab.reset_btn.setEnabled(True)
@@ -5948,7 +6868,8 @@ if GUI_AVAILABLE:
             worker.finished.connect(self._on_flash_finished)
             worker.read_data.connect(self._on_read_data)
             worker.progress.connect(self._on_flash_progress)
-            worker.log_message.connect(lambda msg, lvl: self.log_widget.append_log(msg, lvl))
+            worker.log_sink = self.log_widget.queue_log
+            worker.log_message.connect(self.log_widget.queue_log)  # only used without a sink
             worker.state_changed.connect(self._update_state)
             worker.finished.connect(self._flash_thread.quit)
             # Clean up Qt objects when thread finishes (#8 fix)
@@ -5986,6 +6907,7 @@ if GUI_AVAILABLE:
         def _on_flash_finished(self, success: bool) -> None:
             self._unlock_ui_after_flash()
             self.progress_bar.setValue(100 if success else 0)
+            self.log_widget.flush_pending(0)  # worker's last lines before the verdict
 
             if success:
                 self.log_widget.append_log("Operation completed successfully!", "success")
@@ -6194,10 +7116,11 @@ if GUI_AVAILABLE:
 
         def _update_menu_state(self, connected: bool) -> None:
             """Sync menu action enabled state with connection status."""
-            self.action_read_ecu.setEnabled(connected)
+            ops = connected and not self._bin_load_busy  # a pending load may swap _bin_data
+            self.action_read_ecu.setEnabled(ops)
             has_bin = self._bin_data is not None
-            self.action_write_bin.setEnabled(connected and has_bin)
-            self.action_write_cal.setEnabled(connected and has_bin)
+            self.action_write_bin.setEnabled(ops and has_bin)
+            self.action_write_cal.setEnabled(ops and has_bin)
             self.action_save.setEnabled(has_bin)
             self.action_save_as.setEnabled(has_bin)
             self.action_save_cal.setEnabled(has_bin)
@@ -6262,7 +7185,7 @@ if GUI_AVAILABLE:
         def _veeprom_load(self) -> None:
             """Load a .bin file into the virtual flash image."""
             path, _ = QFileDialog.getOpenFileName(
-                self, "Load .bin to vEEPROM", "",
+                self, "Load .bin to vEEPROM", self._bin_dir(),
                 "Bin Files (*.bin);;Cal Files (*.cal);;All Files (*)"
             )
             if not path:
@@ -6383,6 +7306,7 @@ if GUI_AVAILABLE:
 
             if self._logger and self._logger.running:
                 self._logger.stop()
+            self.disassembler_tab.stop_worker()
             if self._comm and self._comm.transport.is_open:
                 self._comm.disconnect()
             # Persist settings to disk if enabled
@@ -6403,16 +7327,28 @@ def cli_log_callback(msg: str, level: str = "info", **kwargs) -> None:
     prefix = {"info": "  ", "warning": "⚠ ", "error": "✗ ", "success": "✓ ", "debug": "  "}
     print(f"{prefix.get(level, '  ')}{msg}")
 
+# (percent, label) last drawn by cli_progress_callback
+_cli_progress_last: Tuple[int, str] = (-1, "")
+
+
 def cli_progress_callback(current: int, total: int, label: str = "", **kwargs) -> None:
-    """Print progress to console."""
+    """
+    Print progress to console. Redraws only when the whole percent or label
+    changes — a full read fires thousands of ticks, each of which used to
+    cost a console write + flush.
+    """
+    global _cli_progress_last
     if total > 0:
-        pct = (current / total) * 100
+        pct = current * 100 // total
+        done = current >= total
+        if (pct, label) == _cli_progress_last and not done:
+            return
+        _cli_progress_last = (-1, "") if done else (pct, label)
         bar_len = 40
-        filled = int(bar_len * current / total)
+        filled = bar_len * current // total
         bar = "█" * filled + "░" * (bar_len - filled)
-        print(f"\r  {label} [{bar}] {pct:.0f}%", end="", flush=True)
-        if current >= total:
-            print()
+        sys.stdout.write(f"\r  {label} [{bar}] {pct}%" + ("\n" if done else ""))
+        sys.stdout.flush()
 
 def run_cli(args: argparse.Namespace) -> int:
     """Run the CLI interface."""
@@ -6429,9 +7365,10 @@ def run_cli(args: argparse.Namespace) -> int:
             return 1
         transport = LoopbackTransport(bin_path=bin_file)
     elif args.transport == "d2xx":
-        transport = D2XXTransport(args.device_index or 0, args.baud)
+        transport = D2XXTransport(args.device_index or 0, args.baud,
+                                  rx_thread=getattr(args, 'rx_thread', False))
     else:
-        transport = PySerialTransport(args.port, args.baud)
+        transport = PySerialTransport(args.port, args.baud, rx_thread=getattr(args, 'rx_thread', False))
 
     config = CommConfig(
         device_id=int(args.device_id, 16) if args.device_id else DeviceID.VX_VY_F7,
@@ -6442,6 +7379,7 @@ def run_cli(args: argparse.Namespace) -> int:
         high_speed_read=args.high_speed,
         ignore_echo=getattr(args, 'ignore_echo', True),
         inter_frame_delay_ms=getattr(args, 'inter_frame_delay', DEFAULT_INTER_FRAME_DELAY_MS),
+        adaptive_timing=getattr(args, 'adaptive_timing', False),
         auto_checksum_fix=getattr(args, 'auto_checksum', True),
     )
 
@@ -6486,6 +7424,7 @@ def run_cli(args: argparse.Namespace) -> int:
                 print("✗ No input file specified (use --input)")
                 return 1
             bin_data = BinFile.load(args.input)
+            print(f"  SHA-256: {BinFile.digest(args.input)}")
 
             # Checksum fix
             if not BinFile.verify_checksum(bin_data):
@@ -6494,7 +7433,9 @@ def run_cli(args: argparse.Namespace) -> int:
 
             flash_op = FlashOp(comm)
             mode = args.write_mode or "BIN"
-            success = flash_op.full_write(bin_data, mode)
+            prioritize_flash_thread()
+            with gc_paused():
+                success = flash_op.full_write(bin_data, mode)
             return 0 if success else 1
 
         elif args.command == "datalog":
@@ -6664,7 +7605,13 @@ Examples:
                          help="Do not strip echo bytes")
         sub.add_argument("--inter-frame-delay", type=int, default=DEFAULT_INTER_FRAME_DELAY_MS,
                          help=f"Inter-frame delay in ms (default: {DEFAULT_INTER_FRAME_DELAY_MS})")
+        sub.add_argument("--adaptive-timing", dest="adaptive_timing", action="store_true", default=False,
+                         help="Shrink the inter-frame delay on clean exchanges, back off on retries")
+        sub.add_argument("--no-adaptive-timing", dest="adaptive_timing", action="store_false",
+                         help="Always use the fixed inter-frame delay (default)")
         sub.add_argument("--device-index", type=int, help="FTDI device index (for D2XX)")
+        sub.add_argument("--rx-thread", action="store_true",
+                         help="Drain the port on a background reader thread")
 
     return parser
 
@@ -144,6 +144,25 @@ class TestLogWidget:
         w = kcf.LogWidget()
         assert w.isReadOnly()
 
+    def test_queued_lines_flush_in_one_batch(self):
+        w = kcf.LogWidget()
+        w.queue_log("from worker", "warning")
+        w.queue_log("a <b> & c\nsecond line", "error")
+        assert w.toPlainText() == ""
+        w.flush_pending()
+        text = w.toPlainText()
+        assert "from worker" in text
+        assert "a <b> & c" in text and "second line" in text
+        assert not w._pending
+
+    def test_direct_append_shows_queued_lines_first(self):
+        w = kcf.LogWidget()
+        w.queue_log("Timeout waiting for echo", "error")
+        w.append_log("Connection failed", "error")
+        text = w.toPlainText()
+        assert text.index("Timeout waiting for echo") < text.index("Connection failed")
+        assert not w._pending
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SENSOR GAUGE WIDGET
@@ -173,6 +192,15 @@ class TestSensorGaugeWidget:
         w = kcf.SensorGaugeWidget(param)
         w.update_value(-40.0)  # should not crash
 
+    def test_value_formatting(self):
+        w = kcf.SensorGaugeWidget(kcf.PARAM_BY_NAME["RPM"])
+        for val, text in ((1500.4, "1500"), (12.34, "12.3"), (-5.0, "-5.00")):
+            w.update_value(val)
+            assert w.value_label.text() == text
+        flags = kcf.SensorGaugeWidget(kcf.PARAM_BY_NAME["Status 32"])
+        flags.update_value(171.0)
+        assert flags.value_label.text() == "0xAB"
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # DASHBOARD WIDGET
@@ -198,6 +226,16 @@ class TestDashboardWidget:
         w = kcf.DashboardWidget()
         w.update_data({"Unknown Param XYZ": 42.0})
 
+    def test_update_data_skips_unchanged_values(self):
+        w = kcf.DashboardWidget()
+        w.update_data({"RPM": 800.0})
+        gauge = w.gauges["RPM"]
+        gauge.value_label.setText("stale")
+        w.update_data({"RPM": 800.0})
+        assert gauge.value_label.text() == "stale"
+        w.update_data({"RPM": 850.0})
+        assert gauge.value_label.text() == "850.0"
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # TABLE EDITOR WIDGET
@@ -234,6 +272,20 @@ class TestTableEditorWidget:
         w.load_table("spark_hi_oct", full_bin)
         w.highlight_cell(999, 999)  # should handle gracefully
 
+    def test_highlight_moves_and_tracks_edits(self, full_bin):
+        w = kcf.TableEditorWidget()
+        w.load_table("spark_hi_oct", full_bin)
+        edits = []
+        w.cell_changed.connect(lambda r, c, v: edits.append((r, c, v)))
+        w.grid.item(1, 1).setText(str(w._rom_values[1][1] + 1))
+        assert w._modified_cells == {(1, 1)}
+        assert w.grid.item(1, 1).background().color() == kcf.QColor(100, 60, 0)
+        w.highlight_cell(0, 0)
+        w.highlight_cell(0, 1)
+        assert w.grid.item(0, 0).background().color() == kcf.QColor(30, 30, 30)
+        assert w.grid.item(0, 1).background().color() == kcf.QColor(0, 100, 0)
+        assert len(edits) == 1  # repaints are not reported as edits
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # DISASSEMBLER WIDGET
@@ -251,6 +303,38 @@ class TestDisassemblerWidget:
         w._on_clear()
         assert w.asm_output.toPlainText() == ""
 
+    def test_disassemble_writes_colored_lines(self):
+        w = kcf.DisassemblerWidget()
+        w.hex_input.setPlainText("86 55 BD 80 00 39")  # LDAA #$55; JSR $8000; RTS
+        emitted = []
+        w.disassembly_done.connect(lambda lines, base: emitted.append(lines))
+        w._on_disassemble()
+        assert w.asm_output.toPlainText().split("\n") == emitted[0]
+        jsr = w.asm_output.document().findBlockByNumber(1)
+        assert jsr.begin().fragment().charFormat().foreground().color() == kcf.QColor(86, 216, 177)
+
+    def test_large_paste_decodes_in_worker_thread(self, qapp):
+        w = kcf.DisassemblerWidget()
+        w.hex_input.setPlainText("01 " * (w.THREADED_MIN_CHARS // 3 + 1))  # NOPs
+        w._on_disassemble()
+        assert not w.btn_disasm.isEnabled()
+        deadline = time.monotonic() + 10
+        while w._disasm_thread is not None and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        assert w.btn_disasm.isEnabled()
+        assert w.asm_output.document().blockCount() == w.THREADED_MIN_CHARS // 3 + 1
+
+    def test_close_waits_for_worker_thread(self, qapp):
+        w = kcf.DisassemblerWidget()
+        w.hex_input.setPlainText("01 " * (w.THREADED_MIN_CHARS // 3 + 1))
+        w._on_disassemble()
+        thread = w._disasm_thread
+        w.close()
+        assert thread.isFinished()
+        qapp.processEvents()
+        assert w._disasm_thread is None
+
     def test_has_hex_input(self):
         w = kcf.DisassemblerWidget()
         assert hasattr(w, 'hex_input')
@@ -282,6 +366,21 @@ class TestOptionsWidget:
         assert w.chk_ignore_echo.isChecked() is True
         assert w.chk_auto_checksum.isChecked() is True
 
+    def test_loads_device_id(self):
+        w = kcf.OptionsWidget(kcf.CommConfig(device_id=0xF4))
+        assert w.combo_device_id.currentData() == 0xF4
+
+    def test_loads_enum_device_id(self):
+        w = kcf.OptionsWidget(kcf.CommConfig(device_id=kcf.DeviceID.VR_F4))
+        assert w.combo_device_id.currentData() == 0xF4
+
+    def test_reset_restores_default_device_id(self):
+        config = kcf.CommConfig(device_id=0xF4)
+        w = kcf.OptionsWidget(config)
+        w._on_reset()
+        assert w.combo_device_id.currentData() == 0xF7
+        assert config.device_id == kcf.DeviceID.VX_VY_F7
+
     def test_apply_to_config(self):
         config = kcf.CommConfig()
         w = kcf.OptionsWidget(config)
@@ -377,6 +476,24 @@ class TestFlashWorker:
         w.setup_write(data, "CAL")
         assert w._mode == "CAL"
 
+    def test_progress_coalesced_per_percent(self, loopback_comm):
+        w = kcf.FlashWorker(loopback_comm)
+        seen = []
+        w.progress.connect(lambda cur, tot, label: seen.append((cur, label)))
+        for cur in range(0, 4097, 16):
+            w._emit_progress(cur, 4096, "Reading")
+        w._emit_progress(4096, 4096, "Verifying")
+        assert len(seen) == 102  # 0..100 % plus the label change
+        assert seen[-1] == (4096, "Verifying")
+
+    def test_own_and_comm_lines_share_the_sink(self, loopback_comm):
+        w = kcf.FlashWorker(loopback_comm)
+        lines, signalled = [], []
+        w.log_message.connect(lambda msg, level: signalled.append(msg))
+        w.log_sink = lambda msg, level: lines.append(msg)
+        w._log("worker line")
+        assert lines == ["worker line"] and signalled == []
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # MAIN WINDOW — STRUCTURE
@@ -675,6 +792,31 @@ class TestMainWindowActions:
         main_window._refresh_ports()
         # Should not crash; port list may be empty
 
+    def test_refresh_ports_scans_in_background(self, main_window, qapp, monkeypatch):
+        monkeypatch.setattr(kcf, "SERIAL_AVAILABLE", True)
+        monkeypatch.setattr(kcf.PySerialTransport, "list_ports",
+                            staticmethod(lambda: ["/dev/ttyUSB0", "/dev/ttyUSB1"]))
+        main_window.transport_combo.setCurrentIndex(
+            main_window.transport_combo.findData("pyserial"))
+
+        def wait_scan():
+            deadline = time.monotonic() + 5
+            while main_window._port_scan_busy and time.monotonic() < deadline:
+                qapp.processEvents()
+                time.sleep(0.01)
+
+        def scan():
+            main_window._refresh_ports()
+            assert main_window.port_combo.currentText() == "(scanning…)"
+            wait_scan()
+
+        wait_scan()  # startup scan
+        scan()
+        assert main_window.port_combo.count() == 2
+        main_window.port_combo.setCurrentIndex(1)
+        scan()
+        assert main_window.port_combo.currentText() == "/dev/ttyUSB1"  # selection kept
+
     def test_cancel_op_no_comm(self, main_window):
         """Cancel without a connection should not crash."""
         main_window._comm = None
@@ -735,8 +877,11 @@ class TestMainWindowLoopbackConnect:
                 break
         main_window._toggle_connect()  # connects
         assert main_window.connect_btn.text() == "Disconnect"
+        assert main_window.connect_btn.property("connected") is True
         main_window._toggle_connect()  # disconnects
         assert main_window.connect_btn.text() == "Connect"
+        assert main_window.connect_btn.property("connected") is False
+        assert main_window.connect_btn.styleSheet() == ""
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -746,7 +891,14 @@ class TestMainWindowLoopbackConnect:
 class TestMainWindowBinOps:
     """Tests for bin load/save with mocked file dialogs."""
 
-    def test_load_bin_via_mock(self, main_window, full_bin, tmp_path):
+    @staticmethod
+    def _wait_load(qapp, main_window):
+        deadline = time.monotonic() + 5
+        while main_window._bin_load_busy and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+    def test_load_bin_via_mock(self, qapp, main_window, full_bin, tmp_path):
         """Mock the file dialog and load a bin."""
         p = tmp_path / "test_load.bin"
         kcf.BinFile.fix_checksum(full_bin)
@@ -755,10 +907,16 @@ class TestMainWindowBinOps:
         with patch.object(kcf, 'QFileDialog') as mock_dlg:
             mock_dlg.getOpenFileName.return_value = (str(p), "")
             main_window._load_bin()
+        self._wait_load(qapp, main_window)
         assert main_window._bin_data is not None
         assert len(main_window._bin_data) == 131072
         assert main_window.save_btn.isEnabled()
 
+        with patch.object(kcf, 'QFileDialog') as mock_dlg:
+            mock_dlg.getOpenFileName.return_value = ("", "")
+            main_window._load_bin()
+        assert mock_dlg.getOpenFileName.call_args[0][2] == str(tmp_path)  # reopens in last folder
+
     def test_load_bin_cancelled(self, main_window):
         """If file dialog is cancelled, nothing should change."""
         main_window._bin_data = None
@@ -767,6 +925,58 @@ class TestMainWindowBinOps:
             main_window._load_bin()
         assert main_window._bin_data is None
 
+    def test_load_bin_bad_size_keeps_previous(self, qapp, main_window, full_bin, tmp_path):
+        """A failed background load reports the error and leaves the bin alone."""
+        p = tmp_path / "short.bin"
+        p.write_bytes(b"\xFF" * 100)
+        main_window._bin_data = full_bin
+        with patch.object(kcf, 'QFileDialog') as mock_dlg:
+            mock_dlg.getOpenFileName.return_value = (str(p), "")
+            main_window._load_bin()
+        assert main_window._bin_load_busy
+        self._wait_load(qapp, main_window)
+        assert not main_window._bin_load_busy
+        assert main_window._bin_data is full_bin
+        assert "Failed to load bin" in main_window.log_widget.toPlainText()
+
+    def test_load_logs_hash_of_loaded_buffer(self, main_window, full_bin, tmp_path, caplog):
+        import hashlib
+        p = tmp_path / "changed_on_disk.bin"
+        p.write_bytes(b"\x00" * 131072)
+        with patch.object(kcf.BinFile, "load", return_value=full_bin), \
+                caplog.at_level(logging.INFO, logger="flasher"):
+            main_window._read_bin(str(p))
+        assert f"sha256={hashlib.sha256(full_bin).hexdigest()}" in caplog.text
+
+    def test_read_write_locked_while_loading(self, qapp, main_window, full_bin, tmp_path):
+        for i in range(main_window.transport_combo.count()):
+            if main_window.transport_combo.itemData(i) == "loopback":
+                main_window.transport_combo.setCurrentIndex(i)
+                break
+        main_window._connect()
+        p = tmp_path / "next.bin"
+        kcf.BinFile.save(str(p), full_bin)
+        with patch.object(kcf, 'QFileDialog') as mock_dlg:
+            mock_dlg.getOpenFileName.return_value = (str(p), "")
+            main_window._load_bin()
+        assert not main_window.read_btn.isEnabled()
+        assert not main_window.write_btn.isEnabled()
+        assert not main_window.action_read_ecu.isEnabled()
+        self._wait_load(qapp, main_window)
+        assert main_window.read_btn.isEnabled()
+        assert main_window.write_btn.isEnabled()
+        main_window._disconnect()
+
+    def test_bin_loaded_during_flash_is_ignored(self, main_window, full_bin):
+        main_window._bin_data = full_bin
+        main_window._lock_ui_for_flash("read")
+        main_window._on_bin_loaded("other.bin", bytearray(131072), "OS", True)
+        assert main_window._bin_data is full_bin
+        assert not main_window.write_btn.isEnabled()
+        assert not main_window.read_btn.isEnabled()
+        assert "Ignored other.bin" in main_window.log_widget.toPlainText()
+        main_window._unlock_ui_after_flash()
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # CLI ARGS — NEW FLAGS
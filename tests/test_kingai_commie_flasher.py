@@ -131,6 +131,16 @@ class TestLogging:
         log_files = list(log_dir.glob("test_unique_name_5_*.log"))
         assert len(log_files) == 1
 
+    def test_file_lines_keep_wall_clock_stamp(self, tmp_path):
+        log_dir = tmp_path / "test_logs_stamp"
+        logger = kcf.setup_logging("test_unique_name_6", log_dir=log_dir)
+        assert logger.propagate
+        handler = next(h for h in logger.handlers if isinstance(h, logging.FileHandler))
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg", None, None)
+        plain = logging.Formatter(handler.formatter._fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        assert handler.formatter.format(record) == plain.format(record)
+        assert handler.formatter.format(record) == plain.format(record)  # cached second
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 1 — CONSTANTS & ENUMS
@@ -220,6 +230,14 @@ class TestDataStreamParams:
         names = [p.name for p in kcf.MODE1_MSG0_PARAMS]
         assert len(names) == len(set(names))
 
+    def test_soa_columns_match_params(self):
+        for i, p in enumerate(kcf.MODE1_MSG0_PARAMS):
+            assert kcf.MSG0_NAMES[i] == p.name
+            assert kcf.MSG0_PKT_OFFSETS[i] == p.pkt_offset
+            assert kcf.MSG0_SIZES[i] == p.size
+            assert kcf.MSG0_SCALES[i] == p.scale
+            assert kcf.MSG0_OFFSETS[i] == p.offset_val
+
     def test_all_params_have_units(self):
         for p in kcf.MODE1_MSG0_PARAMS:
             # units can be empty string for status flags
@@ -274,6 +292,12 @@ class TestFlashKernel:
         for b in blocks:
             assert isinstance(b, bytearray)
 
+    def test_exec_blocks_cached(self):
+        for high_speed in (False, True):
+            cached = kcf.FlashKernel.exec_blocks(high_speed)
+            assert cached is kcf.FlashKernel.exec_blocks(high_speed)
+            assert list(cached) == kcf.FlashKernel.get_exec_blocks(high_speed)
+
     def test_high_speed_patch(self):
         normal = kcf.FlashKernel.get_exec_blocks(high_speed=False)
         fast = kcf.FlashKernel.get_exec_blocks(high_speed=True)
@@ -291,6 +315,27 @@ class TestFlashKernel:
         frame = kcf.FlashKernel.get_write_bank_frame(0x58)
         assert frame[157] == 0x58
 
+    def test_prepatched_erase_frames(self):
+        for (bank, sector), frame in kcf.ERASE_SECTOR_FRAMES.items():
+            assert frame[105] == bank
+            assert frame[106] == sector
+            assert len(frame) == 201
+            assert kcf.ALDLProtocol.verify_checksum(frame)
+        assert len(kcf.ERASE_SECTOR_FRAMES) == len(kcf.ERASE_MAP_PROM)
+
+    def test_prepatched_write_bank_frames(self):
+        for bank, _, _, _ in kcf.BANK_WRITE_MAP:
+            frame = kcf.WRITE_BANK_FRAMES[bank]
+            assert frame[157] == bank
+            assert kcf.ALDLProtocol.verify_checksum(frame)
+
+    def test_prepatched_upload_frames(self):
+        for high_speed, frames in kcf.KERNEL_UPLOAD_FRAMES.items():
+            blocks = kcf.FlashKernel.get_exec_blocks(high_speed)
+            for block, frame in zip(blocks, frames):
+                assert frame[:len(block)] == bytes(block)
+                assert kcf.ALDLProtocol.verify_checksum(frame)
+
     def test_kernel_blocks_not_empty(self):
         assert len(kcf.FlashKernel.EXEC_BLOCK_0) > 0
         assert len(kcf.FlashKernel.EXEC_BLOCK_1) > 0
@@ -326,6 +371,22 @@ class TestALDLProtocol:
         frame = kcf.ALDLProtocol.build_simple_frame(0xF7, 0x08)
         assert kcf.ALDLProtocol.verify_checksum(frame)
 
+    def test_built_frames_are_wire_length(self):
+        P = kcf.ALDLProtocol
+        frames = [
+            P.build_simple_frame(0xF7, 0x08, b"\x01\x02"),
+            P.build_mode2_read(0xF7, 0x8000),
+            P.build_mode2_read(0xF7, 0x18000, extended=True),
+            P.build_key_response(0xF7, 0x1234),
+            P.build_silence_frame(0xF7),
+            P.build_write_frame(0xF7, 0x12345, bytes(32)),
+            P.build_write_frame(0xF7, 0x1234, bytes(16), extended=False),
+            P.write_frame_builder(0xF7, 32)(0x12345, bytes(32)),
+        ]
+        for frame in frames:
+            assert len(frame) == P.wire_length(frame)
+            assert P.verify_checksum(frame)
+
     def test_verify_checksum_detects_corruption(self):
         frame = kcf.ALDLProtocol.build_simple_frame(0xF7, 0x08)
         frame[2] ^= 0xFF  # corrupt mode byte
@@ -387,6 +448,12 @@ class TestALDLProtocol:
         assert frame[2] == kcf.ALDLMode.MODE8_SILENCE
         assert kcf.ALDLProtocol.verify_checksum(frame)
 
+    def test_static_frames_are_cached(self):
+        a = kcf.ALDLProtocol.build_silence_frame(0xF7)
+        assert a is kcf.ALDLProtocol.build_silence_frame(0xF7)
+        assert isinstance(a, bytes)
+        assert kcf.ALDLProtocol.build_silence_frame(0xF4)[0] == 0xF4
+
     def test_build_unsilence_frame(self):
         frame = kcf.ALDLProtocol.build_unsilence_frame(0xF7)
         assert frame[2] == kcf.ALDLMode.MODE9_UNSILENCE
@@ -455,11 +522,36 @@ class TestALDLProtocol:
         assert "ECT Temp" in result
         assert result["ECT Temp"] == pytest.approx(50.0)
 
+    def test_parse_mode1_signed_param(self, monkeypatch):
+        bias = list(kcf.MSG0_SIGN_BIAS)
+        i = kcf.MSG0_NAMES.index("ECT Temp")
+        bias[i] = 0x80
+        monkeypatch.setattr(kcf, "MSG0_SIGN_BIAS", tuple(bias))
+        data = bytearray(60)
+        data[5] = 0xF0  # -16 → -16*0.75 - 40 = -52°C
+        result = kcf.ALDLProtocol.parse_mode1_response(data)
+        assert result["ECT Temp"] == pytest.approx(-52.0)
+
+    def test_parse_mode1_struct_matches_per_param(self, monkeypatch):
+        data = bytes((i * 37 + 11) & 0xFF for i in range(60))
+        fast = kcf.ALDLProtocol.parse_mode1_response(data)
+        monkeypatch.setattr(kcf, "MSG0_STRUCT", None)
+        assert kcf.ALDLProtocol.parse_mode1_response(data) == fast
+
     def test_parse_mode1_returns_all_known(self):
         data = bytearray(60)
         result = kcf.ALDLProtocol.parse_mode1_response(data)
         assert len(result) >= 30  # we have ~45 params, most fit in 60 bytes
 
+    def test_write_frame_builder_matches_generic(self):
+        data = bytes(range(0x40, 0x60))
+        for extended in (True, False):
+            build = kcf.ALDLProtocol.write_frame_builder(0xF7, len(data), 0x10, extended)
+            assert build is kcf.ALDLProtocol.write_frame_builder(0xF7, len(data), 0x10, extended)
+            for addr in (0x0000, 0x8000, 0x1FFE0):
+                expected = kcf.ALDLProtocol.build_write_frame(0xF7, addr, data, 0x10, extended)
+                assert build(addr, data) == expected
+
     def test_all_built_frames_have_valid_checksums(self):
         """Spot-check that every frame builder produces valid checksums."""
         frames = [
@@ -492,6 +584,19 @@ class TestLoopbackTransport:
         t.close()
         assert not t.is_open
 
+    def test_vecu_loads_bin_files(self, tmp_path):
+        cal = tmp_path / "cal.bin"
+        cal.write_bytes(b"\xAA" * 16384)
+        t = kcf.LoopbackTransport(bin_path=str(cal))
+        assert len(t._simulated_bin) == 131072
+        assert t._simulated_bin[0x3FFF] == 0xFF
+        assert t._simulated_bin[0x4000:0x8000] == b"\xAA" * 16384
+        assert t._simulated_bin[0x8000] == 0xFF
+        full = tmp_path / "full.bin"
+        full.write_bytes(bytes(range(256)) * 512)
+        t = kcf.LoopbackTransport(bin_path=str(full))
+        assert t._simulated_bin == bytes(range(256)) * 512
+
     def test_write_read_loopback(self, loopback_transport):
         """Writing a silence frame should produce a simulated response."""
         frame = kcf.ALDLProtocol.build_silence_frame(0xF7)
@@ -508,6 +613,15 @@ class TestLoopbackTransport:
         loopback_transport.flush_input()
         assert loopback_transport.bytes_available == 0
 
+    def test_partial_reads_advance_cursor(self, loopback_transport):
+        t = loopback_transport
+        t.flush_input()
+        t._rx_buffer.extend(b"\x00\x01\x02\x03\x04")
+        assert t.read(2) == b"\x00\x01"
+        assert t.bytes_available == 3
+        assert t.read(10) == b"\x02\x03\x04"
+        assert t.bytes_available == 0
+
     def test_mode1_response_has_sensor_data(self, loopback_transport):
         frame = kcf.ALDLProtocol.build_mode1_request(0xF7)
         wl = kcf.ALDLProtocol.wire_length(frame)
@@ -516,6 +630,14 @@ class TestLoopbackTransport:
         # Should have device_id, length, mode, 60 sensor bytes, checksum
         assert len(resp) >= 63
 
+    def test_mode16_write_follows_nor_and_rule(self, loopback_transport):
+        t = loopback_transport
+        t._simulated_bin[0x100:0x104] = b"\xFF\xF0\x0F\x00"
+        t._write_bank_pcm_base = 0
+        frame = kcf.ALDLProtocol.build_write_frame(0xF7, 0x100, b"\x5A\x5A\x5A\x5A")
+        t.write(bytes(frame))
+        assert t._simulated_bin[0x100:0x104] == b"\x5A\x50\x0A\x00"
+
     def test_seed_request_response(self, loopback_transport):
         frame = kcf.ALDLProtocol.build_seed_request(0xF7)
         wl = kcf.ALDLProtocol.wire_length(frame)
@@ -524,6 +646,126 @@ class TestLoopbackTransport:
         assert len(resp) >= 6  # dev, len, mode, subcmd, seed_hi, seed_lo, cs
 
 
+class TestRxBuffer:
+    """Tests for the cursor-based receive buffer used by the serial transports."""
+
+    def test_feed_take_in_order(self):
+        rx = kcf.RxBuffer()
+        rx.feed(b"\x01\x02\x03")
+        rx.feed(b"\x04")
+        assert len(rx) == 4
+        assert rx.take(2) == b"\x01\x02"
+        assert rx.take(5) == b"\x03\x04"
+        assert len(rx) == 0
+
+    def test_compaction_keeps_unread_bytes(self):
+        rx = kcf.RxBuffer()
+        data = bytes(range(256)) * 40
+        rx.feed(data)
+        out = b"".join(rx.take(100) for _ in range(60))
+        assert out == data[:6000]
+        assert rx.take(len(rx)) == data[6000:]
+
+    def test_clear(self):
+        rx = kcf.RxBuffer()
+        rx.feed(b"abc")
+        rx.clear()
+        assert len(rx) == 0
+        assert rx.take(1) == b""
+
+    def test_reader_thread_feeds_buffer(self):
+        chunks = [b"\xF7\x56", b"\x08\xAB"]
+
+        def read_fn():
+            time.sleep(0.01)
+            return chunks.pop(0) if chunks else b""
+
+        reader = kcf.RxReaderThread(read_fn, kcf.RxBuffer())
+        reader.start()
+        try:
+            assert reader.take(4, timeout_s=2.0) == b"\xF7\x56\x08\xAB"
+            assert reader.take(1, timeout_s=0.05) == b""
+        finally:
+            reader.stop()
+        assert not reader.is_alive()
+
+    def test_reader_wait_data(self):
+        chunks = [b"", b"", b"\xF7"]
+
+        def read_fn():
+            time.sleep(0.01)
+            return chunks.pop(0) if chunks else b""
+
+        reader = kcf.RxReaderThread(read_fn, kcf.RxBuffer())
+        reader.start()
+        try:
+            assert reader.wait_data(timeout_s=2.0)
+            reader.clear()
+            assert not reader.wait_data(timeout_s=0.05)
+        finally:
+            reader.stop()
+
+    def test_reader_drops_chunk_pulled_before_flush(self):
+        """A chunk the driver returned during the flush is stale — drop it."""
+        import threading
+        in_read, release = threading.Event(), threading.Event()
+        calls = []
+
+        def read_fn():
+            calls.append(1)
+            if len(calls) == 1:
+                in_read.set()
+                release.wait(2.0)
+                return b"\xEE\xEE"  # pulled before the purge
+            time.sleep(0.01)
+            return b""
+
+        def reset_driver():
+            release.set()
+            deadline = time.monotonic() + 2.0
+            while len(calls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.005)  # let the reader finish with the stale chunk
+
+        reader = kcf.RxReaderThread(read_fn, kcf.RxBuffer())
+        reader.start()
+        try:
+            assert in_read.wait(2.0)
+            reader.clear(reset_driver)
+            assert reader.take(1, timeout_s=0.05) == b""
+        finally:
+            reader.stop()
+
+
+@pytest.mark.skipif(not kcf.SERIAL_AVAILABLE, reason="pyserial not installed")
+class TestPySerialTransport:
+    """PySerialTransport open-time port setup (serial.Serial mocked)."""
+
+    def test_open_requests_low_latency(self):
+        with patch.object(kcf.serial, "Serial") as ser_cls:
+            t = kcf.PySerialTransport("/dev/ttyUSB0")
+            t.open()
+        ser_cls.return_value.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_read_raises_when_reader_died(self):
+        with patch.object(kcf.serial, "Serial") as ser_cls:
+            ser_cls.return_value.read.side_effect = OSError("device unplugged")
+            t = kcf.PySerialTransport("/dev/ttyUSB0", rx_thread=True)
+            t.open()
+            try:
+                t._reader.join(2.0)
+                with pytest.raises(kcf.TransportError):
+                    t.read(2, timeout_ms=50)
+            finally:
+                t.close()
+
+    def test_open_survives_unsupported_low_latency(self):
+        with patch.object(kcf.serial, "Serial") as ser_cls:
+            ser_cls.return_value.set_low_latency_mode.side_effect = OSError("not a tty")
+            t = kcf.PySerialTransport("/dev/ttyUSB0")
+            t.open()
+        assert t._serial is ser_cls.return_value
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 7 — ECU COMM
 # ═══════════════════════════════════════════════════════════════════════
@@ -558,11 +800,34 @@ class TestECUComm:
         comm.disconnect()
         assert comm.state == kcf.CommState.DISCONNECTED
 
+    def test_rx_frame_checks_checksum(self, comm, loopback_transport):
+        good = bytes(kcf.ALDLProtocol.build_write_frame(0xF7, 0x1234, b"\x01\x02"))
+        loopback_transport.flush_input()  # drop the pre-seeded heartbeat byte
+        loopback_transport._rx_buffer.extend(good)
+        frame = comm._rx_frame(timeout_ms=50)
+        assert frame is not None and frame[:len(good)] == good
+        loopback_transport._rx_buffer.extend(good[:-1] + bytes([good[-1] ^ 1]))
+        assert comm._rx_frame(timeout_ms=50) is None
+
     def test_config_defaults(self, comm):
         assert comm.config.device_id == kcf.DeviceID.VX_VY_F7
         assert comm.config.baud == kcf.DEFAULT_BAUD
         assert comm.config.max_retries == kcf.DEFAULT_MAX_RETRIES
 
+    def test_adaptive_delay_decays_and_backs_off(self, comm):
+        comm.config.inter_frame_delay_ms = 10
+        comm._frame_delay_ms = 10.0
+        for _ in range(200):
+            comm._adapt_delay(True)
+        assert comm._frame_delay_ms == kcf.ADAPTIVE_DELAY_MIN_MS
+        comm._adapt_delay(False)
+        assert comm._frame_delay_ms == 10  # a failure restores at least the configured delay
+        comm._adapt_delay(False)
+        assert comm._frame_delay_ms == 20
+        for _ in range(10):
+            comm._adapt_delay(False)
+        assert comm._frame_delay_ms == kcf.ADAPTIVE_DELAY_MAX_MS
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 8 — BIN FILE UTILITIES
@@ -608,12 +873,30 @@ class TestBinFile:
         assert reloaded[0x2000] == 0x42
         assert len(reloaded) == 131072
 
+    def test_digest_matches_hashlib(self, tmp_bin_path):
+        import hashlib
+        expected = hashlib.sha256(tmp_bin_path.read_bytes()).hexdigest()
+        assert kcf.BinFile.digest(str(tmp_bin_path)) == expected
+        assert kcf.BinFile.digest(str(tmp_bin_path)) == expected  # memoized
+
     def test_compute_checksum_all_ff(self, full_bin):
         """All 0xFF bytes → checksum should be deterministic."""
         cs = kcf.BinFile.compute_checksum(full_bin)
         assert isinstance(cs, int)
         assert 0 <= cs <= 0xFFFF
 
+    def test_compute_checksum_matches_reference_sum(self, full_bin):
+        """Slice-sum checksum must equal the byte-by-byte definition."""
+        for i in range(0, 131072, 97):
+            full_bin[i] = i & 0xFF
+        expected = 0
+        for addr in range(0x2000, 0x20000):
+            if kcf.CHECKSUM_SKIP_START <= addr <= kcf.CHECKSUM_SKIP_END:
+                continue
+            expected = (expected + full_bin[addr]) & 0xFFFF
+        assert kcf.BinFile.compute_checksum(full_bin) == expected
+        assert kcf.compute_bin_checksum(bytes(full_bin)) == expected
+
     def test_fix_checksum_writes_correct_value(self, full_bin):
         old_cs, new_cs = kcf.BinFile.fix_checksum(full_bin)
         stored = (full_bin[kcf.CHECKSUM_OFFSET_HI] << 8) | full_bin[kcf.CHECKSUM_OFFSET_LO]
@@ -630,6 +913,16 @@ class TestBinFile:
         # Don't fix — verify should fail
         assert not kcf.BinFile.verify_checksum(full_bin)
 
+    def test_first_mismatch(self, full_bin):
+        other = bytearray(full_bin)
+        assert kcf.first_mismatch(full_bin, other, 0x2000, 0x1C000) is None
+        other[0x1234] = 0x00  # outside the compared range
+        assert kcf.first_mismatch(full_bin, other, 0x2000, 0x1C000) is None
+        other[0x9ABC] = 0x00
+        other[0x9ABD] = 0x00
+        assert kcf.first_mismatch(full_bin, other, 0x2000, 0x1C000) == 0x9ABC
+        assert kcf.first_mismatch(full_bin, other[:0x8000], 0x2000, 0x1C000) == 0x8000
+
     def test_get_os_id(self, full_bin_with_os):
         os_id = kcf.BinFile.get_os_id(full_bin_with_os)
         assert os_id == "$060A"
@@ -673,6 +966,14 @@ class TestBinFile:
             for c in range(t.cols):
                 assert readback[r][c] == 42
 
+    def test_cells_view_is_zero_copy(self, full_bin):
+        t = kcf.CAL_TABLES["spark_hi_oct"]
+        view = t.cells_view(full_bin)
+        assert view.shape == (t.rows, t.cols)
+        full_bin[t.rom_offset + t.cols + 2] = 0x5A
+        assert view[1, 2] == 0x5A
+        view.release()
+
     def test_write_table_2byte_element(self, full_bin):
         """Test that 2-byte element tables work if any exist, or else force one."""
         t = kcf.CalibrationTable(
@@ -719,6 +1020,51 @@ class TestDataLogger:
         content = Path(csv_path).read_text()
         assert len(content) > 0
 
+    def test_csv_rows_flushed_on_stop(self, comm, tmp_path):
+        comm.connect()
+        csv_path = tmp_path / "batched.csv"
+        logger = kcf.DataLogger(comm)
+        logger.start(csv_path=str(csv_path), params=["RPM", "Battery V"])
+        time.sleep(0.3)
+        logger.stop()
+        lines = csv_path.read_text().splitlines()
+        assert lines[0] == "Timestamp,Elapsed_s,RPM,Battery V"
+        assert len(lines) == logger._sample_count + 1
+        assert lines[1].split(",")[2:] == ["800.0", "14.0"]
+        secs, _, ms = lines[1].split(",")[1].partition(".")
+        assert secs.isdigit() and len(ms) == 3 and ms.isdigit()
+
+    def test_csv_rows_reach_disk_while_running(self, comm, tmp_path):
+        comm.connect()
+        csv_path = tmp_path / "live.csv"
+        logger = kcf.DataLogger(comm)
+        logger.CSV_FLUSH_NS = 0  # flush with every row instead of once a second
+        logger.start(csv_path=str(csv_path), params=["RPM"])
+        try:
+            deadline = time.monotonic() + 5
+            while len(csv_path.read_text().splitlines()) < 3 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert len(csv_path.read_text().splitlines()) >= 3  # header + rows, before stop()
+        finally:
+            logger.stop()
+
+    def test_csv_unknown_param_left_blank(self, comm, tmp_path):
+        comm.connect()
+        csv_path = tmp_path / "blank.csv"
+        logger = kcf.DataLogger(comm)
+        logger.start(csv_path=str(csv_path), params=["No Such Param"])
+        time.sleep(0.2)
+        logger.stop()
+        lines = csv_path.read_text().splitlines()
+        assert lines[1].split(",")[2:] == [""]
+
+    def test_timestamp_format(self, comm):
+        logger = kcf.DataLogger(comm)
+        ts = logger._timestamp()
+        time.strptime(ts, "%H:%M:%S.%f")
+        assert len(ts) == 12
+        assert ts.startswith(logger._ts_sec_str)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 11 — LIVE TUNER
@@ -762,6 +1108,13 @@ class TestLiveTuner:
         tuner.set_cell(0, 0, 133)
         assert tuner.get_cell(0, 0) == 133
 
+    def test_set_cells_batch(self, tuner):
+        rejected = tuner.set_cells([(0, 0, 130), (0, 1, 200), (999, 0, 128), (1, 0, 126)])
+        assert rejected == [(0, 1), (999, 0)]
+        assert tuner.get_cell(0, 0) == 130
+        assert tuner.get_cell(0, 1) == 128
+        assert tuner.dirty_cells == {0, tuner.table.cols}
+
     def test_get_cell_out_of_bounds(self, tuner):
         val = tuner.get_cell(999, 999)
         assert val == 0
@@ -773,6 +1126,31 @@ class TestLiveTuner:
         assert tuner.get_cell(0, 0) == 128
         assert tuner.safety_reverted
 
+    def test_revert_resends_only_written_cells(self, tuner, monkeypatch):
+        frames = []
+        monkeypatch.setattr(tuner.comm, "_transact",
+                            lambda frame, **kw: frames.append(bytes(frame)) or b"ok")
+        tuner.set_cell(0, 5, 131)
+        assert tuner.send_updates()
+        tuner.set_cell(0, 40, 128)     # pending edit equal to ROM
+        sent = []
+        monkeypatch.setattr(tuner, "send_updates", lambda: sent.append(set(tuner.dirty_cells)) or True)
+        tuner.revert_to_rom()
+        assert sent == [{5, 40}]
+        assert tuner.shadow == tuner.rom_values
+        assert not tuner._ecu_touched
+
+    def test_knock_revert_after_reload_resends_written_cells(self, tuner, full_bin, monkeypatch):
+        monkeypatch.setattr(tuner.comm, "_transact", lambda frame, **kw: b"ok")
+        tuner.set_cell(0, 5, 131)
+        assert tuner.send_updates()    # ECU RAM now holds 131
+        tuner.load_from_bin(full_bin)  # shadow reads as ROM again
+        sent = []
+        monkeypatch.setattr(tuner, "send_updates", lambda: sent.append(set(tuner.dirty_cells)) or True)
+        for _ in range(3):
+            tuner.check_safety({"Knock Retard": 8.0})
+        assert sent == [{5}]
+
     def test_check_safety_normal(self, tuner):
         data = {"Knock Retard": 0.0, "ECT Temp": 80.0, "RPM": 3000.0}
         assert tuner.check_safety(data) is True
@@ -785,6 +1163,11 @@ class TestLiveTuner:
         # After 3+ consecutive >5° knock, should return False
         assert result is False or tuner.safety_reverted
 
+    def test_check_safety_knock_streak_resets(self, tuner):
+        for knock in (6.0, 6.0, 1.0, 6.0, 6.0):
+            assert tuner.check_safety({"Knock Retard": knock, "ECT Temp": 80.0, "RPM": 3000.0})
+        assert not tuner.safety_reverted
+
     def test_check_safety_high_temp(self, tuner):
         data = {"Knock Retard": 0.0, "ECT Temp": 115.0, "RPM": 3000.0}
         assert tuner.check_safety(data) is False
@@ -806,6 +1189,28 @@ class TestLiveTuner:
         runs = tuner._find_runs([])
         assert runs == []
 
+    def test_send_updates_frames_dirty_runs(self, tuner, monkeypatch):
+        frames = []
+        monkeypatch.setattr(tuner.comm, "_transact",
+                            lambda frame, **kw: frames.append(bytes(frame)) or b"ok")
+        tuner.set_cell(0, 0, 130)
+        tuner.set_cell(0, 1, 131)
+        assert tuner.send_updates()
+        assert len(frames) == 1
+        assert frames[0][5:7] == bytes([130, 131])
+        assert kcf.ALDLProtocol.verify_checksum(frames[0])
+        assert not tuner.dirty_cells
+
+    def test_find_runs_bridges_small_gaps(self, tuner):
+        tuner.shadow[10:16] = bytes([1, 2, 3, 4, 5, 6])
+        runs = tuner._find_runs([10, 11, 15])
+        assert runs == [(10, bytes([1, 2, 3, 4, 5, 6]))]
+
+    def test_find_runs_caps_run_length(self, tuner):
+        runs = tuner._find_runs(list(range(120)))
+        assert [start for start, _ in runs] == [0, 50, 100]
+        assert [len(data) for _, data in runs] == [50, 50, 20]
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # SECTION 13 — CLI HELPERS
@@ -814,6 +1219,15 @@ class TestLiveTuner:
 class TestCLIHelpers:
     """Tests for CLI callbacks and parser."""
 
+    def test_settings_round_trip(self, tmp_path):
+        path = tmp_path / "settings.json"
+        comm, log_cfg = kcf.CommConfig(), kcf.LogConfig()
+        comm.max_retries = 7
+        kcf.SettingsManager.save(comm, log_cfg, path)
+        loaded, _ = kcf.SettingsManager.load(path)
+        assert loaded.max_retries == 7
+        assert kcf.json_loads(path.read_bytes())["comm"]["max_retries"] == 7
+
     def test_cli_log_callback(self, capsys):
         kcf.cli_log_callback("hello", "info")
         out = capsys.readouterr().out
@@ -829,6 +1243,13 @@ class TestCLIHelpers:
         out = capsys.readouterr().out
         assert "50%" in out
 
+    def test_cli_progress_redraws_per_percent(self, capsys):
+        for i in range(1, 4097):
+            kcf.cli_progress_callback(i, 4096, "Reading")
+        out = capsys.readouterr().out
+        assert out.count("\r") == 101  # 0%..100%, not one per tick
+        assert out.endswith("100%\n")
+
     def test_build_parser(self):
         parser = kcf.build_parser()
         assert parser is not None
@@ -890,6 +1311,13 @@ class TestFlashOpIntegration:
         op = kcf.FlashOp(comm)
         assert op is not None
 
+    def test_gc_paused_restores_gc(self):
+        import gc
+        assert gc.isenabled()
+        with kcf.gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
     def test_checksum_cli_offline(self, full_bin_with_os, tmp_path):
         """Test the checksum verification pathway end-to-end with a file."""
         p = tmp_path / "cs_test.bin"
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test the Virtual ECU transport with real bin files."""
 import sys, os
+import operator
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from pathlib import Path
 
@@ -102,10 +103,9 @@ if Path(stock_path).exists():
     print(f"  ENHANCED Rev Limit: {rev_hi*25}/{rev_lo*25} RPM")
     
     # Count differing bytes in calibration area ($4000-$7FFF)
-    diffs = 0
-    for i in range(0x4000, 0x8000):
-        if transport._simulated_bin[i] != stock_transport._simulated_bin[i]:
-            diffs += 1
+    # map(operator.ne) walks both slices in C — no per-index Python loop
+    diffs = sum(map(operator.ne, transport._simulated_bin[0x4000:0x8000],
+                    stock_transport._simulated_bin[0x4000:0x8000]))
     print(f"  Calibration area ($4000-$7FFF) differences: {diffs} bytes")
     print("  PASS")
 else:
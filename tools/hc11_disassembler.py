@@ -574,6 +574,36 @@ VY_CODE_LABELS: Dict[int, str] = {
 
 PREBYTES = frozenset((0x18, 0x1A, 0xCD))
 
+# Opcode tables are immutable — build them once per process rather than
+# per HC11Disassembler() (the convenience functions construct one per call).
+_OPCODE_TABLES: Optional[Tuple[Dict[int, Instruction], ...]] = None
+_LENGTH_TABLES: Dict[int, bytes] = {}
+
+# Separators stripped from hex input in one str.translate() pass.
+_HEX_SEPARATORS = str.maketrans("", "", ",; \t\n\r\v\f")
+
+
+def _length_table(table: Dict[int, Instruction]) -> bytes:
+    """256-entry opcode → length lookup (0 = unknown opcode or bare prefix)."""
+    lengths = bytearray(256)
+    for opcode, inst in table.items():
+        if inst.mode != MODE_PREFIX:
+            lengths[opcode] = inst.length
+    return bytes(lengths)
+
+
+def _opcode_tables() -> Tuple[Dict[int, Instruction], ...]:
+    """Return (base, page2, page3, page4), building the shared copies on first use."""
+    global _OPCODE_TABLES
+    if _OPCODE_TABLES is None:
+        tables = (_base_opcodes(), _page2_opcodes(), _page3_opcodes(), _page4_opcodes())
+        _LENGTH_TABLES[0x00] = _length_table(tables[0])
+        _LENGTH_TABLES[0x18] = _length_table(tables[1])
+        _LENGTH_TABLES[0x1A] = _length_table(tables[2])
+        _LENGTH_TABLES[0xCD] = _length_table(tables[3])
+        _OPCODE_TABLES = tables
+    return _OPCODE_TABLES
+
 
 class HC11Disassembler:
     """
@@ -588,10 +618,7 @@ class HC11Disassembler:
 
     def __init__(self, annotate_vy: bool = True):
         self.annotate_vy = annotate_vy
-        self._base   = _base_opcodes()
-        self._page2  = _page2_opcodes()
-        self._page3  = _page3_opcodes()
-        self._page4  = _page4_opcodes()
+        self._base, self._page2, self._page3, self._page4 = _opcode_tables()
 
     # ── public API ──
 
@@ -599,19 +626,39 @@ class HC11Disassembler:
                     max_instructions: int = 0) -> List[DisassembledInstruction]:
         """Disassemble a block of bytes. Returns list of DisassembledInstruction."""
         data = bytes(data)
-        results: List[DisassembledInstruction] = []
+        return [self.decode_one(data, offset, base_addr + offset)
+                for offset, _ in self.scan(data, max_instructions)]
+
+    def scan(self, data: bytes, max_instructions: int = 0) -> List[Tuple[int, int]]:
+        """
+        Fast first pass: return (offset, length) for each instruction boundary.
+
+        Only the 256-entry length tables are consulted — no operand formatting,
+        annotation or dataclass construction. disassemble() then formats each
+        boundary with decode_one(). Boundaries match disassemble() exactly,
+        including DB fallbacks.
+        """
+        base_len = _LENGTH_TABLES[0x00]
+        size = len(data)
+        bounds: List[Tuple[int, int]] = []
         offset = 0
-        count = 0
-        while offset < len(data):
-            inst = self.decode_one(data, offset, base_addr + offset)
-            if inst is None:
-                break
-            results.append(inst)
-            offset += inst.length
-            count += 1
-            if max_instructions and count >= max_instructions:
+        while offset < size:
+            opcode = data[offset]
+            if opcode in PREBYTES:
+                if offset + 1 >= size:
+                    length = 1
+                else:
+                    n = _LENGTH_TABLES[opcode][data[offset + 1]]
+                    length = n + 1 if n else 2
+            else:
+                length = base_len[opcode] or 1
+            if offset + length > size:
+                length = size - offset
+            bounds.append((offset, length))
+            offset += length
+            if max_instructions and len(bounds) >= max_instructions:
                 break
-        return results
+        return bounds
 
     def disassemble_hex(self, hex_string: str, base_addr: int = 0,
                         max_instructions: int = 0) -> List[DisassembledInstruction]:
@@ -836,18 +883,9 @@ class HC11Disassembler:
     @staticmethod
     def _parse_hex(hex_string: str) -> bytes:
         """Parse flexible hex input: 'B6 77DE', 'B6,77,DE', '0xB6 0x77 0xDE', etc."""
-        s = hex_string.strip()
-        # Remove common prefixes/separators
-        s = s.replace("0x", "").replace("0X", "")
-        s = s.replace(",", " ").replace(";", " ").replace("\n", " ").replace("\t", " ")
-        # If no spaces → treat as continuous hex
-        tokens = s.split()
-        if not tokens:
-            return b""
-        if len(tokens) == 1 and len(tokens[0]) > 2:
-            # Continuous hex like "B677DE39"
-            return bytes.fromhex(tokens[0])
-        return bytes.fromhex("".join(tokens))
+        # Drop 0x prefixes and every separator, then let fromhex (C) do the rest
+        s = hex_string.replace("0x", "").replace("0X", "")
+        return bytes.fromhex(s.translate(_HEX_SEPARATORS))
 
 
 # ═══════════════════════════════════════════════════════════════════════